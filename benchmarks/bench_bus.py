@@ -0,0 +1,57 @@
+"""Benchmark event dispatch of `Bus` against zigpy's `ListenableMixin`.
+
+Run with ``python benchmarks/bench_bus.py``.
+"""
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from zigpy.util import ListenableMixin  # noqa: E402
+
+from zhaquirks import Bus  # noqa: E402
+
+ROUNDS = 200000
+
+
+class Cluster:
+    """Listener standing in for a local data cluster."""
+
+    def temperature_reported(self, value):
+        """Handle a temperature report."""
+
+    def battery_reported(self, value):
+        """Handle a battery report."""
+
+
+class OtherCluster:
+    """Listener without the handlers, such as a cluster on another bus."""
+
+
+class MixinBus(ListenableMixin):
+    """The previous bus implementation."""
+
+
+def main():
+    """Print the time taken per dispatched event."""
+    for listeners in ((Cluster(),), (Cluster(), OtherCluster(), Cluster())):
+        for bus_class in (MixinBus, Bus):
+            bus = bus_class()
+            for listener in listeners:
+                bus.add_listener(listener)
+            elapsed = min(
+                timeit.repeat(
+                    lambda: bus.listener_event("temperature_reported", 2150),
+                    number=ROUNDS,
+                    repeat=5,
+                )
+            )
+            print(
+                f"{bus_class.__name__:<8} {len(listeners)} listeners:"
+                f" {elapsed / ROUNDS * 1e9:.0f}ns per event"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""Benchmark quirk hot paths by replaying captured frames through real devices.
+
+Run with ``python benchmarks/bench_frame_replay.py``.
+
+Each scenario builds a quirked device from its signature and replays ZCL
+frames, as captured from such a device, through `Device.handle_message`:
+deserializing, the quirk's clusters and the attribute updates and events
+they produce. Frames per second and the bytes allocated per frame, the peak
+traced by `tracemalloc`, are compared to ``baselines/frame_replay.json``.
+The command exits with status 1 when a scenario is more than ``--tolerance``
+worse than its baseline. Frames per second are the best of a few repeats
+but still depend on the machine and its load, refresh the baselines with
+``--update`` before comparing changes; bytes per frame are deterministic.
+"""
+import argparse
+import asyncio
+import json
+import pathlib
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import zhaquirks  # noqa: E402
+from zhaquirks.const import MODELS_INFO  # noqa: E402
+import zhaquirks.philips.rwl022  # noqa: E402
+from zhaquirks.replay import ReplayApplication, build_device  # noqa: E402
+import zhaquirks.tuya.ts0601_sensor  # noqa: E402
+import zhaquirks.tuya.ts0601_trv  # noqa: E402
+import zhaquirks.xbee.xbee3_io  # noqa: E402
+import zhaquirks.xiaomi.aqara.vibration_aq1  # noqa: E402
+
+BASELINES = pathlib.Path(__file__).resolve().parent / "baselines" / "frame_replay.json"
+ROUNDS = 50
+REPEAT = 5
+ALLOCATION_ROUNDS = 5
+
+
+def xiaomi_heartbeats():
+    """Return 0xFF01 heartbeats of an Aqara vibration sensor, battery draining."""
+    frames = []
+    for tsn, voltage in enumerate(range(3100, 3000, -5)):
+        frames.append(
+            bytes([0x1C, 0x5F, 0x11, tsn, 0x0A])
+            + b'\x01\xffB"\x01!'
+            + voltage.to_bytes(2, "little")
+            + b"\x03(\r\x04!\xa8\x13\x05!\xcb\x00\x06$\x01\x00\x00\x00\x00"
+            + b"\x08!\x04\x02\n!\x00\x00d\x10\x00"
+        )
+    return frames
+
+
+def tuya_multi_dp():
+    """Return temperature, humidity and battery reports of a TS0601 sensor."""
+    frames = []
+    for tsn in range(20):
+        frames.append(
+            bytes([0x09, tsn, 0x02, 0x0B, 0x33])
+            + b"\x01\x02\x00\x04\x00\x00\x00"
+            + bytes([0xF0 + tsn % 8])
+            + b"\x02\x02\x00\x04\x00\x00\x00"
+            + bytes([0x40 + tsn % 5])
+            + b"\x04\x02\x00\x04\x00\x00\x00\x64"
+        )
+    return frames
+
+
+def tuya_legacy():
+    """Return reports of a Moes TRV: temperature, target, valve and schedule."""
+    frames = []
+    for tsn in range(20):
+        frames += [
+            bytes([0x09, tsn, 0x02, 0x00, 0x02])
+            + b"\x03\x02\x00\x04\x00\x00\x00"
+            + bytes([0xB0 + tsn % 4]),
+            bytes([0x09, tsn, 0x02, 0x00, 0x02]) + b"\x02\x02\x00\x04\x00\x00\x00\x32",
+            bytes([0x09, tsn, 0x02, 0x00, 0x02])
+            + b"\x6D\x02\x00\x04\x00\x00\x00"
+            + bytes([tsn * 5]),
+        ]
+    frames.append(
+        b"\x09\x70\x02\x00\x02\x70\x00\x00\x12\x06\x00\x14\x08\x00\x0F\x0B\x1E"
+        b"\x0F\x0C\x1E\x0F\x11\x1E\x14\x16\x00\x0F"
+    )
+    return frames
+
+
+def xbee_io_samples():
+    """Return IO samples of an XBee3: a toggling input and two analog inputs."""
+    frames = []
+    for sample in range(20):
+        frames.append(
+            b"\x01\x00\x03\x03\x00"
+            + bytes([2 | sample // 5 % 2])
+            + (0x155 + sample % 2).to_bytes(2, "big")
+            + b"\x02\xaa"
+        )
+    return frames
+
+
+def philips_notifications():
+    """Return button notifications of a Hue dimmer: presses, holds, releases."""
+    frames = []
+    tsn = 0
+    for button in (1, 2, 3, 4):
+        for press_type, duration in ((0, 0), (2, 1), (0, 0), (1, 8), (3, 16)):
+            frames.append(
+                bytes([0x1D, 0x0B, 0x10, tsn, 0x00, button, 0x00, 0x00, 0x30])
+                + bytes([press_type, 0x21])
+                + duration.to_bytes(2, "little")
+            )
+            tsn += 1
+    return frames
+
+
+# name: (quirk, endpoint, profile, cluster, frames)
+SCENARIOS = {
+    "xiaomi_heartbeat": (
+        zhaquirks.xiaomi.aqara.vibration_aq1.VibrationAQ1,
+        1,
+        0x0104,
+        0x0000,
+        xiaomi_heartbeats,
+    ),
+    "tuya_multi_dp": (
+        zhaquirks.tuya.ts0601_sensor.TuyaTempHumiditySensor,
+        1,
+        0x0104,
+        0xEF00,
+        tuya_multi_dp,
+    ),
+    "tuya_legacy": (
+        zhaquirks.tuya.ts0601_trv.MoesHY368_Type1,
+        1,
+        0x0104,
+        0xEF00,
+        tuya_legacy,
+    ),
+    "xbee_io_sample": (
+        zhaquirks.xbee.xbee3_io.XBee3Sensor,
+        0xE8,
+        0xC105,
+        0x0092,
+        xbee_io_samples,
+    ),
+    "philips_remote": (
+        zhaquirks.philips.rwl022.PhilipsRWL022,
+        1,
+        0x0104,
+        0xFC00,
+        philips_notifications,
+    ),
+}
+
+
+def make_device(quirk):
+    """Build the quirked device from the signature of quirk."""
+    manufacturer, model = quirk.signature.get(MODELS_INFO, [(None, None)])[0]
+    return build_device(
+        ReplayApplication(),
+        {
+            "ieee": "00:0d:6f:00:0a:90:69:e7",
+            "nwk": 0x1234,
+            "manufacturer": manufacturer,
+            "model": model,
+            "quirk": f"{quirk.__module__}:{quirk.__qualname__}",
+            "endpoints": {},
+        },
+    )
+
+
+async def settle():
+    """Wait for the tasks started while replaying, such as default responses."""
+    await asyncio.gather(*asyncio.all_tasks() - {asyncio.current_task()})
+
+
+async def replay(name):
+    """Return frames per second and allocated bytes per frame of a scenario."""
+    quirk, endpoint_id, profile, cluster_id, make_frames = SCENARIOS[name]
+    frames = make_frames()
+    device = make_device(quirk)
+
+    def run(rounds):
+        for _ in range(rounds):
+            for frame in frames:
+                device.handle_message(
+                    profile, cluster_id, endpoint_id, endpoint_id, frame
+                )
+
+    # warm up caches
+    run(1)
+    await settle()
+
+    elapsed = None
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        run(ROUNDS)
+        best = time.perf_counter() - start
+        elapsed = best if elapsed is None else min(elapsed, best)
+        await settle()
+
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(ALLOCATION_ROUNDS):
+            for frame in frames:
+                tracemalloc.reset_peak()
+                current, _ = tracemalloc.get_traced_memory()
+                device.handle_message(
+                    profile, cluster_id, endpoint_id, endpoint_id, frame
+                )
+                _, peak = tracemalloc.get_traced_memory()
+                peaks.append(peak - current)
+            await settle()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "frames_per_s": round(ROUNDS * len(frames) / elapsed),
+        "bytes_per_frame": round(sum(peaks) / len(peaks)),
+    }
+
+
+def regressions(results, baselines, tolerance):
+    """Return the scenarios worse than their baseline by more than tolerance."""
+    worse = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        if result["frames_per_s"] < baseline["frames_per_s"] * (1 - tolerance):
+            worse.append(f"{name}: frames_per_s")
+        if result["bytes_per_frame"] > baseline["bytes_per_frame"] * (1 + tolerance):
+            worse.append(f"{name}: bytes_per_frame")
+    return worse
+
+
+async def main(args):
+    """Run the scenarios and compare them to the baselines."""
+    zhaquirks.setup()
+    baselines = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+
+    results = {}
+    print(f"{'scenario':<18} {'frames/s':>10} {'baseline':>10} {'B/frame':>8}")
+    for name in args.scenarios or SCENARIOS:
+        if name not in SCENARIOS:
+            print(f"unknown scenario: {name}")
+            return 2
+        results[name] = result = await replay(name)
+        baseline = baselines.get(name, {})
+        print(
+            f"{name:<18} {result['frames_per_s']:>10,}"
+            f" {baseline.get('frames_per_s', 0):>10,}"
+            f" {result['bytes_per_frame']:>8,}"
+        )
+
+    if args.update:
+        baselines.update(results)
+        BASELINES.parent.mkdir(exist_ok=True)
+        BASELINES.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"baselines written to {BASELINES}")
+        return 0
+
+    worse = regressions(results, baselines, args.tolerance)
+    for regression in worse:
+        print(f"regression: {regression}")
+    return 1 if worse else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=", ".join(SCENARIOS))
+    parser.add_argument("--update", action="store_true", help="store as baselines")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    sys.exit(asyncio.run(main(parser.parse_args())))
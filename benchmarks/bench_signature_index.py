@@ -0,0 +1,106 @@
+"""Benchmark quirk matching of zigpy's registry against `SignatureIndex`.
+
+Run with ``python benchmarks/bench_signature_index.py``. `zhaquirks.setup`
+installs the index, zigpy's own matching is called through the class.
+"""
+import asyncio
+import pathlib
+import sys
+import timeit
+from unittest import mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import zigpy.device  # noqa: E402
+import zigpy.quirks as zq  # noqa: E402
+import zigpy.types as t  # noqa: E402
+
+import zhaquirks  # noqa: E402
+from zhaquirks.const import (  # noqa: E402
+    DEVICE_TYPE,
+    ENDPOINTS,
+    INPUT_CLUSTERS,
+    MODELS_INFO,
+    OUTPUT_CLUSTERS,
+    PROFILE_ID,
+)
+from zhaquirks.signature_index import SignatureIndex  # noqa: E402
+
+ROUNDS = 20
+
+
+def raw_devices():
+    """Build one unquirked device per model of every registered quirk."""
+    devices = []
+    app = mock.MagicMock(_dblistener=None)
+    quirks = {
+        quirk
+        for models in zq._DEVICE_REGISTRY.registry.values()
+        for quirks in models.values()
+        for quirk in quirks
+    }
+    for quirk in sorted(quirks, key=lambda quirk: quirk.__qualname__):
+        for manufacturer, model in quirk.signature.get(MODELS_INFO, [(None, None)]):
+            device = zigpy.device.Device(app, t.EUI64.convert("0" * 16), 0x1234)
+            device.manufacturer = manufacturer
+            device.model = model
+            for ep_id, ep_data in quirk.signature.get(ENDPOINTS, {}).items():
+                endpoint = device.add_endpoint(ep_id)
+                endpoint.profile_id = ep_data.get(PROFILE_ID, 0x0104)
+                endpoint.device_type = ep_data.get(DEVICE_TYPE, 0xFFFF)
+                for cluster_id in ep_data.get(INPUT_CLUSTERS, []):
+                    endpoint.add_input_cluster(cluster_id)
+                for cluster_id in ep_data.get(OUTPUT_CLUSTERS, []):
+                    endpoint.add_output_cluster(cluster_id)
+            devices.append(device)
+    return devices
+
+
+def registry_get_device(registry, device):
+    """Match the device with zigpy's registry, bypassing the installed index."""
+    return zq.DeviceRegistry.get_device(registry, device)
+
+
+def registry_match(registry, device):
+    """Return the quirk class zigpy's registry matches."""
+    with_quirk = registry_get_device(registry, device)
+    return None if with_quirk is device else type(with_quirk)
+
+
+async def main():
+    """Run the benchmark."""
+    zhaquirks.setup()
+    devices = raw_devices()
+    registry = zq._DEVICE_REGISTRY
+    index = registry.get_device.__self__
+
+    build = timeit.timeit(lambda: SignatureIndex(registry).build(), number=ROUNDS)
+
+    mismatches = [
+        device
+        for device in devices
+        if index.get_quirk(device) is not registry_match(registry, device)
+    ]
+
+    # both sides instantiate the matched quirk, as zigpy does
+    zigpy_time = timeit.timeit(
+        lambda: [registry_get_device(registry, device) for device in devices],
+        number=ROUNDS,
+    )
+    index_time = timeit.timeit(
+        lambda: [zq.get_device(device) for device in devices], number=ROUNDS
+    )
+    lookup_time = timeit.timeit(
+        lambda: [index.get_quirk(device) for device in devices], number=ROUNDS
+    )
+
+    total = len(devices) * ROUNDS
+    print(f"devices: {len(devices)}, mismatches: {len(mismatches)}")
+    print(f"index build: {build / ROUNDS * 1e3:.2f} ms")
+    print(f"zigpy registry: {total / zigpy_time:,.0f} matches/s")
+    print(f"zigpy get_device, signature index: {total / index_time:,.0f} matches/s")
+    print(f"signature index, lookup only: {total / lookup_time:,.0f} matches/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,95 @@
+"""Benchmark motion sensor reset timers: per sensor loop timers vs `TimerWheel`.
+
+Run with ``python benchmarks/bench_timer_wheel.py``.
+
+Simulates 1,000 motion sensors over ten minutes. Occupied rooms retrigger
+their sensor every few seconds, the others report now and then. Each event
+re-arms a reset of 30 to 120 seconds, like `MotionWithReset` and
+`OccupancyOnEvent` do. Only the re-arming cost is timed, resets never expire.
+"""
+import asyncio
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from zhaquirks.timer_wheel import TimerWheel  # noqa: E402
+
+SENSORS = 1000
+DURATION = 600
+OCCUPIED = 0.2
+BATCH = 100
+
+
+def motion_events():
+    """Return (sensor, reset_s) pairs ordered by event time."""
+    rng = random.Random(0)
+    events = []
+    for sensor in range(SENSORS):
+        reset_s = rng.choice((30, 60, 90, 120))
+        interval = 4 if rng.random() < OCCUPIED else 90
+        when = rng.uniform(0, interval)
+        while when < DURATION:
+            events.append((when, sensor, reset_s))
+            when += rng.expovariate(1 / interval)
+    events.sort()
+    return [(sensor, reset_s) for _, sensor, reset_s in events]
+
+
+def turn_off():
+    """Reset a sensor."""
+
+
+async def loop_timers(events):
+    """Cancel and recreate a loop timer per event, as the clusters used to."""
+    loop = asyncio.get_running_loop()
+    handles = {}
+    peak = 0
+    for pos, (sensor, reset_s) in enumerate(events):
+        handle = handles.get(sensor)
+        if handle:
+            handle.cancel()
+        handles[sensor] = loop.call_later(reset_s, turn_off)
+        if not pos % BATCH:
+            peak = max(peak, len(loop._scheduled))  # pylint: disable=W0212
+            await asyncio.sleep(0)
+    for handle in handles.values():
+        handle.cancel()
+    return peak
+
+
+async def timer_wheel(events):
+    """Re-arm resets in a shared `TimerWheel`."""
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(loop)
+    peak = 0
+    for pos, (sensor, reset_s) in enumerate(events):
+        wheel.schedule(sensor, reset_s, turn_off)
+        if not pos % BATCH:
+            peak = max(peak, len(loop._scheduled))  # pylint: disable=W0212
+            await asyncio.sleep(0)
+    for sensor in range(SENSORS):
+        wheel.cancel(sensor)
+    return peak
+
+
+def main():
+    """Print the time taken to process all events."""
+    events = motion_events()
+    print(f"{len(events)} motion events from {SENSORS} sensors")
+
+    for name, strategy in (("loop timers", loop_timers), ("timer wheel", timer_wheel)):
+        start = time.perf_counter()
+        peak = asyncio.run(strategy(events))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name}: {elapsed * 1000:.1f}ms"
+            f" ({elapsed / len(events) * 1e6:.2f}us per event),"
+            f" up to {peak} loop timers"
+        )
+
+
+if __name__ == "__main__":
+    main()
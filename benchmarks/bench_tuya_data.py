@@ -0,0 +1,93 @@
+"""Benchmark decoding and encoding of `TuyaData` payloads.
+
+Run with ``python benchmarks/bench_tuya_data.py``.
+
+The frames are ``set_data_response`` payloads as reported by TS0601 devices:
+thermostats, power meters, covers and switches. The generic zigpy type based
+decoder previously used by `TuyaData.payload` is kept here as a reference.
+"""
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import zigpy.types as t  # noqa: E402
+
+from zhaquirks.tuya import TuyaCommand, TuyaDPType  # noqa: E402
+
+ROUNDS = 20000
+
+# status, tsn, dp, dp type, function, length, data
+FRAMES = {
+    # TRV: local temperature 21.5°C
+    "value": bytes.fromhex("00 15 03 02 00 04 000000d7"),
+    # TRV: window detection on
+    "bool": bytes.fromhex("00 16 08 01 00 01 01"),
+    # TRV: system mode heat
+    "enum": bytes.fromhex("00 17 02 04 00 01 01"),
+    # DIN rail meter: fault bitmap
+    "bitmap": bytes.fromhex("00 18 09 05 00 01 00"),
+    # Power meter: phase A voltage, current and power record
+    "raw": bytes.fromhex("00 19 06 00 00 08 08f0000064000027"),
+    # Moes TRV: schedule label
+    "string": bytes.fromhex("00 1a 70 03 00 06 776f726b6461"),
+}
+
+
+def legacy_payload(data):
+    """Decode a `TuyaData` payload the way zigpy types do."""
+    if data.dp_type == TuyaDPType.VALUE:
+        return t.int32s_be.deserialize(data.raw)[0]
+    elif data.dp_type == TuyaDPType.BOOL:
+        return t.Bool.deserialize(data.raw)[0]
+    elif data.dp_type == TuyaDPType.STRING:
+        return t.CharacterString(data.raw.decode("utf8"))
+    elif data.dp_type == TuyaDPType.ENUM:
+        return t.enum8.deserialize(data.raw)[0]
+    elif data.dp_type == TuyaDPType.BITMAP:
+        bitmaps = {1: t.bitmap8, 2: t.bitmap16, 4: t.bitmap32}
+        return bitmaps[len(data.raw)].deserialize(data.raw)[0]
+    return data.raw
+
+
+def main():
+    """Print per frame decode timings."""
+    frames = {}
+    for name, frame in FRAMES.items():
+        command, rest = TuyaCommand.deserialize(frame)
+        assert not rest, name
+        frames[name] = command.datapoints[0].data
+
+    print(f"{'dp type':<8} {'legacy':>10} {'first':>10} {'cached':>10}  per call")
+    for name, data in frames.items():
+        assert legacy_payload(data) == data.payload, name
+
+        legacy = timeit.timeit(lambda: legacy_payload(data), number=ROUNDS)
+
+        def first(data=data):
+            data.__dict__.pop("_payload_cache", None)
+            return data.payload
+
+        fresh = timeit.timeit(first, number=ROUNDS)
+        cached = timeit.timeit(lambda: data.payload, number=ROUNDS)
+        print(
+            f"{name:<8} {legacy / ROUNDS * 1e6:>8.2f}us {fresh / ROUNDS * 1e6:>8.2f}us"
+            f" {cached / ROUNDS * 1e6:>8.2f}us"
+        )
+
+    for name, value in (
+        ("value", 215),
+        ("bool", True),
+        ("enum", t.enum8(1)),
+        ("bitmap", t.bitmap8(0)),
+    ):
+        data = frames[name]
+        encode = timeit.timeit(
+            lambda: setattr(data, "payload", value), number=ROUNDS  # noqa: B010
+        )
+        print(f"set {name:<6}{encode / ROUNDS * 1e6:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
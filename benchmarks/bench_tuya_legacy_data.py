@@ -0,0 +1,90 @@
+"""Benchmark `Data` conversions of legacy Tuya payloads: lists vs bytes.
+
+Run with ``python benchmarks/bench_tuya_legacy_data.py``.
+
+Times the conversions every legacy TS0601 report and ``set_data`` command
+goes through, for the payloads of a thermostat (value), a switch (bool) and
+a Moes schedule (raw). The list based `Data` previously used is kept here as
+a reference.
+"""
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import zigpy.types as t  # noqa: E402
+
+from zhaquirks.tuya import Data  # noqa: E402
+from zhaquirks.tuya.ts0601_trv import data144  # noqa: E402
+
+ROUNDS = 20000
+
+PAYLOADS = {
+    "value": (t.uint32_t, bytes.fromhex("04 000000d7")),
+    "bool": (t.uint8_t, bytes.fromhex("01 01")),
+    "schedule": (data144, bytes([18]) + bytes(range(18))),
+}
+
+
+class LegacyData(t.List, item_type=t.uint8_t):
+    """list of uint8_t."""
+
+    def __init__(self, value=None):
+        """Convert from a zigpy typed value to a tuya data payload."""
+        if value is None:
+            super().__init__()
+            return
+        if type(value) is list or type(value) is bytes:
+            super().__init__(value)
+            return
+        super().__init__(value.serialize())
+        self.append(len(self))
+        self.reverse()
+
+    def __int__(self):
+        """Convert from a tuya data payload to an int typed value."""
+        ints = {
+            1: t.int8s,
+            2: t.int16s,
+            3: t.int24s,
+            4: t.int32s,
+            5: t.int40s,
+            6: t.int48s,
+            7: t.int56s,
+            8: t.int64s,
+        }
+        return int(ints[self[0]].deserialize(bytes(reversed(self[1:])))[0])
+
+    def __iter__(self):
+        """Convert from a tuya data payload to a list typed value."""
+        return iter(reversed(self[1:]))
+
+    def serialize(self) -> bytes:
+        """Overload serialize to avoid prior implicit conversion to list."""
+        return b"".join([self._item_type(i).serialize() for i in self[:]])
+
+
+def main():
+    """Print per payload conversion timings."""
+    print(f"{'payload':<9} {'step':<12} {'list':>9} {'bytes':>9}")
+    for name, (ztype, raw) in PAYLOADS.items():
+        value = ztype(Data(raw))
+        for step, convert in (
+            ("deserialize", lambda cls: cls.deserialize(raw)),
+            ("to ztype", lambda cls: ztype(cls(raw))),
+            ("from ztype", lambda cls: cls(value)),
+            ("serialize", lambda cls: cls(value).serialize()),
+        ):
+            timings = [
+                min(timeit.repeat(lambda: convert(cls), number=ROUNDS, repeat=3))
+                for cls in (LegacyData, Data)
+            ]
+            print(
+                f"{name:<9} {step:<12}"
+                + "".join(f" {elapsed / ROUNDS * 1e6:>7.2f}us" for elapsed in timings)
+            )
+
+
+if __name__ == "__main__":
+    main()
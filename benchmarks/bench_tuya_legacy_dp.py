@@ -0,0 +1,152 @@
+"""Benchmark legacy Tuya data point handling: if/elif chains vs the event table.
+
+Run with ``python benchmarks/bench_tuya_legacy_dp.py``.
+
+The frames are reports of a TS0601 cover: position updates while moving,
+direction and control reports. The handler previously used by
+`TuyaManufacturerWindowCover` is kept here as a reference and both paths get
+the same deserialized frames. The table is not faster than the chain it
+replaced: both take about 2-3us per frame, most of it in the bus event and
+the cover's attribute update, and the difference between them is within the
+noise of repeated runs.
+"""
+import logging
+import pathlib
+import sys
+import timeit
+from types import SimpleNamespace
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from zhaquirks import Bus  # noqa: E402
+from zhaquirks.tuya import (  # noqa: E402
+    ATTR_COVER_DIRECTION,
+    ATTR_COVER_INVERTED,
+    ATTR_COVER_POSITION,
+    COVER_EVENT,
+    TUYA_DP_ID_COVER_INVERTED,
+    TUYA_DP_ID_DIRECTION_CHANGE,
+    TUYA_DP_ID_PERCENT_CONTROL,
+    TUYA_DP_ID_PERCENT_STATE,
+    TUYA_DP_TYPE_ENUM,
+    TUYA_DP_TYPE_VALUE,
+    TUYA_GET_DATA,
+    TUYA_SET_DATA_RESPONSE,
+    TuyaManufacturerWindowCover,
+)
+
+ROUNDS = 20000
+REPEAT = 5
+
+_LOGGER = logging.getLogger("zhaquirks.tuya")
+
+# ZCL header, status, tsn, dp id, dp type, function, length, data
+FRAMES = [
+    # position while moving
+    *(
+        bytes.fromhex("09 10 02 00 10 03 02 00 04 000000") + bytes((pos,))
+        for pos in range(0, 100, 10)
+    ),
+    # target position
+    bytes.fromhex("09 11 02 00 11 02 02 00 04 00000032"),
+    # direction changed
+    bytes.fromhex("09 12 01 00 12 05 04 00 01 01"),
+    # control: no event
+    bytes.fromhex("09 13 02 00 13 01 04 00 01 02"),
+]
+
+
+def legacy_handle_cluster_request(self, hdr, args, *, dst_addressing=None):
+    """Handle a cover report the way the cluster used to."""
+    if hdr.command_id in (TUYA_GET_DATA, TUYA_SET_DATA_RESPONSE):
+        tuya_payload = args[0]
+        _LOGGER.debug(
+            "%s Received Attribute Report. Command is 0x%04x, Tuya Paylod values"
+            "[Status : %s, TSN: %s, Command: 0x%04x, Function: 0x%02x, Data: %s]",
+            self.endpoint.device.ieee,
+            hdr.command_id,
+            tuya_payload.status,
+            tuya_payload.tsn,
+            tuya_payload.command_id,
+            tuya_payload.function,
+            tuya_payload.data,
+        )
+        if tuya_payload.command_id == TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_STATE:
+            self.endpoint.device.cover_bus.listener_event(
+                COVER_EVENT, ATTR_COVER_POSITION, tuya_payload.data[4]
+            )
+        elif tuya_payload.command_id == TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_CONTROL:
+            self.endpoint.device.cover_bus.listener_event(
+                COVER_EVENT, ATTR_COVER_POSITION, tuya_payload.data[4]
+            )
+        elif tuya_payload.command_id == TUYA_DP_TYPE_ENUM + TUYA_DP_ID_DIRECTION_CHANGE:
+            self.endpoint.device.cover_bus.listener_event(
+                COVER_EVENT, ATTR_COVER_DIRECTION, tuya_payload.data[1]
+            )
+        elif tuya_payload.command_id == TUYA_DP_TYPE_ENUM + TUYA_DP_ID_COVER_INVERTED:
+            self.endpoint.device.cover_bus.listener_event(
+                COVER_EVENT, ATTR_COVER_INVERTED, tuya_payload.data[1]
+            )
+
+
+class CoverControl:
+    """Listener standing in for the cover cluster."""
+
+    def __init__(self):
+        self.events = []
+
+    def cover_event(self, attribute, value):
+        """Record a cover event."""
+        self.events.append((attribute, value))
+
+
+def main():
+    """Print the time taken per handled frame."""
+    device = SimpleNamespace(
+        name="0x3012", ieee="84:fd:27:ff:fe:6a:30:12", cover_bus=Bus()
+    )
+    cover = CoverControl()
+    device.cover_bus.add_listener(cover)
+    endpoint = SimpleNamespace(device=device, endpoint_id=1)
+    cluster = TuyaManufacturerWindowCover(endpoint, is_server=True)
+
+    messages = [cluster.deserialize(frame) for frame in FRAMES]
+
+    def run(handler):
+        for hdr, args in messages:
+            handler(cluster, hdr, args)
+        cover.events.clear()
+
+    handlers = (
+        ("if/elif", legacy_handle_cluster_request),
+        ("table", TuyaManufacturerWindowCover.handle_cluster_request),
+    )
+    results = []
+    for _, handler in handlers:
+        for hdr, args in messages:
+            handler(cluster, hdr, args)
+        results.append(list(cover.events))
+        cover.events.clear()
+    assert results[0] == results[1], results
+
+    for level in (logging.WARNING, logging.DEBUG):
+        _LOGGER.setLevel(level)
+        _LOGGER.propagate = False
+        _LOGGER.addHandler(logging.NullHandler())
+        # repeats of both handlers are interleaved, so load changes hit both
+        best = dict.fromkeys(dict(handlers), float("inf"))
+        for _ in range(REPEAT):
+            for name, handler in handlers:
+                elapsed = timeit.timeit(
+                    lambda handler=handler: run(handler), number=ROUNDS
+                )
+                best[name] = min(best[name], elapsed)
+        for name, elapsed in best.items():
+            print(
+                f"{name:<8} {logging.getLevelName(level):<8}"
+                f" {elapsed / ROUNDS / len(messages) * 1e9:.0f}ns per frame"
+            )
+
+
+if __name__ == "__main__":
+    main()
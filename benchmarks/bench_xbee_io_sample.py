@@ -0,0 +1,181 @@
+"""Benchmark XBee IO sample handling: per sample pin lists vs bitmask fan-out.
+
+Run with ``python benchmarks/bench_xbee_io_sample.py``.
+
+Replays a minute of IO samples of a node sampling every 50ms (IR=50): four
+digital inputs, one of them a contact toggling now and then, two analog
+inputs with a little noise and the supply voltage. The decoder and handler
+previously used by `XBeeDigitalIOCluster` are kept here as a reference.
+"""
+import pathlib
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from zigpy.zcl import foundation  # noqa: E402
+from zigpy.zcl.clusters.general import AnalogInput, OnOff  # noqa: E402
+
+from zhaquirks.xbee import (  # noqa: E402
+    ATTR_ON_OFF,
+    ATTR_PRESENT_VALUE,
+    SAMPLE_DATA_CMD,
+    XBeeAnalogInput,
+    XBeeDigitalIOCluster,
+    XBeeOnOff,
+)
+from zhaquirks.xbee.types import IOSample  # noqa: E402
+
+SAMPLES = 60 * 20
+
+
+def legacy_deserialize(data):
+    """Decode an IO sample the way `IOSample` used to."""
+    digital_mask = data[1:3]
+    analog_mask = data[3:4]
+    digital_sample = data[4:6]
+    num_bits = 15
+    digital_pins = [
+        (int.from_bytes(digital_mask, byteorder="big") >> bit) & 1
+        for bit in range(num_bits - 1, -1, -1)
+    ]
+    digital_pins = list(reversed(digital_pins))
+    analog_pins = [
+        (int.from_bytes(analog_mask, byteorder="big") >> bit) & 1
+        for bit in range(8 - 1, -1, -1)
+    ]
+    analog_pins = list(reversed(analog_pins))
+    if 1 in digital_pins:
+        digital_samples = [
+            (int.from_bytes(digital_sample, byteorder="big") >> bit) & 1
+            for bit in range(num_bits - 1, -1, -1)
+        ]
+        digital_samples = list(reversed(digital_samples))
+        sample_index = 6
+    else:
+        digital_samples = digital_pins
+        sample_index = 4
+    analog_samples = []
+    for apin in analog_pins:
+        if apin == 1:
+            analog_samples.append(
+                int.from_bytes(data[sample_index : sample_index + 2], byteorder="big")
+            )
+            sample_index += 2
+        else:
+            analog_samples.append(None)
+    for dpin in range(len(digital_pins)):
+        if digital_pins[dpin] == 0:
+            digital_samples[dpin] = None
+    return {"digital_samples": digital_samples, "analog_samples": analog_samples}
+
+
+def legacy_handle_sample(cluster, values):
+    """Update the pin clusters the way `XBeeDigitalIOCluster` used to."""
+    # pylint: disable=W0212
+    if "digital_samples" in values:
+        active_pins = [
+            i for i, x in enumerate(values["digital_samples"]) if x is not None
+        ]
+        for pin in active_pins:
+            cluster._endpoint.device[0xD0 + pin].on_off._update_attribute(
+                ATTR_ON_OFF, values["digital_samples"][pin]
+            )
+    if "analog_samples" in values:
+        active_pins = [
+            i for i, x in enumerate(values["analog_samples"]) if x is not None
+        ]
+        for pin in active_pins:
+            cluster._endpoint.device[0xD0 + pin].analog_input._update_attribute(
+                ATTR_PRESENT_VALUE,
+                values["analog_samples"][pin] / (10.23 if pin != 7 else 1000),
+            )
+
+
+class Device(SimpleNamespace):
+    """Device with the IO pin endpoints of an XBee3."""
+
+    def __getitem__(self, endpoint_id):
+        return self.endpoints[endpoint_id]
+
+
+def make_device():
+    """Return a device and its IO cluster, counting attribute updates."""
+    device = Device(name="xbee3", endpoints={})
+    updates = []
+
+    class Listener:
+        def attribute_updated(self, *args):
+            updates.append(args)
+
+    for endpoint_id in range(0xD0, 0xDF):
+        endpoint = SimpleNamespace(
+            device=device, endpoint_id=endpoint_id, in_clusters={}
+        )
+        endpoint.on_off = XBeeOnOff(endpoint, is_server=True)
+        endpoint.in_clusters[OnOff.cluster_id] = endpoint.on_off
+        endpoint.on_off.add_listener(Listener())
+        if endpoint_id < 0xD4 or endpoint_id == 0xD7:
+            endpoint.analog_input = XBeeAnalogInput(endpoint, is_server=True)
+            endpoint.in_clusters[AnalogInput.cluster_id] = endpoint.analog_input
+            endpoint.analog_input.add_listener(Listener())
+        device.endpoints[endpoint_id] = endpoint
+
+    io_endpoint = SimpleNamespace(device=device, endpoint_id=0xE8, in_clusters={})
+    return XBeeDigitalIOCluster(io_endpoint, is_server=True), updates
+
+
+def samples():
+    """Return the captured IO sample frames."""
+    rng = random.Random(0)
+    frames = []
+    contact = 0
+    for _ in range(SAMPLES):
+        if rng.random() < 0.01:
+            contact ^= 1
+        digital = 0b0110 | contact
+        analog = (512 + rng.choice((0, 0, 0, 1)), 300, 3300 - rng.choice((0, 0, 1)))
+        frames.append(
+            bytes([1])
+            + (0x000F).to_bytes(2, "big")
+            + bytes([0b10000011])
+            + digital.to_bytes(2, "big")
+            + b"".join(value.to_bytes(2, "big") for value in analog)
+        )
+    return frames
+
+
+def main():
+    """Print the time taken per sample."""
+    frames = samples()
+    hdr = foundation.ZCLHeader.cluster(1, SAMPLE_DATA_CMD)
+    schema = XBeeDigitalIOCluster.server_commands[SAMPLE_DATA_CMD].schema
+
+    def legacy(cluster):
+        for frame in frames:
+            legacy_handle_sample(cluster, legacy_deserialize(frame))
+
+    def bitmask(cluster):
+        for frame in frames:
+            sample, _ = IOSample.deserialize(frame)
+            cluster.handle_cluster_request(hdr, schema(io_sample=sample))
+
+    print(f"{SAMPLES} samples at IR=50ms")
+    for name, strategy in (("pin lists", legacy), ("bitmasks", bitmask)):
+        best = None
+        for _ in range(5):
+            cluster, updates = make_device()
+            start = time.perf_counter()
+            strategy(cluster)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(
+            f"{name:<10} {best / SAMPLES * 1e6:.1f}us per sample,"
+            f" {len(updates)} attribute updates"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Replay frames recorded with `zhaquirks.replay.FrameRecorder` through the quirks.
+
+Run with ``python benchmarks/replay_recording.py network.zqr``.
+
+Prints the CPU time spent per quirk and the events its clusters emitted, to
+size a host for a network, or for more of the same devices.
+"""
+import argparse
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import zhaquirks  # noqa: E402
+from zhaquirks.replay import DEFAULT_TAIL_S, replay  # noqa: E402
+
+
+def main():
+    """Print the per quirk stats of a recording."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording")
+    parser.add_argument("--tail", type=float, default=DEFAULT_TAIL_S)
+    args = parser.parse_args()
+
+    zhaquirks.setup()
+    stats = replay(args.recording, tail_s=args.tail)
+
+    print(f"{'quirk':<80} {'devices':>7} {'frames':>8} {'cpu ms':>9} {'us/frame':>9}")
+    for quirk, quirk_stats in sorted(
+        stats.items(), key=lambda item: item[1].cpu_s, reverse=True
+    ):
+        per_frame = quirk_stats.cpu_s / quirk_stats.frames if quirk_stats.frames else 0
+        print(
+            f"{quirk:<80} {quirk_stats.devices:>7} {quirk_stats.frames:>8}"
+            f" {quirk_stats.cpu_s * 1e3:>9.1f} {per_frame * 1e6:>9.1f}"
+        )
+        for event, count in quirk_stats.events.most_common():
+            print(f"    {event:<76} {count:>8}")
+
+
+if __name__ == "__main__":
+    main()
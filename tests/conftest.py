@@ -19,6 +19,7 @@ from zhaquirks.const import (
     OUTPUT_CLUSTERS,
     PROFILE_ID,
 )
+from zhaquirks.tuya import TUYA_TIME_SYNC
 
 
 class MockApp(zigpy.application.ControllerApplication):
@@ -80,6 +81,12 @@ class MockApp(zigpy.application.ControllerApplication):
     request = AsyncMock(return_value=(foundation.Status.SUCCESS, None))
 
 
+@pytest.fixture(autouse=True)
+def tuya_time_sync():
+    """Read the wall clock again in every test, some tests mock it."""
+    TUYA_TIME_SYNC.clear()
+
+
 @pytest.fixture(name="MockAppController")
 def app_controller_mock():
     """App controller mock."""
@@ -0,0 +1,91 @@
+"""Tests for the hot path instrumentation of quirk clusters."""
+
+import pytest
+from zigpy.util import ListenableMixin
+
+import zhaquirks
+from zhaquirks import LocalDataCluster, instrumentation
+import zhaquirks.tuya.ts0601_sensor
+from zhaquirks.xiaomi import XiaomiCluster
+import zhaquirks.xiaomi.aqara.vibration_aq1
+
+zhaquirks.setup()
+
+
+@pytest.fixture
+def instrumented():
+    """Instrument the hot paths for a test."""
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+async def test_instrumentation(zigpy_device_from_quirk, instrumented):
+    """Test calls are counted per cluster class and device model."""
+
+    sensor = zigpy_device_from_quirk(
+        zhaquirks.tuya.ts0601_sensor.TuyaTempHumiditySensor
+    )
+    vibration = zigpy_device_from_quirk(
+        zhaquirks.xiaomi.aqara.vibration_aq1.VibrationAQ1,
+        ieee="00:00:00:00:00:00:00:02",
+    )
+
+    for _ in range(3):
+        sensor.handle_message(
+            0x0104,
+            0xEF00,
+            1,
+            1,
+            b"\x19\xE0\x02\x0B\x33\x01\x02\x00\x04\x00\x00\x00\xFD"
+            b"\x02\x02\x00\x04\x00\x00\x00\x47",
+        )
+    vibration.handle_message(
+        0x0104,
+        0x0000,
+        1,
+        1,
+        b'\x1c_\x11I\n\x01\xffB"\x01!\xb3\x0b\x03(\r\x04!\xa8\x13\x05!\xcb\x00'
+        b"\x06$\x01\x00\x00\x00\x00\x08!\x04\x02\n!\x00\x00d\x10\x00",
+    )
+
+    rows = {
+        (row.cluster, row.model, row.method): row for row in instrumentation.snapshot()
+    }
+
+    tuya = rows[("TemperatureHumidityManufCluster", "TS0601", "handle_cluster_request")]
+    assert tuya.calls == 3
+    assert tuya.total_s > 0
+    assert rows[("TemperatureHumidityManufCluster", "TS0601", "deserialize")].calls == 3
+    # nested super() calls are only counted once
+    basic = ("VibrationAQ1.VibrationBasicCluster", "lumi.vibration.aq1", "deserialize")
+    assert rows[basic].calls == 1
+    assert ("TuyaTemperatureMeasurement", "TS0601", "_update_attribute") in rows
+
+    snapshot = instrumentation.snapshot()
+    assert [row.total_s for row in snapshot] == sorted(
+        (row.total_s for row in snapshot), reverse=True
+    )
+    assert len(instrumentation.snapshot(top=2)) == 2
+
+
+def test_instrumentation_disable():
+    """Test disabling restores the original methods."""
+
+    deserialize = XiaomiCluster.__dict__["deserialize"]
+    listener_event = ListenableMixin.__dict__["listener_event"]
+    local_methods = set(LocalDataCluster.__dict__)
+
+    instrumentation.enable()
+    assert instrumentation.is_enabled()
+    assert XiaomiCluster.__dict__["deserialize"] is not deserialize
+    assert ListenableMixin.__dict__["listener_event"] is not listener_event
+    # inherited methods are wrapped where defined, keeping the resolution order
+    assert set(LocalDataCluster.__dict__) == local_methods
+
+    instrumentation.disable()
+    assert not instrumentation.is_enabled()
+    assert XiaomiCluster.__dict__["deserialize"] is deserialize
+    assert ListenableMixin.__dict__["listener_event"] is listener_event
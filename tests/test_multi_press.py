@@ -0,0 +1,46 @@
+"""Tests for the multiple press detector."""
+
+import asyncio
+from unittest import mock
+
+from zhaquirks.multi_press import MultiPressDetector
+
+
+async def test_multi_press_count():
+    """Test presses within the window form one gesture per key."""
+
+    detector = MultiPressDetector(window_s=0.05, max_presses=3)
+    on_pressed = mock.Mock()
+    off_pressed = mock.Mock()
+
+    for _ in range(2):
+        detector.press("on", on_pressed)
+        await asyncio.sleep(0.0125)
+    detector.press("off", off_pressed)
+    await asyncio.sleep(0.025)
+    detector.press("on", on_pressed)
+
+    await asyncio.sleep(0.0375)
+    off_pressed.assert_called_once_with(1)
+    on_pressed.assert_not_called()
+    assert "on" in detector
+
+    await asyncio.sleep(0.0375)
+    on_pressed.assert_called_once_with(3)
+    assert "on" not in detector
+
+    for _ in range(5):
+        detector.press("on", on_pressed)
+    await asyncio.sleep(0.075)
+    assert on_pressed.mock_calls[-1] == mock.call(3)
+
+
+async def test_multi_press_callback_error(caplog):
+    """Test a failing callback does not leave the gesture pending."""
+
+    detector = MultiPressDetector(window_s=0)
+    detector.press("on", mock.Mock(side_effect=RuntimeError))
+    await asyncio.sleep(0.001)
+
+    assert "on" not in detector
+    assert "Error reporting 1 presses of 'on'" in caplog.text
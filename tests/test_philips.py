@@ -0,0 +1,44 @@
+"""Tests for Philips quirks."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+from zigpy.zcl import foundation
+
+import zhaquirks
+import zhaquirks.philips.rwl022
+
+zhaquirks.setup()
+
+
+@pytest.mark.parametrize("quirk", (zhaquirks.philips.rwl022.PhilipsRWL022,))
+async def test_remote_multi_press(zigpy_device_from_quirk, quirk):
+    """Test presses on two remotes are counted separately."""
+
+    listeners = []
+    clusters = []
+    for _ in range(2):
+        device = zigpy_device_from_quirk(quirk)
+        cluster = device.endpoints[1].philips_remote_cluster
+        listener = mock.MagicMock()
+        cluster.add_listener(listener)
+        clusters.append(cluster)
+        listeners.append(listener)
+
+    hdr = foundation.ZCLHeader.cluster(1, 0x0000)
+    with mock.patch.object(
+        clusters[0]._multi_press, "_window_s", 0.01
+    ), mock.patch.object(clusters[1]._multi_press, "_window_s", 0.01):
+        # first remote: "on" twice, second remote: "on" once and "off" once
+        for cluster, button in ((0, 1), (1, 1), (0, 1), (1, 4)):
+            clusters[cluster].handle_cluster_request(hdr, [button, 0, 0, 0, 0, 0])
+        await asyncio.sleep(0.03)
+
+    assert [c.args[0] for c in listeners[0].zha_send_event.call_args_list] == [
+        "on_double_press"
+    ]
+    assert sorted(c.args[0] for c in listeners[1].zha_send_event.call_args_list) == [
+        "off_press",
+        "on_press",
+    ]
@@ -6,6 +6,7 @@ import importlib
 import json
 from pathlib import Path
 from unittest import mock
+import weakref
 
 import pytest
 import zigpy.device
@@ -51,6 +52,9 @@ from zhaquirks.const import (
 )
 import zhaquirks.konke
 import zhaquirks.philips
+from zhaquirks.quirk_index import QUIRK_INDEX_FORMAT, LazyQuirkLoader, build_quirk_index
+import zhaquirks.quirk_index_data as quirk_index_data
+from zhaquirks.signature_index import SignatureIndex
 from zhaquirks.xiaomi import XIAOMI_NODE_DESC
 import zhaquirks.xiaomi.aqara.vibration_aq1
 
@@ -797,3 +801,281 @@ def test_no_duplicate_clusters(quirk: CustomDevice) -> None:
     for ep_id, ep_data in quirk.replacement[ENDPOINTS].items():
         check_for_duplicate_cluster_ids(ep_data.get(INPUT_CLUSTERS, []))
         check_for_duplicate_cluster_ids(ep_data.get(OUTPUT_CLUSTERS, []))
+
+
+def test_quirk_index_up_to_date() -> None:
+    """Ensure the prebuilt quirk index matches the registered quirks."""
+
+    index = build_quirk_index()
+
+    assert quirk_index_data.QUIRK_INDEX_FORMAT == QUIRK_INDEX_FORMAT
+    assert {key: set(refs) for key, refs in index.items()} == {
+        key: set(refs) for key, refs in quirk_index_data.QUIRK_INDEX.items()
+    }, "Quirk index is outdated, run script/gen_quirk_index"
+
+
+def test_lazy_quirk_loader() -> None:
+    """Test quirk modules are only imported once their model is looked up."""
+
+    class QuirkA(CustomDevice):
+        pass
+
+    class QuirkB(CustomDevice):
+        pass
+
+    class CustomQuirk(CustomDevice):
+        pass
+
+    QuirkA.__module__ = QuirkB.__module__ = "zhaquirks.mock"
+    index = {
+        ("Manuf", "Model"): (
+            ("zhaquirks.mock", QuirkB.__qualname__),
+            ("zhaquirks.mock", QuirkA.__qualname__),
+        ),
+    }
+
+    registry = zq.DeviceRegistry()
+    registry.registry["Manuf"]["Model"].append(CustomQuirk)
+    loader = LazyQuirkLoader(registry, index)
+    loader.install()
+    assert LazyQuirkLoader.is_installed(registry)
+
+    def import_module(modname):
+        assert modname == "zhaquirks.mock"
+        with loader.loading():
+            registry.registry["Manuf"]["Model"].insert(0, QuirkA)
+            registry.registry["Manuf"]["Model"].insert(0, QuirkB)
+        # registration order differs from the indexed priority
+        registry.registry["Manuf"]["Model"].reverse()
+
+    with mock.patch("importlib.import_module", side_effect=import_module) as imp:
+        assert loader.pending == 1
+        assert registry.registry["Other"]["Model"] == []
+        assert imp.call_count == 0
+
+        assert registry.registry["Manuf"]["Model"] == [CustomQuirk, QuirkB, QuirkA]
+        assert imp.call_count == 1
+        assert loader.pending == 0
+
+        assert registry.registry["Manuf"]["Model"] == [CustomQuirk, QuirkB, QuirkA]
+        assert imp.call_count == 1
+
+
+@pytest.mark.parametrize("quirk", ALL_QUIRK_CLASSES)
+async def test_signature_index_matches_registry(
+    quirk: CustomDevice, zigpy_device_from_quirk
+) -> None:
+    """Test the signature index picks the same quirk as the zigpy registry."""
+
+    raw_device = zigpy_device_from_quirk(quirk, apply_quirk=False)
+    # zigpy's own matching, not the index installed by setup
+    expected = zq.DeviceRegistry.get_device(zq._DEVICE_REGISTRY, raw_device)
+
+    index = SignatureIndex()
+    if isinstance(expected, CustomDevice):
+        assert index.get_quirk(raw_device) is type(expected)
+    else:
+        assert index.get_quirk(raw_device) is None
+
+    # an extra cluster on any endpoint must not match the same quirk
+    ep_id = next(iter(raw_device.endpoints.keys() - {0}), None)
+    if ep_id is not None:
+        raw_device.endpoints[ep_id].add_input_cluster(0xFC99)
+        assert index.get_quirk(raw_device) is not quirk
+
+
+async def test_signature_index_installed(zigpy_device_from_quirk) -> None:
+    """Test setup matches devices through the signature index."""
+
+    registry = zq._DEVICE_REGISTRY
+    assert SignatureIndex.is_installed(registry)
+
+    raw_device = zigpy_device_from_quirk(
+        zhaquirks.xiaomi.aqara.vibration_aq1.VibrationAQ1, apply_quirk=False
+    )
+    with mock.patch.object(
+        SignatureIndex, "get_quirk", autospec=True, side_effect=SignatureIndex.get_quirk
+    ) as get_quirk:
+        device = zq.get_device(raw_device)
+
+    assert type(device) is zhaquirks.xiaomi.aqara.vibration_aq1.VibrationAQ1
+    assert get_quirk.call_count == 1
+
+    zhaquirks.setup()
+    assert registry.get_device.__self__ is get_quirk.call_args[0][0]
+
+
+def test_signature_index_rebuilds_on_registry_change() -> None:
+    """Test buckets are recompiled when quirks are added or removed."""
+
+    signature = {
+        MODELS_INFO: [("Manuf", "Model")],
+        ENDPOINTS: {
+            1: {
+                PROFILE_ID: zigpy.profiles.zha.PROFILE_ID,
+                DEVICE_TYPE: zigpy.profiles.zha.DeviceType.ON_OFF_SWITCH,
+                INPUT_CLUSTERS: [0x0000, 0x0006],
+                OUTPUT_CLUSTERS: [],
+            }
+        },
+    }
+
+    class QuirkA(CustomDevice):
+        pass
+
+    class QuirkB(CustomDevice):
+        pass
+
+    QuirkA.signature = signature
+    QuirkB.signature = signature
+
+    raw_device = mock.Mock(manufacturer="Manuf", model="Model")
+    raw_device.endpoints = {
+        1: mock.Mock(
+            profile_id=zigpy.profiles.zha.PROFILE_ID,
+            device_type=zigpy.profiles.zha.DeviceType.ON_OFF_SWITCH,
+            in_clusters={0x0000: None, 0x0006: None},
+            out_clusters={},
+        )
+    }
+
+    registry = zq.DeviceRegistry()
+    index = SignatureIndex(registry)
+    index.install()
+    assert index.get_quirk(raw_device) is None
+
+    registry.add_to_registry(QuirkA)
+    assert index.get_quirk(raw_device) is QuirkA
+
+    registry.add_to_registry(QuirkB)
+    assert index.get_quirk(raw_device) is QuirkB
+
+    registry.remove(QuirkB)
+    assert index.get_quirk(raw_device) is QuirkA
+
+    # changed in place, the buckets are only recompiled once invalidated
+    registry.registry["Manuf"]["Model"].insert(0, QuirkB)
+    assert index.get_quirk(raw_device) is QuirkA
+    index.invalidate()
+    assert index.get_quirk(raw_device) is QuirkB
+
+    raw_device.endpoints[
+        1
+    ].device_type = zigpy.profiles.zha.DeviceType.LEVEL_CONTROL_SWITCH
+    assert index.get_quirk(raw_device) is None
+
+
+def test_bus_handlers():
+    """Test the bus resolves handlers once and follows listener changes."""
+
+    class Listener:
+        def __init__(self):
+            self.events = []
+
+        def temperature_reported(self, value):
+            self.events.append(value)
+            return value
+
+        def failing_event(self):
+            raise RuntimeError
+
+    bus = zhaquirks.Bus()
+    first, second = Listener(), Listener()
+    bus.add_listener(first)
+    bus.add_listener(object())
+
+    assert bus.listener_event("temperature_reported", 21) == [21]
+    assert bus.listener_event("failing_event") == []
+    assert bus.listener_event("not_handled") == []
+
+    bus.add_listener(second)
+    assert bus.listener_event("temperature_reported", 22) == [22, 22]
+    assert first.events == [21, 22]
+    assert second.events == [22]
+
+    bus.remove_listener(first)
+    assert bus.listener_event("temperature_reported", 23) == [23]
+    assert first.events == [21, 22]
+
+    context = mock.Mock()
+    bus.add_context_listener(context)
+    bus.listener_event("temperature_reported", 24)
+    context.temperature_reported.assert_called_once_with(bus, 24)
+
+    assert bus.dispatch_counts == {
+        "temperature_reported": 4,
+        "failing_event": 1,
+        "not_handled": 1,
+    }
+
+
+def test_bus_weak_listener():
+    """Test weakly referenced listeners are dropped once garbage collected."""
+
+    class Listener:
+        def battery_reported(self, value):
+            return value
+
+    bus = zhaquirks.Bus()
+    listener = Listener()
+    bus.add_listener(listener, weak=True)
+    assert bus.listener_event("battery_reported", 100) == [100]
+
+    bus.remove_listener(listener)
+    assert bus.listener_event("battery_reported", 99) == []
+
+    bus.add_listener(listener, weak=True)
+    assert bus.listener_event("battery_reported", 98) == [98]
+
+    del listener
+    assert bus.listener_event("battery_reported", 97) == []
+    assert bus._listeners == {}
+
+
+def test_bus_weak_listener_plain_handler():
+    """Test handlers which are not bound methods do not keep weak listeners alive."""
+
+    class Listener:
+        def __init__(self):
+            self.battery_reported = lambda value: value
+
+    bus = zhaquirks.Bus()
+    listener = Listener()
+    ref = weakref.ref(listener)
+    bus.add_listener(listener, weak=True)
+    assert bus.listener_event("battery_reported", 100) == [100]
+
+    del listener
+    assert ref() is None
+    assert bus.listener_event("battery_reported", 99) == []
+
+
+async def test_bus_async_event():
+    """Test async events are dispatched through the resolved handlers."""
+
+    class Listener:
+        async def battery_reported(self, value):
+            return value
+
+        async def failing_event(self):
+            raise RuntimeError
+
+    bus = zhaquirks.Bus()
+    listener = Listener()
+    bus.add_listener(listener)
+    bus.add_listener(object())
+    context = mock.AsyncMock()
+    bus.add_context_listener(context)
+
+    assert await bus.async_event("battery_reported", 100) == [100, mock.ANY]
+    context.battery_reported.assert_awaited_once_with(bus, 100)
+    assert await bus.async_event("failing_event") == [mock.ANY]
+
+    weak_listener = Listener()
+    bus.remove_listener(context)
+    bus.add_listener(weak_listener, weak=True)
+    assert await bus.async_event("battery_reported", 99) == [99, 99]
+
+    del weak_listener
+    assert await bus.async_event("battery_reported", 98) == [98]
+    assert bus.dispatch_counts == {"battery_reported": 3, "failing_event": 1}
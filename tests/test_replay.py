@@ -0,0 +1,142 @@
+"""Tests for recording and replaying frames."""
+
+from unittest import mock
+
+import pytest
+from zigpy.zcl import foundation
+
+import zhaquirks
+from zhaquirks.const import ENDPOINTS, INPUT_CLUSTERS
+import zhaquirks.philips.rwl022
+from zhaquirks.replay import TIMERS, FrameRecorder, read_recording, replay
+import zhaquirks.tuya.ts0601_sensor
+
+zhaquirks.setup()
+
+
+def philips_press(tsn, press_type=0):
+    """Return a notification of the "on" button of a Hue dimmer."""
+    return (
+        bytes([0x1D, 0x0B, 0x10, tsn, 0x00, 0x01, 0x00, 0x00, 0x30, press_type])
+        + b"\x21\x00\x00"
+    )
+
+
+def test_record_replay(zigpy_device_from_quirk, tmp_path):
+    """Test recorded frames replay with their timing through the same quirks."""
+
+    remote = zigpy_device_from_quirk(zhaquirks.philips.rwl022.PhilipsRWL022)
+    sensor = zigpy_device_from_quirk(
+        zhaquirks.tuya.ts0601_sensor.TuyaTempHumiditySensor,
+        ieee="00:00:00:00:00:00:00:02",
+    )
+
+    clock = mock.Mock(return_value=0.0)
+    path = tmp_path / "network.zqr"
+    recorder = FrameRecorder.open(str(path), clock=clock)
+
+    # a double press, a single press a second later, then a sensor report
+    for offset, tsn in ((0.0, 1), (0.1, 2), (1.1, 3)):
+        clock.return_value = offset
+        recorder.handle_message(remote, 0x0104, 0xFC00, 1, 1, philips_press(tsn))
+    clock.return_value = 30.0
+    recorder.handle_message(
+        sensor,
+        0x0104,
+        0xEF00,
+        1,
+        1,
+        b"\x09\xE0\x02\x0B\x33\x01\x02\x00\x04\x00\x00\x00\xFD"
+        b"\x02\x02\x00\x04\x00\x00\x00\x47",
+    )
+    recorder.close()
+    assert recorder.frames == 4
+
+    with open(path, "rb") as stream:
+        records = list(read_recording(stream))
+    assert records[0] == (0, records[0][1])
+    assert records[0][1]["quirk"] == "zhaquirks.philips.rwl022:PhilipsRWL022"
+    # the endpoints of the signature, not those the quirk replaced them with
+    assert records[0][1]["endpoints"]["1"]["in_clusters"] == sorted(
+        zhaquirks.philips.rwl022.PhilipsRWL022.signature[ENDPOINTS][1][INPUT_CLUSTERS]
+    )
+    assert [record.offset for record in records if not isinstance(record, tuple)] == [
+        0.0,
+        0.1,
+        1.1,
+        30.0,
+    ]
+
+    stats = replay(str(path))
+
+    remote_stats = stats["zhaquirks.philips.rwl022:PhilipsRWL022"]
+    assert remote_stats.devices == 1
+    assert remote_stats.frames == 3
+    assert remote_stats.events["zha_send_event"] == 2
+    sensor_stats = stats["zhaquirks.tuya.ts0601_sensor:TuyaTempHumiditySensor"]
+    assert sensor_stats.frames == 1
+    assert sensor_stats.events["attribute_updated"] >= 2
+    assert TIMERS in stats
+
+
+def test_replay_tuya_set_time(zigpy_device_from_quirk, tmp_path):
+    """Test set_time requests are answered as they were live, on replayed time."""
+
+    sensor = zigpy_device_from_quirk(
+        zhaquirks.tuya.ts0601_sensor.TuyaTempHumiditySensor
+    )
+
+    clock = mock.Mock(return_value=0.0)
+    path = tmp_path / "network.zqr"
+    recorder = FrameRecorder.open(str(path), clock=clock)
+    # three requests a minute apart, the last one repeated right away
+    for offset in (0.0, 60.0, 120.0, 121.0):
+        clock.return_value = offset
+        recorder.handle_message(sensor, 0x0104, 0xEF00, 1, 1, b"\x09\x12\x24\x0D\x00")
+    recorder.close()
+
+    set_time = []
+
+    async def request(device, profile, cluster, src_ep, dst_ep, sequence, data, **kw):
+        hdr, _ = foundation.ZCLHeader.deserialize(data)
+        if hdr.frame_control.is_cluster and hdr.command_id == 0x24:
+            set_time.append(data)
+        return foundation.Status.SUCCESS, None
+
+    with mock.patch("zhaquirks.replay.ReplayApplication.request", side_effect=request):
+        replay(str(path))
+
+    assert len(set_time) == 3
+    # timestamps since 1970, UTC then local, follow the replayed minutes
+    utc = [int.from_bytes(data[-8:-4], "big") for data in set_time]
+    assert [seconds - utc[0] for seconds in utc] == [0, 60, 120]
+
+
+def test_replay_unknown_quirk(zigpy_device_from_quirk, tmp_path, caplog):
+    """Test a device whose recorded quirk is gone gets the quirk matching now."""
+
+    remote = zigpy_device_from_quirk(zhaquirks.philips.rwl022.PhilipsRWL022)
+
+    path = tmp_path / "network.zqr"
+    recorder = FrameRecorder.open(str(path), clock=mock.Mock(return_value=0.0))
+    with mock.patch(
+        "zhaquirks.replay.quirk_path", return_value="zhaquirks.gone:RemoteQuirk"
+    ):
+        recorder.handle_message(remote, 0x0104, 0xFC00, 1, 1, philips_press(1))
+    recorder.close()
+
+    stats = replay(str(path))
+
+    assert "Recorded quirk zhaquirks.gone:RemoteQuirk" in caplog.text
+    assert "zhaquirks.gone:RemoteQuirk" not in stats
+    assert stats["zhaquirks.philips.rwl022:PhilipsRWL022"].frames == 1
+
+
+def test_replay_not_a_recording(tmp_path):
+    """Test replaying a file that is not a recording."""
+
+    path = tmp_path / "network.zqr"
+    path.write_bytes(b"nope")
+
+    with pytest.raises(ValueError):
+        replay(str(path))
@@ -0,0 +1,67 @@
+"""Tests for the shared timer wheel."""
+
+import asyncio
+from unittest import mock
+
+from zhaquirks.timer_wheel import TimerWheel, get_timer_wheel
+
+
+async def test_timer_wheel_rearm():
+    """Test re-arming a key moves its deadline without adding loop timers."""
+
+    wheel = TimerWheel(resolution=0.01)
+    callback = mock.Mock()
+
+    wheel.schedule("sensor", 0.02, callback)
+    handle = wheel._handle
+    await asyncio.sleep(0.01)
+    wheel.schedule("sensor", 0.05, callback)
+    assert wheel._handle is handle
+    assert len(wheel) == 1
+
+    await asyncio.sleep(0.03)
+    callback.assert_not_called()
+    assert "sensor" in wheel
+
+    await asyncio.sleep(0.05)
+    callback.assert_called_once_with()
+    assert "sensor" not in wheel
+    assert wheel._handle is None
+
+
+async def test_timer_wheel_order_and_cancel():
+    """Test callbacks run by deadline and cancelled ones do not run."""
+
+    wheel = TimerWheel(resolution=0.01)
+    calls = []
+
+    wheel.schedule("late", 0.04, lambda: calls.append("late"))
+    wheel.schedule("early", 0.02, lambda: calls.append("early"))
+    wheel.schedule("cancelled", 0.02, lambda: calls.append("cancelled"))
+    assert wheel.cancel("cancelled")
+    assert not wheel.cancel("cancelled")
+
+    await asyncio.sleep(0.08)
+    assert calls == ["early", "late"]
+    assert len(wheel) == 0
+
+
+async def test_timer_wheel_immediate(caplog):
+    """Test non positive delays run on the next loop iteration."""
+
+    wheel = TimerWheel()
+    callback = mock.Mock()
+
+    wheel.schedule("failing", 0, mock.Mock(side_effect=RuntimeError))
+    wheel.schedule("sensor", 0, callback)
+    await asyncio.gather(asyncio.sleep(0), asyncio.sleep(0))
+
+    callback.assert_called_once_with()
+    assert "Error running timer callback" in caplog.text
+
+
+async def test_get_timer_wheel():
+    """Test a single wheel is shared per event loop."""
+
+    wheel = get_timer_wheel()
+    assert get_timer_wheel(asyncio.get_running_loop()) is wheel
@@ -2,11 +2,15 @@
 
 import asyncio
 import datetime
+import gc
 import itertools
+import random
 from unittest import mock
+import weakref
 
 import pytest
 import zigpy
+import zigpy.exceptions
 from zigpy.profiles import zha
 from zigpy.quirks import CustomDevice, get_device
 import zigpy.types as t
@@ -37,6 +41,7 @@ from zhaquirks.const import (
 from zhaquirks.tuya import (
     Data,
     TuyaEnchantableCluster,
+    TuyaManufCluster,
     TuyaManufClusterAttributes,
     TuyaNewManufCluster,
 )
@@ -46,10 +51,16 @@ import zhaquirks.tuya.ts0041
 import zhaquirks.tuya.ts0042
 import zhaquirks.tuya.ts0043
 import zhaquirks.tuya.ts0501_fan_switch
+import zhaquirks.tuya.ts0601_cover
 import zhaquirks.tuya.ts0601_electric_heating
 import zhaquirks.tuya.ts0601_motion
 import zhaquirks.tuya.ts0601_siren
 import zhaquirks.tuya.ts0601_trv
+from zhaquirks.tuya.ts0601_trv import (
+    MOES_CHILD_LOCK_ATTR,
+    MOES_MODE_ATTR,
+    MOES_TARGET_TEMP_ATTR,
+)
 import zhaquirks.tuya.ts0601_valve
 
 from tests.common import ClusterListener, MockDatetime, wait_for_zigpy_tasks
@@ -303,6 +314,91 @@ async def test_tuya_data_conversion():
     assert Data(t.int32s(-20)) == [4, 255, 255, 255, 236]
 
 
+class LegacyData(t.List, item_type=t.uint8_t):
+    """The list based `Data` implementation, as a reference."""
+
+    def __init__(self, value=None):
+        """Convert from a zigpy typed value to a tuya data payload."""
+        if value is None:
+            super().__init__()
+            return
+        if type(value) is list or type(value) is bytes:
+            super().__init__(value)
+            return
+        super().__init__(value.serialize())
+        self.append(len(self))
+        self.reverse()
+
+    def __int__(self):
+        """Convert from a tuya data payload to an int typed value."""
+        ints = {
+            1: t.int8s,
+            2: t.int16s,
+            3: t.int24s,
+            4: t.int32s,
+            5: t.int40s,
+            6: t.int48s,
+            7: t.int56s,
+            8: t.int64s,
+        }
+        return int(ints[self[0]].deserialize(bytes(reversed(self[1:])))[0])
+
+    def __iter__(self):
+        """Convert from a tuya data payload to a list typed value."""
+        return iter(reversed(self[1:]))
+
+    def serialize(self) -> bytes:
+        """Overload serialize to avoid prior implicit conversion to list."""
+        return b"".join([self._item_type(i).serialize() for i in self[:]])
+
+
+def _tuya_data_types():
+    """Return the attribute types of all quirks converting legacy Tuya data."""
+    types = set()
+    for manufacturer in zigpy.quirks._DEVICE_REGISTRY._registry.values():
+        for model_quirk_list in manufacturer.values():
+            for quirk in model_quirk_list:
+                for endpoint in quirk.replacement.get(ENDPOINTS, {}).values():
+                    for cluster in endpoint.get(INPUT_CLUSTERS, []):
+                        if not isinstance(cluster, int) and issubclass(
+                            cluster, TuyaManufClusterAttributes
+                        ):
+                            types.update(a.type for a in cluster.attributes.values())
+    return types
+
+
+@pytest.mark.parametrize(
+    "ztype", sorted(_tuya_data_types(), key=lambda ztype: ztype.__name__)
+)
+def test_tuya_data_conformance(ztype):
+    """Test `Data` converts like the list based implementation."""
+
+    def outcome(convert):
+        try:
+            return convert()
+        except Exception as exc:  # noqa: B902
+            return type(exc)
+
+    rng = random.Random(ztype.__name__)
+    for _ in range(200):
+        size = rng.choice((1, 2, 4, 4, 9, 18, 24, 144))
+        length = rng.choice((size, size, size + 1, size - 1))
+        raw = [size] + [rng.randrange(256) for _ in range(length)]
+
+        data = Data(raw)
+        assert data == raw
+        assert Data.deserialize(bytes(raw)) == (data, b"")
+        assert data.serialize() == LegacyData(raw).serialize()
+
+        value = outcome(lambda: ztype(LegacyData(raw)))
+        assert outcome(lambda: ztype(data)) == value
+        if not isinstance(value, type):
+            assert outcome(lambda: Data(value)) == outcome(lambda: LegacyData(value))
+            assert outcome(lambda: list(Data(value))) == outcome(
+                lambda: list(LegacyData(value))
+            )
+
+
 class TuyaTestManufCluster(TuyaManufClusterAttributes):
     """Cluster for synthetic tests."""
 
@@ -1701,3 +1797,201 @@ def test_tuya_spell_devices_valid():
             pytest.fail(
                 f"{quirk} has more than one cluster subclassing `TuyaEnchantableCluster` on endpoint 1"
             )
+
+
+@pytest.mark.parametrize("quirk", (zhaquirks.tuya.ts0601_trv.MoesHY368_Type1,))
+async def test_moes_schedule_report_changes(zigpy_device_from_quirk, quirk):
+    """Test repeated schedule reports only update the slots which changed."""
+
+    valve_dev = zigpy_device_from_quirk(quirk)
+    tuya_cluster = valve_dev.endpoints[1].tuya_manufacturer
+    thermostat_listener = ClusterListener(valve_dev.endpoints[1].thermostat)
+
+    hdr, args = tuya_cluster.deserialize(ZCL_TUYA_VALVE_WORKDAY_SCHEDULE)
+    tuya_cluster.handle_message(hdr, args)
+    assert len(thermostat_listener.attribute_updates) == 18
+
+    tuya_cluster.handle_message(hdr, args)
+    assert len(thermostat_listener.attribute_updates) == 18
+
+    # the flags in the top bits of the hour are not part of it
+    frame = bytearray(ZCL_TUYA_VALVE_WORKDAY_SCHEDULE)
+    frame[9] |= 0x80
+    frame[10] = 45
+    hdr, args = tuya_cluster.deserialize(bytes(frame))
+    tuya_cluster.handle_message(hdr, args)
+    assert thermostat_listener.attribute_updates[18:] == [(0x4111, 45)]
+
+
+@pytest.mark.parametrize("quirk", (zhaquirks.tuya.ts0601_trv.MoesHY368_Type1,))
+async def test_tuya_write_attributes_status(zigpy_device_from_quirk, quirk):
+    """Test set_data commands are pipelined and failures reported per record."""
+
+    valve_dev = zigpy_device_from_quirk(quirk)
+    tuya_cluster = valve_dev.endpoints[1].tuya_manufacturer
+    thermostat_cluster = valve_dev.endpoints[1].thermostat
+
+    in_flight = []
+    sent = []
+
+    async def command(command_id, payload, **kwargs):
+        in_flight.append(payload.command_id)
+        sent.append((payload.command_id, len(in_flight)))
+        await asyncio.sleep(0)
+        in_flight.remove(payload.command_id)
+        if payload.command_id == MOES_TARGET_TEMP_ATTR:
+            raise zigpy.exceptions.DeliveryError("no ack")
+
+    with mock.patch.object(TuyaManufCluster, "command", side_effect=command):
+        (status,) = await tuya_cluster.write_attributes(
+            {
+                MOES_MODE_ATTR: 2,
+                MOES_TARGET_TEMP_ATTR: 21,
+                MOES_CHILD_LOCK_ATTR: 1,
+            }
+        )
+        assert sent == [
+            (MOES_MODE_ATTR, 1),
+            (MOES_TARGET_TEMP_ATTR, 1),
+            (MOES_CHILD_LOCK_ATTR, 1),
+        ]
+        assert status == [
+            foundation.WriteAttributesStatusRecord(
+                foundation.Status.FAILURE, MOES_TARGET_TEMP_ATTR
+            )
+        ]
+
+        sent.clear()
+        tuya_cluster.set_data_in_flight = 2
+        tuya_cluster._set_data_slots = None
+        (status,) = await thermostat_cluster.write_attributes(
+            {
+                "occupied_heating_setpoint": 2100,
+                "eco_heating_setpoint": 1600,
+                "min_heat_setpoint_limit": 500,
+            }
+        )
+        assert max(count for _, count in sent) == 2
+        assert status == [
+            foundation.WriteAttributesStatusRecord(
+                foundation.Status.FAILURE,
+                thermostat_cluster.attributes_by_name["occupied_heating_setpoint"].id,
+            )
+        ]
+
+        (status,) = await thermostat_cluster.write_attributes(
+            {"eco_heating_setpoint": 1600}
+        )
+        assert status == [
+            foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)
+        ]
+
+
+@pytest.mark.parametrize(
+    "quirk", (zhaquirks.tuya.ts0601_cover.TuyaZemismartSmartCover0601,)
+)
+async def test_cover_dp_events(zigpy_device_from_quirk, quirk):
+    """Test legacy cover data points are sent to the cover cluster."""
+
+    cover_dev = zigpy_device_from_quirk(quirk)
+    tuya_cluster = cover_dev.endpoints[1].tuya_manufacturer
+    cover_cluster = cover_dev.endpoints[1].window_covering
+    cover_listener = ClusterListener(cover_cluster)
+
+    for frame in (
+        b"\x09\x10\x02\x00\x10\x03\x02\x00\x04\x00\x00\x00\x1e",  # position 30%
+        b"\x09\x11\x01\x00\x11\x05\x04\x00\x01\x01",  # direction changed
+        b"\x09\x12\x02\x00\x12\x01\x01\x00\x01\x01",  # no event for control
+    ):
+        hdr, args = tuya_cluster.deserialize(frame)
+        tuya_cluster.handle_message(hdr, args)
+
+    assert cover_listener.attribute_updates == [(0x0008, 70), (0x8001, 1)]
+    assert tuya_cluster._dp_event_table[0x0203] == (
+        "cover_bus",
+        "cover_event",
+        0x0008,
+        4,
+    )
+
+
+def cover_position_frame(position):
+    """Return a Tuya report of the position of a cover."""
+    return b"\x09\x10\x02\x00\x10\x03\x02\x00\x04\x00\x00\x00" + bytes([position])
+
+
+@pytest.mark.parametrize(
+    "quirk", (zhaquirks.tuya.ts0601_cover.TuyaZemismartSmartCover0601,)
+)
+async def test_cover_coalesced_position(zigpy_device_from_quirk, quirk):
+    """Test position reports of a moving cover are coalesced once enabled."""
+
+    cover_dev = zigpy_device_from_quirk(quirk)
+    tuya_cluster = cover_dev.endpoints[1].tuya_manufacturer
+    cover_cluster = cover_dev.endpoints[1].window_covering
+    cover_listener = ClusterListener(cover_cluster)
+
+    # disabled unless a quirk opts in
+    for position in (10, 20):
+        tuya_cluster.handle_message(
+            *tuya_cluster.deserialize(cover_position_frame(position))
+        )
+    assert cover_listener.attribute_updates == [(0x0008, 90), (0x0008, 80)]
+    cover_listener.attribute_updates.clear()
+
+    with mock.patch.object(cover_cluster, "coalesce_ms", 20):
+        for position in (10, 20, 30, 40):
+            hdr, args = tuya_cluster.deserialize(cover_position_frame(position))
+            tuya_cluster.handle_message(hdr, args)
+        hdr, args = tuya_cluster.deserialize(
+            b"\x09\x11\x01\x00\x11\x05\x04\x00\x01\x01"
+        )
+        tuya_cluster.handle_message(hdr, args)
+
+        # the first position and other attributes are sent right away
+        assert cover_listener.attribute_updates == [(0x0008, 90), (0x8001, 1)]
+        assert cover_cluster.get("current_position_lift_percentage") == 60
+        updated = cover_cluster._attr_last_updated[0x0008]
+
+        await asyncio.sleep(0.03)
+        assert cover_listener.attribute_updates[2:] == [(0x0008, 60)]
+        assert cover_cluster._attr_last_updated[0x0008] > updated
+
+        await asyncio.sleep(0.03)
+        assert len(cover_listener.attribute_updates) == 3
+
+
+@pytest.mark.parametrize(
+    "quirk", (zhaquirks.tuya.ts0601_cover.TuyaZemismartSmartCover0601,)
+)
+async def test_cover_coalesced_position_cancelled(
+    zigpy_device_from_quirk, quirk, MockAppController
+):
+    """Test position updates held back are dropped with the cluster."""
+
+    cover_dev = zigpy_device_from_quirk(quirk)
+    tuya_cluster = cover_dev.endpoints[1].tuya_manufacturer
+    cover_cluster = cover_dev.endpoints[1].window_covering
+    cover_listener = ClusterListener(cover_cluster)
+
+    with mock.patch.object(type(cover_cluster), "coalesce_ms", 20):
+        for position in (10, 20):
+            tuya_cluster.handle_message(
+                *tuya_cluster.deserialize(cover_position_frame(position))
+            )
+        cover_cluster.cancel_coalesced_updates()
+        await asyncio.sleep(0.03)
+        assert cover_listener.attribute_updates == [(0x0008, 90)]
+
+        # the pending timer does not keep a removed device alive
+        for position in (30, 40):
+            tuya_cluster.handle_message(
+                *tuya_cluster.deserialize(cover_position_frame(position))
+            )
+        (handle,) = cover_cluster._coalesce_pending.values()
+        cluster_ref = weakref.ref(cover_cluster)
+        del MockAppController.devices[cover_dev.ieee]
+        del cover_dev, tuya_cluster, cover_cluster, cover_listener
+        gc.collect()
+        assert cluster_ref() is None
+        assert handle.cancelled()
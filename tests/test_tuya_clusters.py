@@ -14,6 +14,7 @@ from zhaquirks.tuya import (
     TuyaCommand,
     TuyaData,
     TuyaDatapointData,
+    TuyaDPType,
     TuyaNewManufCluster,
 )
 
@@ -206,6 +207,29 @@ def test_tuya_data_unknown():
         r.payload = 0
 
 
+def test_tuya_data_payload_cache():
+    """Test decoded tuya payload is cached until the raw data changes."""
+
+    r, _ = TuyaData.deserialize(b"\x02\x00\x04\x00\x00\x01\x02")
+    assert r.payload == 0x0102
+    assert r.payload is r.payload
+
+    r.payload = -5
+    assert r.raw == b"\xff\xff\xff\xfb"
+    assert r.payload == -5
+
+    r.dp_type = TuyaDPType.BITMAP
+    assert r.payload == t.bitmap32(0xFBFFFFFF)
+
+    with pytest.raises(ValueError):
+        r.dp_type = TuyaDPType.VALUE
+        r.payload = 0x80000000
+
+    r.raw = t.LVBytes(b"\x00\x01")
+    with pytest.raises(ValueError):
+        r.payload
+
+
 @pytest.mark.parametrize(
     "cmd_id, handler_name, args",
     (
@@ -291,3 +315,31 @@ def test_tuya_cluster_request_no_handler(default_rsp_mock, TuyaCluster):
 
     assert default_rsp_mock.call_count == 1
     assert default_rsp_mock.call_args[1]["status"] == zcl_f.Status.UNSUP_CLUSTER_COMMAND
+
+
+@mock.patch("zhaquirks.tuya.TuyaNewManufCluster.send_default_rsp")
+def test_tuya_cluster_request_unk_command_no_default_rsp(default_rsp_mock, TuyaCluster):
+    """Test unknown commands are dropped when no default response is expected."""
+
+    hdr = zcl_f.ZCLHeader.general(1, 0xFE, direction=zcl_f.Direction.Client_to_Server)
+    hdr.frame_control.disable_default_response = True
+
+    TuyaCluster.handle_cluster_request(hdr, (mock.sentinel.args,))
+    assert default_rsp_mock.call_count == 0
+
+
+def test_tuya_cluster_dp_handlers(TuyaCluster):
+    """Test datapoint handlers are bound once and unknown handlers are skipped."""
+
+    TuyaCluster.data_point_handlers = {1: "_dp_2_attr_update", 2: "no_such_handler"}
+
+    dp_handlers = TuyaCluster.dp_handlers
+    assert dp_handlers == {1: TuyaCluster._dp_2_attr_update}
+    assert TuyaCluster.dp_handlers is dp_handlers
+
+    command = TuyaCommand(
+        status=0,
+        tsn=2,
+        datapoints=[TuyaDatapointData(2, TuyaData(1, 0, b"\x01\x01"))],
+    )
+    assert TuyaCluster.handle_get_data(command) == zcl_f.Status.UNSUPPORTED_ATTRIBUTE
@@ -1,5 +1,6 @@
 """Tests for Tuya quirks."""
 
+import asyncio
 import datetime
 from unittest import mock
 
@@ -7,10 +8,19 @@ import pytest
 from zigpy.zcl import foundation
 
 import zhaquirks
-from zhaquirks.tuya import TUYA_MCU_VERSION_RSP, TUYA_SET_TIME, TuyaDPType
+from zhaquirks.tuya import (
+    TUYA_MCU_VERSION_RSP,
+    TUYA_SET_TIME,
+    TuyaCommand,
+    TuyaData,
+    TuyaDatapointData,
+    TuyaDPType,
+    TuyaTimeSync,
+)
 from zhaquirks.tuya.mcu import (
     ATTR_MCU_VERSION,
     TUYA_MCU_CONNECTION_STATUS,
+    DPToAttributeMapping,
     TuyaAttributesCluster,
     TuyaClusterData,
     TuyaMCUCluster,
@@ -376,3 +386,235 @@ async def test_tuya_mcu_classes():
         TuyaClusterData(manufacturer="xiaomi")
     with pytest.raises(ValueError):
         TuyaClusterData(manufacturer=b"")
+
+
+@pytest.mark.parametrize(
+    "quirk", (zhaquirks.tuya.ts0601_dimmer.TuyaDoubleSwitchDimmer,)
+)
+async def test_tuya_mcu_dp_targets(zigpy_device_from_quirk, quirk):
+    """Test datapoint target clusters are resolved once per cluster."""
+
+    tuya_device = zigpy_device_from_quirk(quirk)
+    tuya_cluster = tuya_device.endpoints[1].tuya_manufacturer
+    switch1_cluster = tuya_device.endpoints[1].on_off
+    switch2_cluster = tuya_device.endpoints[2].on_off
+
+    command = TuyaCommand(
+        status=0,
+        tsn=2,
+        datapoints=[
+            TuyaDatapointData(1, TuyaData(True)),
+            TuyaDatapointData(7, TuyaData(True)),
+        ],
+    )
+    assert tuya_cluster.handle_get_data(command) == foundation.Status.SUCCESS
+    assert switch1_cluster.get("on_off") == 1
+    assert switch2_cluster.get("on_off") == 1
+    assert tuya_cluster._dp_targets[1][1] is switch1_cluster
+    assert tuya_cluster._dp_targets[7][1] is switch2_cluster
+
+    dp_targets = dict(tuya_cluster._dp_targets)
+    command.datapoints = [TuyaDatapointData(7, TuyaData(False))]
+    assert tuya_cluster.handle_get_data(command) == foundation.Status.SUCCESS
+    assert switch2_cluster.get("on_off") == 0
+    assert tuya_cluster._dp_targets == dp_targets
+
+
+def _all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _all_subclasses(subclass)
+
+
+@pytest.mark.parametrize(
+    "cluster_class", sorted(set(_all_subclasses(TuyaMCUCluster)), key=repr)
+)
+def test_tuya_mcu_dp_index(cluster_class):
+    """Test the reverse data point index agrees with dp_to_attribute."""
+
+    def linear_scan(cluster, endpoint_id, attribute_name):
+        return {
+            dp: dp_mapping
+            for dp, dp_mapping in cluster.dp_to_attribute.items()
+            if (
+                attribute_name == dp_mapping.attribute_name
+                or (
+                    isinstance(dp_mapping.attribute_name, tuple)
+                    and attribute_name in dp_mapping.attribute_name
+                )
+            )
+            and (
+                (
+                    dp_mapping.endpoint_id is None
+                    and endpoint_id == cluster.endpoint.endpoint_id
+                )
+                or endpoint_id == dp_mapping.endpoint_id
+            )
+        }
+
+    source, _, positions = cluster_class._dp_index
+    assert source is cluster_class.dp_to_attribute
+    assert list(positions) == list(cluster_class.dp_to_attribute)
+
+    cluster = cluster_class.__new__(cluster_class)
+    cluster._endpoint = mock.Mock(endpoint_id=1)
+
+    attribute_names = {"not_mapped"}
+    endpoint_ids = {1, 2}
+    for dp_mapping in cluster_class.dp_to_attribute.values():
+        names = dp_mapping.attribute_name
+        attribute_names.update(names if isinstance(names, tuple) else (names,))
+        endpoint_ids.add(dp_mapping.endpoint_id)
+
+    for endpoint_id in endpoint_ids - {None}:
+        for attribute_name in attribute_names:
+            expected = linear_scan(cluster, endpoint_id, attribute_name)
+            result = cluster.get_dp_mapping(endpoint_id, attribute_name)
+            assert result == expected
+            assert list(result) == list(expected)
+
+
+def test_tuya_mcu_dp_index_rebuild():
+    """Test the reverse data point index follows a replaced dp_to_attribute."""
+
+    cluster = TuyaMCUCluster.__new__(TuyaMCUCluster)
+    cluster._endpoint = mock.Mock(endpoint_id=1)
+    assert cluster.get_dp_mapping(1, "on_off") == {}
+
+    mapping = DPToAttributeMapping("on_off", "on_off", endpoint_id=2)
+    cluster.dp_to_attribute = {3: mapping}
+    assert cluster.get_dp_mapping(1, "on_off") == {}
+    assert cluster.get_dp_mapping(2, "on_off") == {3: mapping}
+
+    # data points of the cluster's own endpoint are merged in declared order
+    own_mapping = DPToAttributeMapping("on_off", "on_off")
+    cluster.dp_to_attribute = {4: own_mapping, 2: mapping}
+    assert list(cluster.get_dp_mapping(2, "on_off")) == [2]
+
+    cluster._endpoint = mock.Mock(endpoint_id=2)
+    assert list(cluster.get_dp_mapping(2, "on_off")) == [4, 2]
+
+
+@pytest.mark.parametrize(
+    "quirk", (zhaquirks.tuya.ts0601_dimmer.TuyaDoubleSwitchDimmer,)
+)
+async def test_tuya_mcu_batched_writes(zigpy_device_from_quirk, quirk):
+    """Test datapoints written together are sent in a single set_data command."""
+
+    tuya_device = zigpy_device_from_quirk(quirk)
+    tuya_cluster = tuya_device.endpoints[1].tuya_manufacturer
+    level_cluster = tuya_device.endpoints[1].level
+
+    def cluster_data(endpoint_id, cluster_name, cluster_attr, attr_value):
+        return TuyaClusterData(
+            endpoint_id=endpoint_id,
+            cluster_name=cluster_name,
+            cluster_attr=cluster_attr,
+            attr_value=attr_value,
+            expect_reply=False,
+        )
+
+    def sent_datapoints(command_mock):
+        return [
+            [(dpd.dp, dpd.data.payload) for dpd in call.args[1].datapoints]
+            for call in command_mock.call_args_list
+        ]
+
+    # MCUs are not assumed to accept several datapoints by default
+    with mock.patch.object(tuya_cluster, "command") as m1:
+        tuya_cluster.tuya_mcu_command(cluster_data(1, "on_off", "on_off", 1))
+        tuya_cluster.tuya_mcu_command(cluster_data(2, "on_off", "on_off", 1))
+        await asyncio.sleep(0)
+        assert sent_datapoints(m1) == [[(1, 1)], [(7, 1)]]
+
+    tuya_cluster.mcu_multi_dp_set = True
+    with mock.patch.object(tuya_cluster, "command") as m1:
+        tuya_cluster.tuya_mcu_command(cluster_data(1, "on_off", "on_off", 1))
+        tuya_cluster.tuya_mcu_command(cluster_data(2, "on_off", "on_off", 1))
+        tuya_cluster.tuya_mcu_command(cluster_data(1, "on_off", "on_off", 0))
+        m1.assert_not_called()
+        assert tuya_device.endpoints[1].on_off.get("on_off") == 0
+
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert sent_datapoints(m1) == [[(7, 1), (1, 0)]]
+
+    with mock.patch.object(tuya_cluster, "command") as m1:
+        await level_cluster.write_attributes(
+            {"minimum_level": 51, "current_level": 255}
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert sent_datapoints(m1) == [[(3, 200), (2, 1000)]]
+
+    # datapoints are split when they would exceed the payload limit
+    tuya_cluster.mcu_write_max_payload = 2 + 3 * 8
+    with mock.patch.object(tuya_cluster, "command") as m1:
+        tuya_cluster.tuya_mcu_command(cluster_data(1, "on_off", "on_off", 1))
+        tuya_cluster.tuya_mcu_command(cluster_data(2, "on_off", "on_off", 1))
+        tuya_cluster.tuya_mcu_command(cluster_data(1, "level", "current_level", 255))
+        tuya_cluster.tuya_mcu_command(cluster_data(1, "level", "minimum_level", 51))
+        tuya_cluster.flush_datapoints()
+        await asyncio.sleep(0)
+        assert sent_datapoints(m1) == [[(1, 1), (7, 1), (2, 1000)], [(3, 200)]]
+
+
+def test_tuya_time_sync():
+    """Test set_time payloads are built from a cached clock."""
+
+    clock = mock.Mock(return_value=100.0)
+    time_sync = TuyaTimeSync(clock)
+
+    with mock.patch("datetime.datetime", MockDatetime):
+        assert time_sync.payload(1970) == [0, 0, 28, 32, 0, 0, 14, 16]
+        assert time_sync.payload(1970, 1969) == [0, 0, 28, 32, 1, 225, 65, 144]
+
+        # later payloads advance with the clock
+        clock.return_value = 110.5
+        with mock.patch.object(MockDatetime, "utcnow", side_effect=AssertionError):
+            assert time_sync.payload(1970) == [0, 0, 28, 42, 0, 0, 14, 26]
+
+        # a clock going back, such as another event loop's, is read again
+        clock.return_value = 50.0
+        assert time_sync.payload(1970) == [0, 0, 28, 32, 0, 0, 14, 16]
+
+
+@pytest.mark.parametrize(
+    "quirk", (zhaquirks.tuya.ts0601_dimmer.TuyaDoubleSwitchDimmer,)
+)
+async def test_tuya_mcu_set_time_window(zigpy_device_from_quirk, quirk):
+    """Test set_time requests are answered once per window, per device."""
+
+    clock = mock.Mock(return_value=100.0)
+    time_sync = TuyaTimeSync(clock)
+    clusters = [
+        zigpy_device_from_quirk(quirk).endpoints[1].tuya_manufacturer for _ in range(2)
+    ]
+    hdr, args = clusters[0].deserialize(ZCL_TUYA_SET_TIME)
+
+    with mock.patch.object(
+        TuyaAttributesCluster, "command", new_callable=mock.AsyncMock
+    ) as m1, mock.patch.object(TuyaMCUCluster, "time_sync", time_sync):
+        for cluster in clusters:
+            cluster.handle_message(hdr, args)
+        # a second request while the first answer is being sent
+        clusters[0].handle_message(hdr, args)
+        await asyncio.sleep(0)
+        assert m1.await_count == 2
+
+        clock.return_value += TuyaMCUCluster.set_time_window_s - 1
+        clusters[0].handle_message(hdr, args)
+        await asyncio.sleep(0)
+        assert m1.await_count == 2
+
+        # an answer which could not be sent does not count
+        clock.return_value += 1
+        m1.side_effect = asyncio.TimeoutError
+        clusters[0].handle_message(hdr, args)
+        await asyncio.sleep(0)
+        assert m1.await_count == 3
+
+        m1.side_effect = None
+        clusters[0].handle_message(hdr, args)
+        await asyncio.sleep(0)
+        assert m1.await_count == 4
@@ -1,5 +1,6 @@
 """Test XBee device."""
 
+import asyncio
 from unittest import mock
 
 import pytest
@@ -191,6 +192,83 @@ async def test_receive_serial_data(zigpy_device_from_quirk):
     )
 
 
+async def test_serial_stream(zigpy_device_from_quirk):
+    """Test writing and reading serial data as a stream."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    xbee3_device.application.request.reset_mock()
+    sent = asyncio.Event()
+
+    async def request(*args, **kwargs):
+        await sent.wait()
+        return foundation.Status.SUCCESS, None
+
+    xbee3_device.application.request.configure_mock(side_effect=request)
+
+    stream = xbee3_device.open_serial_stream(max_payload=4, queue_size=2)
+    stream.write(b"\x01\x03\x00\x00\x00\x0a\xc5\xcd")
+    await stream.drain()
+    stream.write(b"\x01\x03")
+    drain = asyncio.create_task(stream.drain())
+    await asyncio.sleep(0)
+    assert not drain.done()
+
+    sent.set()
+    await drain
+    stream.close()
+    await stream.wait_closed()
+    xbee3_device.application.request.configure_mock(side_effect=None)
+
+    assert [c.args[6] for c in xbee3_device.application.request.call_args_list] == [
+        b"\x01\x03\x00\x00",
+        b"\x00\x0a\xc5\xcd",
+        b"\x01\x03",
+    ]
+
+    stream = xbee3_device.open_serial_stream()
+    for frame in (b"\x01\x03\x14", b"\x00\x01", b"\x00\x02\x00"):
+        xbee3_device.handle_message(
+            XBEE_PROFILE_ID,
+            XBEE_DATA_CLUSTER,
+            XBEE_DATA_ENDPOINT,
+            XBEE_DATA_ENDPOINT,
+            frame,
+        )
+    assert await stream.readexactly(3) == b"\x01\x03\x14"
+    assert await stream.readexactly(4) == b"\x00\x01\x00\x02"
+    assert stream.counters == {
+        "bytes_sent": 0,
+        "frames_sent": 0,
+        "bytes_received": 8,
+        "frames_received": 3,
+    }
+    stream.close()
+    assert await stream.read() == b"\x00"
+
+
+async def test_serial_stream_failure(zigpy_device_from_quirk):
+    """Test a failed serial data frame is raised by the stream."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    xbee3_device.application.request.reset_mock()
+    xbee3_device.application.request.return_value = (
+        foundation.Status.FAILURE,
+        None,
+    )
+
+    stream = xbee3_device.open_serial_stream()
+    stream.write(b"data")
+    with pytest.raises(RuntimeError):
+        await stream.wait_closed()
+    with pytest.raises(RuntimeError):
+        stream.write(b"data")
+
+    xbee3_device.application.request.return_value = (
+        foundation.Status.SUCCESS,
+        None,
+    )
+
+
 @pytest.mark.parametrize(
     "command_id, request_value, request_data, response_data, response_command, response_value",
     (
@@ -502,6 +580,81 @@ async def test_remote_at_tx_failure(zigpy_device_from_quirk):
     xbee3_device.application.request.configure_mock(side_effect=None)
 
 
+async def test_remote_at_pipeline(zigpy_device_from_quirk):
+    """Test remote AT commands are pipelined within the in-flight window."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    at_cluster = xbee3_device.endpoints[XBEE_AT_ENDPOINT].out_clusters[
+        XBEE_AT_REQUEST_CLUSTER
+    ]
+    at_cluster.at_command_window = 2
+    xbee3_device.application.request.reset_mock()
+
+    def sent_frames():
+        return [
+            (c.args[6][3], c.args[6][14:16])
+            for c in xbee3_device.application.request.call_args_list
+        ]
+
+    def respond(frame_id, cmd, value):
+        xbee3_device.handle_message(
+            XBEE_PROFILE_ID,
+            XBEE_AT_RESPONSE_CLUSTER,
+            XBEE_AT_ENDPOINT,
+            XBEE_AT_ENDPOINT,
+            bytes([frame_id]) + cmd + b"\x00" + bytes([value]),
+        )
+
+    batch = asyncio.create_task(
+        xbee3_device.remote_at_commands([("P0",), ("P1",), ("P2", 5)])
+    )
+    await asyncio.sleep(0.01)
+    assert sent_frames() == [(1, b"P0"), (2, b"P1")]
+
+    respond(2, b"P1", 4)
+    await asyncio.sleep(0.01)
+    assert sent_frames()[2:] == [(3, b"P2")]
+
+    # unknown frame ids are ignored
+    respond(9, b"P0", 0)
+    respond(1, b"P0", 1)
+    respond(3, b"P2", 5)
+    assert await batch == [1, 4, 5]
+    await asyncio.sleep(0.01)
+    assert (
+        not xbee3_device.endpoints[XBEE_AT_ENDPOINT]
+        .in_clusters[XBEE_AT_RESPONSE_CLUSTER]
+        .awaiting
+    )
+
+
+async def test_remote_at_timeout(zigpy_device_from_quirk):
+    """Test timed out remote AT commands free their frame id."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+    at_cluster = xbee3_device.endpoints[XBEE_AT_ENDPOINT].out_clusters[
+        XBEE_AT_REQUEST_CLUSTER
+    ]
+
+    with mock.patch("zhaquirks.xbee.REMOTE_AT_COMMAND_TIMEOUT", 0.01), pytest.raises(
+        asyncio.TimeoutError
+    ):
+        await at_cluster.remote_at_command("TP")
+
+    assert (
+        not xbee3_device.endpoints[XBEE_AT_ENDPOINT]
+        .in_clusters[XBEE_AT_RESPONSE_CLUSTER]
+        .awaiting
+    )
+
+    # a frame id still waiting for its response is skipped
+    at_cluster._seq = 255
+    xbee3_device.endpoints[XBEE_AT_ENDPOINT].in_clusters[
+        XBEE_AT_RESPONSE_CLUSTER
+    ].save_at_request(255, asyncio.Future())
+    assert at_cluster._next_frame_id() == 1
+
+
 async def test_io_sample_report(zigpy_device_from_quirk):
     """Test DigitalIOCluster cluster."""
 
@@ -544,6 +697,35 @@ async def test_io_sample_report(zigpy_device_from_quirk):
     assert analog_listeners[4].attribute_updates[0] == (0x0055, 3.305)
 
 
+async def test_io_sample_stream(zigpy_device_from_quirk):
+    """Test a stream of IO samples only pushes the pins that changed."""
+
+    xbee3_device = zigpy_device_from_quirk(XBee3Sensor)
+
+    d0_listener = ClusterListener(xbee3_device.endpoints[0xD0].on_off)
+    d1_listener = ClusterListener(xbee3_device.endpoints[0xD1].on_off)
+    a0_listener = ClusterListener(xbee3_device.endpoints[0xD0].analog_input)
+
+    # DIO0 toggles on every sample, DIO1 stays high and AD0 reads 341 then 682
+    for sample in range(20):
+        xbee3_device.handle_message(
+            XBEE_PROFILE_ID,
+            XBEE_IO_CLUSTER,
+            XBEE_DATA_ENDPOINT,
+            XBEE_DATA_ENDPOINT,
+            b"\x01\x00\x03\x01\x00"
+            + bytes([2 | sample % 2])
+            + (b"\x01\x55" if sample < 10 else b"\x02\xaa"),
+        )
+
+    assert d0_listener.attribute_updates == [(0x0000, i % 2) for i in range(20)]
+    assert d1_listener.attribute_updates == [(0x0000, 1)]
+    assert [value for _, value in a0_listener.attribute_updates] == [
+        341 / 10.23,
+        682 / 10.23,
+    ]
+
+
 async def test_io_sample_report_on_at_response(zigpy_device_from_quirk):
     """Test update samples on non-native IS command response."""
 
@@ -1,5 +1,6 @@
 """Tests for xiaomi."""
 import asyncio
+import logging
 from unittest import mock
 
 import pytest
@@ -959,3 +960,117 @@ async def test_xiaomi_e1_thermostat_attribute_update(zigpy_device_from_quirk, qu
     assert len(power_config_listener.attribute_updates) == 1
     assert power_config_listener.attribute_updates[0][0] == zcl_battery_percentage_id
     assert power_config_listener.attribute_updates[0][1] == 100  # ZCL is doubled
+
+
+@pytest.mark.parametrize("repeat", (1, 5, 30))
+def test_attribute_parsing_ambiguous(repeat, caplog):
+    """Test ambiguous Xiaomi attribute reports are parsed in linear time."""
+
+    cluster = BasicCluster(mock.MagicMock())
+    # Every empty string can also swallow the first byte of the next attribute
+    data = b"\x01\xffB\x00" * repeat + b"\x00"
+
+    with mock.patch.object(
+        cluster,
+        "_iter_parse_attr_report",
+        wraps=cluster._iter_parse_attr_report,
+    ) as parse_mock:
+        memo = {}
+        attrs = cluster._interpret_attr_reports(data, memo)
+        assert parse_mock.call_count <= len(data)
+
+        count = cluster._count_attr_report_interpretations(data, memo)
+        assert parse_mock.call_count <= len(data)
+
+    # Only the last string can take the trailing byte
+    assert [attr.attrid for attr in attrs] == [0xFF01] * repeat
+    assert [attr.value.value for attr in attrs] == [b""] * (repeat - 1) + [b"\x00"]
+
+    # The number of interpretations follows the Fibonacci sequence
+    fib = [1, 1]
+    while len(fib) <= repeat:
+        fib.append(fib[-1] + fib[-2])
+    assert count == fib[repeat - 1]
+
+    hdr = foundation.ZCLHeader.general(
+        tsn=1, command_id=foundation.GeneralCommand.Report_Attributes
+    )
+    with caplog.at_level(logging.DEBUG):
+        _, reports = cluster.deserialize(hdr.serialize() + data)
+    assert reports.attribute_reports == attrs
+    assert ("valid interpretations" in caplog.text) == (count > 1)
+
+
+@pytest.mark.parametrize(
+    "model, expected",
+    (
+        (
+            "lumi.weather",
+            {
+                "battery_voltage_mV": 3000,
+                "temperature_measurement": 2150,
+                "humidity_measurement": 4500,
+                "pressure_measurement": 100000,
+            },
+        ),
+        (
+            "lumi.airmonitor.acn01",
+            {
+                "battery_voltage_mV": 3000,
+                "temperature_measurement": 2150,
+                "humidity_measurement": 4500,
+                "tvoc_measurement": 100000,
+            },
+        ),
+        (
+            "lumi.unknown",
+            {
+                "battery_voltage_mV": 3000,
+                "0xff01-100": 2150,
+                "0xff01-101": 4500,
+                "0xff01-102": 100000,
+            },
+        ),
+    ),
+)
+def test_aqara_attribute_names(model, expected):
+    """Test 0xFF01 keys are named from the table of the device model."""
+
+    cluster = BasicCluster(mock.MagicMock())
+    cluster.endpoint.device.model = model
+
+    value = (
+        b"\x01" + foundation.TypeValue(type=0x21, value=t.uint16_t(3000)).serialize()
+    )
+    value += b"d" + foundation.TypeValue(type=0x29, value=t.int16s(2150)).serialize()
+    value += b"e" + foundation.TypeValue(type=0x21, value=t.uint16_t(4500)).serialize()
+    value += b"f" + foundation.TypeValue(type=0x2B, value=t.int32s(100000)).serialize()
+
+    assert cluster._parse_aqara_attributes(value + b"\x00") == expected
+
+
+@pytest.mark.parametrize("quirk", (zhaquirks.xiaomi.aqara.plug_eu.PlugMAEU01,))
+async def test_xiaomi_eu_plug_power_dedupe(zigpy_device_from_quirk, quirk):
+    """Test unchanged power reports only refresh the attribute cache."""
+
+    device = zigpy_device_from_quirk(quirk)
+
+    em_cluster = device.endpoints[1].electrical_measurement
+    em_listener = ClusterListener(em_cluster)
+    voltage_bus = em_cluster.endpoint.device.voltage_bus
+
+    for voltage in (230, 230, 230, 231):
+        voltage_bus.listener_event(VOLTAGE_REPORTED, voltage)
+    assert em_listener.attribute_updates == [(1285, 230), (1285, 231)]
+
+    with mock.patch.object(em_cluster, "report_deadbands", {1285: 2}):
+        voltage_bus.listener_event(VOLTAGE_REPORTED, 233)
+        assert em_cluster.get("rms_voltage") == 233
+        voltage_bus.listener_event(VOLTAGE_REPORTED, 234)
+
+        with mock.patch.object(em_cluster, "report_max_silence_s", 0):
+            voltage_bus.listener_event(VOLTAGE_REPORTED, 234)
+
+    assert em_listener.attribute_updates[2:] == [(1285, 234), (1285, 234)]
+    # updates sent when the cluster was created are counted too
+    assert em_cluster.report_counts == {"forwarded": 7, "suppressed": 3}
@@ -2,14 +2,20 @@
 from __future__ import annotations
 
 import asyncio
+import datetime
+import functools
 import importlib
 import logging
 import pathlib
 import pkgutil
+import time
+import types
 from typing import Any
+import weakref
 
 import zigpy.device
 import zigpy.endpoint
+import zigpy.quirks
 from zigpy.quirks import CustomCluster, CustomDevice
 import zigpy.types as t
 from zigpy.util import ListenableMixin
@@ -43,20 +49,326 @@ from .const import (
     ZHA_SEND_EVENT,
     ZONE_STATUS_CHANGE_COMMAND,
 )
+from .timer_wheel import get_timer_wheel
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def loop_time() -> float:
+    """Return the time of the running event loop, the monotonic clock outside of one.
+
+    Replays advance the clock of their event loop, timestamps taken with it
+    follow the replayed time.
+    """
+    try:
+        return asyncio.get_running_loop().time()
+    except RuntimeError:
+        return time.monotonic()
+
+
 class Bus(ListenableMixin):
-    """Event bus implementation."""
+    """Event bus implementation.
+
+    The handlers of an event are looked up on the listeners the first time it
+    is dispatched and reused until a listener is added or removed. Listeners
+    added with `weak=True` are dropped once nothing else references them.
+    """
 
     def __init__(self, *args, **kwargs):
         """Init event bus."""
         super().__init__(*args, **kwargs)
         self._listeners = {}
+        # event name -> [(handler, weak handler, include context), ...], count
+        self._handlers: dict[str, list] = {}
+        self._dispatch_counts: dict[str, int] = {}
+
+    @property
+    def dispatch_counts(self) -> dict[str, int]:
+        """Number of events dispatched, by event name."""
+        counts = dict(self._dispatch_counts)
+        for method_name, (_, count) in self._handlers.items():
+            counts[method_name] = counts.get(method_name, 0) + count
+        return counts
+
+    def _invalidate(self) -> None:
+        """Drop the resolved handlers, keeping their dispatch counts."""
+        self._dispatch_counts = self.dispatch_counts
+        self._handlers = {}
+
+    def _add_listener(
+        self, listener: Any, include_context: bool, weak: bool = False
+    ) -> int:
+        id_ = id(listener)
+        while id_ in self._listeners:
+            id_ += 1
+
+        if weak:
+            bus_ref = weakref.ref(self)
+
+            def forget(_: weakref.ref) -> None:
+                bus = bus_ref()
+                if bus is not None:
+                    bus._listeners.pop(id_, None)  # pylint: disable=W0212
+                    bus._invalidate()  # pylint: disable=W0212
+
+            listener = weakref.ref(listener, forget)
+
+        self._listeners[id_] = (listener, include_context, weak)
+        self._invalidate()
+        return id_
+
+    def add_listener(self, listener: Any, weak: bool = False) -> int:
+        """Add a listener, only weakly referenced if `weak` is set."""
+        return self._add_listener(listener, include_context=False, weak=weak)
+
+    def add_context_listener(self, listener: Any, weak: bool = False) -> int:
+        """Add a listener receiving the bus as first argument."""
+        return self._add_listener(listener, include_context=True, weak=weak)
+
+    def remove_listener(self, listener: Any) -> None:
+        """Remove a listener."""
+        for id_, (attached, _, weak) in self._listeners.items():
+            if (attached() if weak else attached) is listener:
+                del self._listeners[id_]
+                self._invalidate()
+                break
+
+    def _compile(self, method_name: str) -> list:
+        """Resolve the handlers of an event on the current listeners."""
+        handlers = []
+        for ref, include_context, weak in self._listeners.values():
+            listener = ref() if weak else ref
+            method = getattr(listener, method_name, None)
+            if not method:
+                continue
+            if not weak:
+                handlers.append((method, None, include_context))
+            elif isinstance(method, types.MethodType):
+                handlers.append((None, weakref.WeakMethod(method), include_context))
+            else:
+                # not bound to the listener, look it up again on every dispatch
+                handlers.append(
+                    (
+                        None,
+                        functools.partial(_weak_attribute, ref, method_name),
+                        include_context,
+                    )
+                )
+
+        compiled = self._handlers[method_name] = [tuple(handlers), 0]
+        return compiled
+
+    def _dispatch(self, method_name: str) -> tuple:
+        """Return the handlers of an event, counting it as dispatched."""
+        compiled = self._handlers.get(method_name)
+        if compiled is None:
+            compiled = self._compile(method_name)
+        compiled[1] += 1
+        return compiled[0]
+
+    def listener_event(self, method_name: str, *args) -> list[Any | None]:
+        """Call the `method_name` handler of every listener."""
+
+        result = []
+        for method, weak_method, include_context in self._dispatch(method_name):
+            if weak_method is not None:
+                method = weak_method()
+                if method is None:
+                    continue
+
+            try:
+                if include_context:
+                    result.append(method(self, *args))
+                else:
+                    result.append(method(*args))
+            except Exception as e:  # pylint: disable=broad-except
+                _LOGGER.warning(
+                    "Error calling listener %r with args %r: %r", method, args, e
+                )
+                _LOGGER.debug(
+                    "Error calling listener %r with args %r", method, args, exc_info=e
+                )
+        return result
+
+    async def async_event(self, method_name: str, *args) -> list[Any]:
+        """Call and await the `method_name` coroutine of every listener."""
+        methods = []
+        tasks = []
+        for method, weak_method, include_context in self._dispatch(method_name):
+            if weak_method is not None:
+                method = weak_method()
+                if method is None:
+                    continue
+
+            methods.append(method)
+            if include_context:
+                tasks.append(method(self, *args))
+            else:
+                tasks.append(method(*args))
+
+        results = []
+        for method, result in zip(
+            methods, await asyncio.gather(*tasks, return_exceptions=True)
+        ):
+            if isinstance(result, Exception):
+                _LOGGER.warning(
+                    "Error calling listener %r with args %r: %r", method, args, result
+                )
+                _LOGGER.debug(
+                    "Error calling listener %r with args %r",
+                    method,
+                    args,
+                    exc_info=result,
+                )
+            else:
+                results.append(result)
+        return results
+
+
+def _weak_attribute(ref: weakref.ref, name: str) -> Any:
+    """Return the attribute of a weakly referenced listener, None once it is gone."""
+    return getattr(ref(), name, None)
+
+
+class CoalescingMixin:
+    """Rate limit attribute update events of a cluster.
+
+    Attribute values are cached right away, but `attribute_updated` is sent at
+    most once every `coalesce_ms` milliseconds per attribute. The last value
+    received in a window is always sent at its end. Disabled unless a quirk
+    sets `coalesce_ms`, optionally limited to `coalesce_attributes`. Pending
+    updates are dropped with the cluster, when its device goes away.
+    """
+
+    coalesce_ms: int = 0
+    coalesce_attributes: frozenset[int] | None = None
 
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._coalesce_sent: dict[int, float] = {}
+        self._coalesce_pending: dict[int, asyncio.TimerHandle] = {}
+        self._coalesce_finalizer: weakref.finalize | None = None
+
+    def _update_attribute(self, attrid, value):
+        if not self.coalesce_ms or (
+            self.coalesce_attributes is not None
+            and attrid not in self.coalesce_attributes
+        ):
+            super()._update_attribute(attrid, value)
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            super()._update_attribute(attrid, value)
+            return
+
+        now = loop.time()
+        due = self._coalesce_sent.get(attrid, -float("inf")) + self.coalesce_ms / 1000
+        if attrid not in self._coalesce_pending and now >= due:
+            self._coalesce_sent[attrid] = now
+            super()._update_attribute(attrid, value)
+            return
+
+        self._attr_cache[attrid] = value
+        self._attr_last_updated[attrid] = datetime.datetime.now(datetime.timezone.utc)
+        if attrid not in self._coalesce_pending:
+            if self._coalesce_finalizer is None:
+                # the timers only reference the cluster weakly
+                self._coalesce_finalizer = weakref.finalize(
+                    self, _cancel_timers, self._coalesce_pending
+                )
+            self._coalesce_pending[attrid] = loop.call_at(
+                due, _flush_coalesced, weakref.ref(self), attrid
+            )
+
+    def _flush_attribute(self, attrid):
+        """Send the last update of an attribute held back by coalescing."""
+        del self._coalesce_pending[attrid]
+        self._coalesce_sent[attrid] = asyncio.get_running_loop().time()
+        super()._update_attribute(attrid, self._attr_cache[attrid])
+
+    def cancel_coalesced_updates(self) -> None:
+        """Drop the attribute updates held back by coalescing, without sending them."""
+        _cancel_timers(self._coalesce_pending)
+
+
+def _flush_coalesced(ref: weakref.ref, attrid: int) -> None:
+    cluster = ref()
+    if cluster is not None:
+        cluster._flush_attribute(attrid)  # pylint: disable=W0212
+
+
+def _cancel_timers(timers: dict[Any, asyncio.TimerHandle]) -> None:
+    for handle in timers.values():
+        handle.cancel()
+    timers.clear()
+
+
+class ReportFilterMixin:
+    """Drop attribute update events of values that did not change.
+
+    Attributes in `report_deadbands` only send `attribute_updated` when their
+    value moved by more than the deadband since it was last sent, 0 filters
+    identical values only. The attribute cache is still refreshed, and a
+    value is sent anyway after `report_max_silence_s` seconds without one.
+    """
 
-class LocalDataCluster(CustomCluster):
+    report_deadbands: dict[int, float] = {}
+    report_max_silence_s: float = 300
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._report_sent: dict[int, tuple[Any, float]] = {}
+        self._reports_forwarded = 0
+        self._reports_suppressed = 0
+
+    @property
+    def report_counts(self) -> dict[str, int]:
+        """Number of attribute updates forwarded and suppressed."""
+        return {
+            "forwarded": self._reports_forwarded,
+            "suppressed": self._reports_suppressed,
+        }
+
+    def _update_attribute(self, attrid, value):
+        deadband = self.report_deadbands.get(attrid)
+        if deadband is None:
+            super()._update_attribute(attrid, value)
+            return
+
+        now = loop_time()
+        sent = self._report_sent.get(attrid)
+        if (
+            sent is not None
+            and now - sent[1] < self.report_max_silence_s
+            and _within_deadband(sent[0], value, deadband)
+        ):
+            self._reports_suppressed += 1
+            self._attr_cache[attrid] = value
+            self._attr_last_updated[attrid] = datetime.datetime.now(
+                datetime.timezone.utc
+            )
+            return
+
+        self._reports_forwarded += 1
+        self._report_sent[attrid] = (value, now)
+        super()._update_attribute(attrid, value)
+
+
+def _within_deadband(sent: Any, value: Any, deadband: float) -> bool:
+    """Return whether value is within the deadband of the value last sent."""
+    if value == sent:
+        return True
+    try:
+        return abs(value - sent) <= deadband
+    except TypeError:
+        return False
+
+
+class LocalDataCluster(CoalescingMixin, CustomCluster):
     """Cluster meant to prevent remote calls."""
 
     _CONSTANT_ATTRIBUTES = {}
@@ -237,10 +549,12 @@ class _Motion(CustomCluster, IasZone):
         """Init."""
         super().__init__(*args, **kwargs)
         self._loop = asyncio.get_running_loop()
-        self._timer_handle = None
+
+    def _schedule_reset(self):
+        """(Re)start the reset countdown."""
+        get_timer_wheel(self._loop).schedule(self, self.reset_s, self._turn_off)
 
     def _turn_off(self):
-        self._timer_handle = None
         self.debug("%s - Resetting motion sensor", self.endpoint.device.ieee)
         self.listener_event(
             CLUSTER_COMMAND, 253, ZONE_STATUS_CHANGE_COMMAND, [OFF, 0, 0, 0]
@@ -266,9 +580,7 @@ class MotionWithReset(_Motion):
         """Handle the cluster command."""
         # check if the command is for a zone status change of ZoneStatus.Alarm_1 or ZoneStatus.Alarm_2
         if hdr.command_id == ZONE_STATUS_CHANGE_COMMAND and args[0] & 3:
-            if self._timer_handle:
-                self._timer_handle.cancel()
-            self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+            self._schedule_reset()
             if self.send_occupancy_event:
                 self.endpoint.device.occupancy_bus.listener_event(OCCUPANCY_EVENT)
 
@@ -291,10 +603,7 @@ class MotionOnEvent(_Motion):
 
         self.debug("%s - Received motion event message", self.endpoint.device.ieee)
 
-        if self._timer_handle:
-            self._timer_handle.cancel()
-
-        self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+        self._schedule_reset()
 
 
 class _Occupancy(CustomCluster, OccupancySensing):
@@ -305,11 +614,13 @@ class _Occupancy(CustomCluster, OccupancySensing):
     def __init__(self, *args, **kwargs):
         """Init."""
         super().__init__(*args, **kwargs)
-        self._timer_handle = None
         self._loop = asyncio.get_running_loop()
 
+    def _schedule_reset(self):
+        """(Re)start the reset countdown."""
+        get_timer_wheel(self._loop).schedule(self, self.reset_s, self._turn_off)
+
     def _turn_off(self):
-        self._timer_handle = None
         self._update_attribute(OCCUPANCY_STATE, OFF)
 
 
@@ -325,10 +636,7 @@ class OccupancyOnEvent(_Occupancy):
         """Occupancy event."""
         self._update_attribute(OCCUPANCY_STATE, ON)
 
-        if self._timer_handle:
-            self._timer_handle.cancel()
-
-        self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+        self._schedule_reset()
 
 
 class OccupancyWithReset(_Occupancy):
@@ -338,10 +646,8 @@ class OccupancyWithReset(_Occupancy):
         super()._update_attribute(attrid, value)
 
         if attrid == OCCUPANCY_STATE and value == ON:
-            if self._timer_handle:
-                self._timer_handle.cancel()
             self.endpoint.device.motion_bus.listener_event(MOTION_EVENT)
-            self._timer_handle = self._loop.call_later(self.reset_s, self._turn_off)
+            self._schedule_reset()
 
 
 class QuickInitDevice(CustomDevice):
@@ -428,16 +734,69 @@ class NoReplyMixin:
         return rsp
 
 
-def setup(custom_quirks_path: str | None = None) -> None:
-    """Register all quirks with zigpy, including optional custom quirks."""
+def _setup_lazy() -> bool:
+    """Register quirks from the prebuilt index, importing them on demand."""
+    # pylint: disable=import-outside-toplevel
+    from .quirk_index import QUIRK_INDEX_FORMAT, LazyQuirkLoader
+    from .quirk_index_data import QUIRK_INDEX, QUIRK_INDEX_FORMAT as DATA_FORMAT
+
+    if DATA_FORMAT != QUIRK_INDEX_FORMAT:
+        _LOGGER.warning(
+            "Quirk index format %s is not supported (expected %s),"
+            " importing all quirks",
+            DATA_FORMAT,
+            QUIRK_INDEX_FORMAT,
+        )
+        return False
+
+    registry = zigpy.quirks._DEVICE_REGISTRY  # pylint: disable=W0212
+    if LazyQuirkLoader.is_installed(registry):
+        return True
+
+    loader = LazyQuirkLoader(registry, QUIRK_INDEX)
+    loader.install()
+
+    # Vendor packages may register handlers with zigpy when imported
+    with loader.loading():
+        for _importer, modname, ispkg in pkgutil.iter_modules(
+            path=__path__,
+            prefix=__name__ + ".",
+        ):
+            if ispkg:
+                _LOGGER.debug("Loading quirks package %r", modname)
+                importlib.import_module(modname)
+
+    return True
+
+
+def _setup_signature_index() -> None:
+    """Match devices to quirks through a `SignatureIndex` of zigpy's registry."""
+    # pylint: disable=import-outside-toplevel
+    from .signature_index import SignatureIndex
+
+    registry = zigpy.quirks._DEVICE_REGISTRY  # pylint: disable=W0212
+    if not SignatureIndex.is_installed(registry):
+        SignatureIndex(registry).install()
+
+
+def setup(custom_quirks_path: str | None = None, *, lazy: bool = False) -> None:
+    """Register all quirks with zigpy, including optional custom quirks.
+
+    With `lazy`, quirk modules are only imported once zigpy looks up a
+    (manufacturer, model) pair they are indexed for in `quirk_index_data`.
+    Devices are matched to quirks through a `SignatureIndex`.
+    """
 
     # Import all quirks in the `zhaquirks` package first
-    for _importer, modname, _ispkg in pkgutil.walk_packages(
-        path=__path__,
-        prefix=__name__ + ".",
-    ):
-        _LOGGER.debug("Loading quirks module %r", modname)
-        importlib.import_module(modname)
+    if not lazy or not _setup_lazy():
+        for _importer, modname, _ispkg in pkgutil.walk_packages(
+            path=__path__,
+            prefix=__name__ + ".",
+        ):
+            _LOGGER.debug("Loading quirks module %r", modname)
+            importlib.import_module(modname)
+
+    _setup_signature_index()
 
     if custom_quirks_path is None:
         return
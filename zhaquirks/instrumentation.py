@@ -0,0 +1,148 @@
+"""Opt-in call counts and timings of the hot paths of quirk clusters."""
+from __future__ import annotations
+
+import dataclasses
+import functools
+import inspect
+import time
+from typing import Any, Callable, Iterable
+
+from zhaquirks import EventableCluster, LocalDataCluster
+from zhaquirks.tuya import TuyaManufCluster, TuyaNewManufCluster
+from zhaquirks.xiaomi import XiaomiCluster
+
+CLUSTERS = (
+    EventableCluster,
+    LocalDataCluster,
+    XiaomiCluster,
+    TuyaNewManufCluster,
+    TuyaManufCluster,
+)
+METHODS = (
+    "handle_cluster_request",
+    "_update_attribute",
+    "deserialize",
+    "listener_event",
+)
+
+# (cluster class, device model, method) -> [calls, total ns]
+_stats: dict[tuple[str, str | None, str], list[int]] = {}
+# (id of the cluster, method) of the calls being timed
+_active: set[tuple[int, str]] = set()
+# (class, method, original function) of the installed wrappers
+_patched: list[tuple[type, str, Any]] = []
+
+
+@dataclasses.dataclass(frozen=True)
+class HotPathStats:
+    """Calls of a method of a cluster class on devices of a model."""
+
+    cluster: str
+    model: str | None
+    method: str
+    calls: int
+    total_s: float
+
+    @property
+    def mean_us(self) -> float:
+        """Mean duration of a call in microseconds."""
+        return self.total_s / self.calls * 1e6 if self.calls else 0.0
+
+
+def _instrument(name: str, func: Callable, clusters: tuple[type, ...]) -> Callable:
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (id(self), name)
+        # only time the outermost call, not the super() calls it makes
+        if key in _active or not isinstance(self, clusters):
+            return func(self, *args, **kwargs)
+
+        _active.add(key)
+        start = time.perf_counter_ns()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            _active.discard(key)
+            device = getattr(self._endpoint, "device", None)
+            stats_key = (
+                type(self).__qualname__,
+                getattr(device, "model", None),
+                name,
+            )
+            stats = _stats.get(stats_key)
+            if stats is None:
+                stats = _stats[stats_key] = [0, 0]
+            stats[0] += 1
+            stats[1] += elapsed
+
+    return wrapper
+
+
+def _subclasses(roots: Iterable[type]) -> list[type]:
+    classes = set()
+    pending = list(roots)
+    while pending:
+        cls = pending.pop()
+        if cls in classes:
+            continue
+        classes.add(cls)
+        pending.extend(cls.__subclasses__())
+    # base classes first, so subclasses see their wrapped methods
+    return sorted(classes, key=lambda cls: len(cls.__mro__))
+
+
+def is_enabled() -> bool:
+    """Return whether the hot paths are instrumented."""
+    return bool(_patched)
+
+
+def enable(clusters: Iterable[type] = CLUSTERS) -> None:
+    """Count and time the hot path methods of clusters and their subclasses.
+
+    Methods are wrapped in place, in the classes defining them, so nothing is
+    measured, or slowed down, while disabled. Mixins and zigpy base classes
+    defining them are wrapped too, only timing calls on instances of
+    clusters. Quirks should be loaded first: methods of subclasses defined
+    later are not instrumented.
+    """
+    if _patched:
+        return
+
+    clusters = tuple(clusters)
+    owners = {}
+    for cls in _subclasses(clusters):
+        for name in METHODS:
+            owner = next((c for c in cls.__mro__ if name in c.__dict__), None)
+            if owner is not None:
+                owners[owner, name] = owner.__dict__[name]
+
+    for (owner, name), original in owners.items():
+        if inspect.isfunction(original):
+            setattr(owner, name, _instrument(name, original, clusters))
+            _patched.append((owner, name, original))
+
+
+def disable() -> None:
+    """Restore the methods, keeping the stats collected so far."""
+    while _patched:
+        cls, name, original = _patched.pop()
+        setattr(cls, name, original)
+
+
+def reset() -> None:
+    """Clear the collected stats."""
+    _stats.clear()
+
+
+def snapshot(top: int | None = None) -> list[HotPathStats]:
+    """Return the stats of the methods which took the most time first."""
+    rows = sorted(
+        (
+            HotPathStats(cluster, model, method, calls, total_ns / 1e9)
+            for (cluster, model, method), (calls, total_ns) in _stats.items()
+        ),
+        key=lambda row: row.total_s,
+        reverse=True,
+    )
+    return rows if top is None else rows[:top]
@@ -0,0 +1,64 @@
+"""Derive multiple press gestures from single button presses."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Callable, Hashable
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_S = 0.3
+DEFAULT_MAX_PRESSES = 5
+
+
+class MultiPressDetector:
+    """Count button presses following each other into a gesture.
+
+    Presses of a key less than `window_s` seconds apart form one gesture,
+    reported with its number of presses, capped at `max_presses`, once the
+    window after the last press ends. Keys, e.g. buttons, are independent.
+    A single event loop timer is armed per gesture: further presses only
+    move its deadline, which is checked when the timer runs.
+    """
+
+    def __init__(
+        self,
+        window_s: float = DEFAULT_WINDOW_S,
+        max_presses: int = DEFAULT_MAX_PRESSES,
+    ) -> None:
+        self._window_s = window_s
+        self._max_presses = max_presses
+        # key -> [presses, deadline, callback, armed deadline]
+        self._gestures: dict[Hashable, list] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._gestures
+
+    def press(self, key: Hashable, callback: Callable[[int], None]) -> None:
+        """Record a press of key, calling `callback(presses)` once the gesture ends."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._window_s
+
+        gesture = self._gestures.get(key)
+        if gesture is None:
+            self._gestures[key] = [1, deadline, callback, deadline]
+            loop.call_at(deadline, self._expire, loop, key)
+            return
+
+        gesture[0] = min(gesture[0] + 1, self._max_presses)
+        gesture[1] = deadline
+        gesture[2] = callback
+
+    def _expire(self, loop: asyncio.AbstractEventLoop, key: Hashable) -> None:
+        gesture = self._gestures[key]
+        presses, deadline, callback, armed = gesture
+        if deadline != armed:
+            gesture[3] = deadline
+            loop.call_at(deadline, self._expire, loop, key)
+            return
+
+        del self._gestures[key]
+        try:
+            callback(presses)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error reporting %d presses of %r", presses, key)
@@ -1,7 +1,5 @@
 """Module for Philips quirks implementations."""
-import asyncio
 import logging
-import time
 from typing import Any, List, Optional, Union
 
 from zigpy.quirks import CustomCluster
@@ -30,6 +28,7 @@ from zhaquirks.const import (
     TURN_ON,
     ZHA_SEND_EVENT,
 )
+from zhaquirks.multi_press import MultiPressDetector
 
 PHILIPS = "Philips"
 SIGNIFY = "Signify Netherlands B.V."
@@ -100,43 +99,6 @@ class PhilipsBasicCluster(CustomCluster, Basic):
         return result
 
 
-class ButtonPressQueue:
-    """Philips button queue to derive multiple press events."""
-
-    def __init__(self):
-        """Init."""
-        self._ms_threshold = 300
-        self._ms_last_click = 0
-        self._click_counter = 1
-        self._button = None
-        self._callback = lambda x: None
-        self._task = None
-
-    async def _job(self):
-        await asyncio.sleep(self._ms_threshold / 1000)
-        self._callback(self._click_counter)
-
-    def _reset(self, button):
-        if self._task:
-            self._task.cancel()
-        self._click_counter = 1
-        self._button = button
-
-    def press(self, callback, button):
-        """Process a button press."""
-        self._callback = callback
-        now_ms = time.time() * 1000
-        if self._button != button:
-            self._reset(button)
-        elif now_ms - self._ms_last_click > self._ms_threshold:
-            self._click_counter = 1
-        else:
-            self._task.cancel()
-            self._click_counter += 1
-        self._ms_last_click = now_ms
-        self._task = asyncio.ensure_future(self._job())
-
-
 class PhilipsRemoteCluster(CustomCluster):
     """Philips remote cluster."""
 
@@ -161,7 +123,20 @@ class PhilipsRemoteCluster(CustomCluster):
     BUTTONS = {1: "on", 2: "up", 3: "down", 4: "off"}
     PRESS_TYPES = {0: "press", 1: "hold", 2: "short_release", 3: "long_release"}
 
-    button_press_queue = ButtonPressQueue()
+    MULTI_PRESS_TYPES = {
+        1: "press",
+        2: "double_press",
+        3: "triple_press",
+        4: "quadruple_press",
+        5: "quintuple_press",
+    }
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._multi_press = MultiPressDetector(
+            window_s=0.3, max_presses=max(self.MULTI_PRESS_TYPES)
+        )
 
     def handle_cluster_request(
         self,
@@ -194,17 +169,7 @@ class PhilipsRemoteCluster(CustomCluster):
             _LOGGER.debug(
                 "PhilipsRemoteCluster - send_press_event click_count: [%s]", click_count
             )
-            press_type = None
-            if click_count == 1:
-                press_type = "press"
-            elif click_count == 2:
-                press_type = "double_press"
-            elif click_count == 3:
-                press_type = "triple_press"
-            elif click_count == 4:
-                press_type = "quadruple_press"
-            elif click_count > 4:
-                press_type = "quintuple_press"
+            press_type = self.MULTI_PRESS_TYPES.get(click_count)
 
             if press_type:
                 # Override PRESS_TYPE
@@ -214,7 +179,7 @@ class PhilipsRemoteCluster(CustomCluster):
 
         # Derive Multiple Presses
         if press_type == "press":
-            self.button_press_queue.press(send_press_event, button)
+            self._multi_press.press(button, send_press_event)
         else:
             action = f"{button}_{press_type}"
             self.listener_event(ZHA_SEND_EVENT, action, event_args)
@@ -0,0 +1,150 @@
+"""Prebuilt (manufacturer, model) index for on-demand quirk registration."""
+from __future__ import annotations
+
+import collections
+import contextlib
+import importlib
+import logging
+import pprint
+from typing import Dict, Iterator, Optional, Tuple
+
+import zigpy.quirks
+from zigpy.quirks.registry import DeviceRegistry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bump whenever the layout of ``QUIRK_INDEX`` in ``quirk_index_data`` changes
+QUIRK_INDEX_FORMAT = 1
+
+QuirkKey = Tuple[Optional[str], Optional[str]]
+QuirkRef = Tuple[str, str]
+QuirkIndex = Dict[QuirkKey, Tuple[QuirkRef, ...]]
+
+
+def build_quirk_index(registry: DeviceRegistry | None = None) -> QuirkIndex:
+    """Build the index from a registry with every `zhaquirks` module imported.
+
+    Each (manufacturer, model) pair maps to the (module, class name) of the
+    quirks registered for it, in registry priority order.
+    """
+    if registry is None:
+        registry = zigpy.quirks._DEVICE_REGISTRY  # pylint: disable=W0212
+
+    index = {}
+    for manufacturer, models in registry.registry.items():
+        for model, quirks in models.items():
+            refs = tuple(
+                (quirk.__module__, quirk.__qualname__)
+                for quirk in quirks
+                if quirk.__module__.startswith(__package__ + ".")
+            )
+            if refs:
+                index[(manufacturer, model)] = refs
+
+    return dict(
+        sorted(
+            index.items(),
+            key=lambda item: tuple((part is None, part or "") for part in item[0]),
+        )
+    )
+
+
+def format_quirk_index(index: QuirkIndex) -> str:
+    """Render the index as the source of the `quirk_index_data` module."""
+    return (
+        '"""Generated by script/gen_quirk_index, do not edit."""\n\n'
+        f"QUIRK_INDEX_FORMAT = {QUIRK_INDEX_FORMAT}\n\n"
+        f"QUIRK_INDEX = {pprint.pformat(index, sort_dicts=False)}\n"
+    )
+
+
+class _LazyModelRegistry(collections.defaultdict):
+    """Model -> quirks mapping that imports the indexed quirks on first lookup."""
+
+    def __init__(self, loader: LazyQuirkLoader, manufacturer: str | None) -> None:
+        super().__init__(list)
+        self._loader = loader
+        self._manufacturer = manufacturer
+
+    def __getitem__(self, model: str | None) -> list:
+        self._loader.load(self._manufacturer, model)
+        return super().__getitem__(model)
+
+
+class _LazyManufacturerRegistry(dict):
+    """Manufacturer -> models mapping creating lazy model mappings."""
+
+    def __init__(self, loader: LazyQuirkLoader) -> None:
+        super().__init__()
+        self._loader = loader
+
+    def __missing__(self, manufacturer: str | None) -> _LazyModelRegistry:
+        models = self[manufacturer] = _LazyModelRegistry(self._loader, manufacturer)
+        return models
+
+
+class LazyQuirkLoader:
+    """Import quirk modules only once zigpy looks up their (manufacturer, model).
+
+    Installing the loader swaps the registry mapping for one which imports the
+    modules listed in the index for a pair right before it is first read, and
+    then restores the priority order the quirks would have with every module
+    imported.
+    """
+
+    def __init__(self, registry: DeviceRegistry, index: QuirkIndex) -> None:
+        self._registry = registry
+        self._index = index
+        self._pending = {
+            key: {module for module, _ in refs} for key, refs in index.items()
+        }
+        self._loading = 0
+
+    @staticmethod
+    def is_installed(registry: DeviceRegistry) -> bool:
+        """Return whether a lazy loader already manages the registry."""
+        return isinstance(registry.registry, _LazyManufacturerRegistry)
+
+    def install(self) -> None:
+        """Replace the registry mapping, keeping already registered quirks."""
+        lazy = _LazyManufacturerRegistry(self)
+        with self.loading():
+            for manufacturer, models in self._registry.registry.items():
+                for model, quirks in models.items():
+                    lazy[manufacturer][model].extend(quirks)
+        self._registry._registry = lazy  # pylint: disable=W0212
+
+    @property
+    def pending(self) -> int:
+        """Number of (manufacturer, model) pairs not looked up yet."""
+        return len(self._pending)
+
+    @contextlib.contextmanager
+    def loading(self) -> Iterator[None]:
+        """Suspend lazy imports, e.g. while quirk modules register themselves."""
+        self._loading += 1
+        try:
+            yield
+        finally:
+            self._loading -= 1
+
+    def load(self, manufacturer: str | None, model: str | None) -> None:
+        """Import the quirk modules indexed for a (manufacturer, model) pair."""
+        if self._loading:
+            return
+
+        modules = self._pending.pop((manufacturer, model), None)
+        if modules is None:
+            return
+
+        with self.loading():
+            for modname in sorted(modules):
+                _LOGGER.debug("Loading quirks module %r", modname)
+                importlib.import_module(modname)
+
+            order = {
+                ref: pos for pos, ref in enumerate(self._index[(manufacturer, model)])
+            }
+            self._registry.registry[manufacturer][model].sort(
+                key=lambda quirk: order.get((quirk.__module__, quirk.__qualname__), -1)
+            )
@@ -0,0 +1,1452 @@
+"""Generated by script/gen_quirk_index, do not edit."""
+
+QUIRK_INDEX_FORMAT = 1
+
+QUIRK_INDEX = {
+    ("\x02KE", "TRADFRI open/close remote"): (
+        ("zhaquirks.ikea.opencloseremote", "IkeaTradfriOpenCloseRemote"),
+    ),
+    (" Echostar", "   Bell"): (("zhaquirks.echostar.bell", "Bell"),),
+    (" Legrand", " Dimmer switch w/o neutral"): (
+        ("zhaquirks.legrand.dimmer", "DimmerWithoutNeutralAndBallast"),
+        ("zhaquirks.legrand.dimmer", "DimmerWithoutNeutral3"),
+        ("zhaquirks.legrand.dimmer", "DimmerWithoutNeutral2"),
+        ("zhaquirks.legrand.dimmer", "DimmerWithoutNeutral"),
+    ),
+    (" Legrand", " Dimmer switch with neutral"): (
+        ("zhaquirks.legrand.dimmer", "DimmerWithNeutral2"),
+        ("zhaquirks.legrand.dimmer", "DimmerWithNeutral"),
+    ),
+    (" Legrand", " Light switch with neutral"): (
+        ("zhaquirks.legrand.switch", "LightSwitchWithNeutral"),
+    ),
+    (" Legrand", " Remote dimmer switch"): (
+        ("zhaquirks.legrand.dimmer", "RemoteDimmer"),
+    ),
+    (" Lutron", "LZL4BWHL01 Remote"): (
+        ("zhaquirks.lutron.lzl4bwhl01remote", "LutronLZL4BWHL01Remote"),
+    ),
+    ("3A Smart Home DE", "LXN56-TS27LX1.2"): (
+        ("zhaquirks.nue.auwz02000", "auwz02000"),
+    ),
+    ("ADEO", "LXEK-5"): (("zhaquirks.adeo.color_controller", "AdeoColorController"),),
+    ("ADEO", "ZBEK-26"): (("zhaquirks.adeo.color_controller", "AdeoColorController"),),
+    ("ADUROLIGHT", "Adurolight_NCC"): (
+        ("zhaquirks.aduro.adurolightncc", "AdurolightNCC"),
+    ),
+    ("ADUROLIGHT", "VMS_ADUROLIGHT"): (("zhaquirks.trust.zpir8000", "ZPIR8000"),),
+    ("Aurora", "2GBatteryDimmer50AU"): (
+        ("zhaquirks.aurora.aurora_dimmer", "AuroraDimmerBatteryPowered"),
+    ),
+    ("Bitron Home", "902010/32"): (("zhaquirks.bitron.thermostat", "Av201032"),),
+    ("Bosch", "ISW-ZDL1-WP11G"): (("zhaquirks.bosch.isw_zdl1_wp11g", "ISWZDL1WP11G"),),
+    ("Bosch", "ISW-ZPR1-WP13"): (("zhaquirks.bosch.motion", "ISWZPR1WP13"),),
+    ("CentraLite", "3130"): (("zhaquirks.centralite.cl_3130", "CentraLite3130"),),
+    ("CentraLite", "3157100"): (
+        ("zhaquirks.centralite.cl_3157100", "CentraLite3157100"),
+    ),
+    ("CentraLite", "3300"): (("zhaquirks.centralite.cl_3300S", "CentraLite3300S"),),
+    ("CentraLite", "3300-S"): (
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV3"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV2"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensor"),
+        ("zhaquirks.centralite.cl_3300S", "CentraLite3300S"),
+    ),
+    ("CentraLite", "3305"): (
+        ("zhaquirks.centralite.cl_3305S", "CentraLite3305S2"),
+        ("zhaquirks.centralite.cl_3305S", "CentraLite3305S"),
+    ),
+    ("CentraLite", "3305-S"): (
+        ("zhaquirks.centralite.motion", "CentraLiteMotionSensor"),
+        ("zhaquirks.centralite.cl_3305S", "CentraLite3305S"),
+    ),
+    ("CentraLite", "3310"): (("zhaquirks.centralite.cl_3310S", "CentraLite3310S"),),
+    ("CentraLite", "3310-G"): (("zhaquirks.centralite.cl_3310S", "CentraLite3310S"),),
+    ("CentraLite", "3310-S"): (("zhaquirks.centralite.cl_3310S", "CentraLite3310S"),),
+    ("CentraLite", "3315"): (
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV3"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV2"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensor"),
+    ),
+    ("CentraLite", "3315-G"): (
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV3"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV2"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensor"),
+    ),
+    ("CentraLite", "3315-L"): (
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV3"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV2"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensor"),
+    ),
+    ("CentraLite", "3315-S"): (
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV3"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV2"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensor"),
+    ),
+    ("CentraLite", "3315-Seu"): (
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV3"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV2"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensor"),
+    ),
+    ("CentraLite", "3320"): (("zhaquirks.centralite.cl_3321S", "CentraLite3321S"),),
+    ("CentraLite", "3320-L"): (
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV3"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV2"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensor"),
+    ),
+    ("CentraLite", "3321"): (("zhaquirks.centralite.cl_3321S", "CentraLite3321S"),),
+    ("CentraLite", "3321-S"): (("zhaquirks.centralite.cl_3321S", "CentraLite3321S"),),
+    ("CentraLite", "3323-G"): (("zhaquirks.centralite.cl_3300S", "CentraLite3300S"),),
+    ("CentraLite", "3325"): (("zhaquirks.centralite.cl_3305S", "CentraLite3305S"),),
+    ("CentraLite", "3325-S"): (
+        ("zhaquirks.centralite.motion", "CentraLiteMotionSensor"),
+        ("zhaquirks.centralite.cl_3305S", "CentraLite3305S"),
+    ),
+    ("CentraLite", "3326"): (("zhaquirks.centralite.cl_3305S", "CentraLite3305S"),),
+    ("CentraLite", "3326-L"): (
+        ("zhaquirks.centralite.motion", "CentraLiteMotionSensor"),
+        ("zhaquirks.centralite.cl_3305S", "CentraLite3305S"),
+    ),
+    ("CentraLite", "3328-G"): (("zhaquirks.centralite.cl_3305S", "CentraLite3305S"),),
+    ("CentraLite", "3450-L"): (
+        ("zhaquirks.centralite.motionandtemp", "CentraLite3450L"),
+    ),
+    ("CentraLite", "3450-L2"): (
+        ("zhaquirks.centralite.motionandtemp", "CentraLite3450L"),
+    ),
+    ("CentraLite", "3460-L"): (("zhaquirks.centralite.cl_3460L", "CentraLite3460L"),),
+    ("CentraLite", "Contact Sensor-A"): (
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV3"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensorV2"),
+        ("zhaquirks.centralite.ias", "CentraLiteIASSensor"),
+    ),
+    ("CentraLite", "Motion Sensor-A"): (
+        ("zhaquirks.centralite.cl_3305S", "CentraLite3305S"),
+    ),
+    ("Centralite", "3157100"): (
+        ("zhaquirks.centralite.cl_3157100", "CentraLite3157100"),
+    ),
+    ("Computime", "SP600"): (("zhaquirks.salus.sp600", "SP600"),),
+    ("Computime", "SPE600"): (("zhaquirks.salus.sp600", "SPE600"),),
+    ("D5X84YU", "eT093WRO"): (("zhaquirks.danfoss.thermostat", "DanfossThermostat"),),
+    ("Danfoss", "TRV001"): (("zhaquirks.danfoss.thermostat", "DanfossThermostat"),),
+    ("Danfoss", "eTRV0100"): (("zhaquirks.danfoss.thermostat", "DanfossThermostat"),),
+    ("Danfoss", "eTRV0101"): (("zhaquirks.danfoss.thermostat", "DanfossThermostat"),),
+    ("Danfoss", "eTRV0103"): (("zhaquirks.danfoss.thermostat", "DanfossThermostat"),),
+    ("Develco Products A/S", "AQSZB-110"): (
+        ("zhaquirks.develco.air_quality", "AQSZB110"),
+    ),
+    ("Develco Products A/S", "HESZB-120"): (
+        ("zhaquirks.develco.heat_alarm", "HESZB120"),
+    ),
+    ("Develco Products A/S", "MOSZB-140"): (
+        ("zhaquirks.develco.motion", "MOSZB140_Var02"),
+        ("zhaquirks.develco.motion", "MOSZB140"),
+    ),
+    ("Develco Products A/S", "SMSZB-120"): (
+        ("zhaquirks.develco.smoke_alarm", "SMSZB120"),
+    ),
+    ("Develco Products A/S", "SPLZB-131"): (
+        ("zhaquirks.develco.power_plug", "SPLZB131"),
+    ),
+    ("Develco Products A/S", "WISZB-120"): (
+        ("zhaquirks.develco.open_close", "WISZB120"),
+    ),
+    ("EDP-WITHUS", None): (("zhaquirks.edpwithus.redy_plug", "EdpWithUsSmartPlug"),),
+    ("ELKO", "Super TR"): (
+        ("zhaquirks.elko.smart_super_thermostat", "ElkoSuperTRThermostat"),
+    ),
+    ("Ecolink", "4655BC0-R"): (("zhaquirks.ecolink.contact", "Ecolink4655BC0R"),),
+    ("Eurotronic", "SPZB0001"): (("zhaquirks.eurotronic.spzb0001", "SPZB0001"),),
+    ("FeiBit", "FNB56-ZSW01LX2.0"): (
+        ("zhaquirks.feibit.switch", "FeiBitOneWaySwitch"),
+    ),
+    ("FeiBit", "FNB56-ZSW02LX2.0"): (
+        ("zhaquirks.feibit.switch", "FeiBitTwoWaySwitch"),
+    ),
+    ("FeiBit", "FNB56-ZSW03LX2.0"): (
+        ("zhaquirks.feibit.switch", "FeiBitThreeWaySwitch"),
+    ),
+    ("GLEDOPTO", "GL-C-009"): (("zhaquirks.gledopto.glc009", "GLC009"),),
+    ("GLEDOPTO", "GL-C-009P"): (("zhaquirks.gledopto.glc009p", "GLC009P"),),
+    ("GLEDOPTO", "GL-S-007Z"): (("zhaquirks.gledopto.gls007z", "GLS007Z"),),
+    ("GLEDOPTO", "GL-SD-001"): (("zhaquirks.gledopto.glsd001", "GledoptoGlSd001"),),
+    ("HEIMAN", "SmokeSensor-N-3.0"): (("zhaquirks.heiman.smoke", "HeimanSmokeN30"),),
+    ("Heiman", "CO_CTPG"): (("zhaquirks.heiman.smoke", "HeimanSmokCO_CTPG"),),
+    ("Heiman", "CO_V15"): (("zhaquirks.heiman.smoke", "HeimanSmokCO_V15"),),
+    ("Heiman", "SMOK_YDLV10"): (("zhaquirks.heiman.smoke", "HeimanSmokYDLV10"),),
+    ("HiveHome.com", "MOT003"): (
+        ("zhaquirks.hivehome.mot003V6", "MOT003"),
+        ("zhaquirks.hivehome.mot003V0", "MOT003"),
+    ),
+    ("IKEA of Sweden", "FLOALT panel WS 30x90"): (
+        ("zhaquirks.ikea.cctlightzha", "CCTLightZHA"),
+    ),
+    ("IKEA of Sweden", "FLOALT panel WS 60x60"): (
+        ("zhaquirks.ikea.cctlightzha", "CCTLightZHA"),
+    ),
+    ("IKEA of Sweden", "FYRTUR block-out roller blind"): (
+        ("zhaquirks.ikea.blinds", "IkeaTradfriRollerBlinds2"),
+        ("zhaquirks.ikea.blinds", "IkeaTradfriRollerBlinds"),
+    ),
+    ("IKEA of Sweden", "KADRILJ roller blind"): (
+        ("zhaquirks.ikea.blinds", "IkeaTradfriRollerBlinds2"),
+        ("zhaquirks.ikea.blinds", "IkeaTradfriRollerBlinds"),
+    ),
+    ("IKEA of Sweden", "PRAKTLYSING cellular blind"): (
+        ("zhaquirks.ikea.blinds", "IkeaTradfriRollerBlinds"),
+    ),
+    ("IKEA of Sweden", "Remote Control N2"): (
+        ("zhaquirks.ikea.fourbtnremote", "IkeaTradfriRemoteV2"),
+        ("zhaquirks.ikea.fourbtnremote", "IkeaTradfriRemoteV1"),
+    ),
+    ("IKEA of Sweden", "STARKVIND Air purifier"): (
+        ("zhaquirks.ikea.starkvind", "IkeaSTARKVIND_v2"),
+        ("zhaquirks.ikea.starkvind", "IkeaSTARKVIND"),
+    ),
+    ("IKEA of Sweden", "STARKVIND Air purifier table"): (
+        ("zhaquirks.ikea.starkvind", "IkeaSTARKVIND_v2"),
+        ("zhaquirks.ikea.starkvind", "IkeaSTARKVIND"),
+    ),
+    ("IKEA of Sweden", "SYMFONISK Sound Controller"): (
+        ("zhaquirks.ikea.symfonisk", "IkeaSYMFONISK2"),
+        ("zhaquirks.ikea.symfonisk", "IkeaSYMFONISK1"),
+    ),
+    ("IKEA of Sweden", "SYMFONISK sound remote gen2"): (
+        ("zhaquirks.ikea.symfonisk2", "IkeaSymfoniskGen2v2"),
+        ("zhaquirks.ikea.symfonisk2", "IkeaSymfoniskGen2v1"),
+    ),
+    ("IKEA of Sweden", "TRADFRI SHORTCUT Button"): (
+        ("zhaquirks.ikea.shortcutbtn", "IkeaTradfriShortcutBtn2"),
+        ("zhaquirks.ikea.shortcutbtn", "IkeaTradfriShortcutBtn"),
+    ),
+    ("IKEA of Sweden", "TRADFRI bulb GU10 WS 400lm"): (
+        ("zhaquirks.ikea.cctlightzha", "CCTLightZHA"),
+    ),
+    ("IKEA of Sweden", "TRADFRI control outlet"): (
+        ("zhaquirks.ikea.tradfriplug", "TradfriPlug"),
+    ),
+    ("IKEA of Sweden", "TRADFRI motion sensor"): (
+        ("zhaquirks.ikea.motionzha", "IkeaTradfriMotionE1525_Var01"),
+        ("zhaquirks.ikea.motionzha", "IkeaTradfriMotionE1745_Var02"),
+        ("zhaquirks.ikea.motionzha", "IkeaTradfriMotionE1745_Var01"),
+        ("zhaquirks.ikea.motion", "IkeaTradfriMotion"),
+    ),
+    ("IKEA of Sweden", "TRADFRI on/off switch"): (
+        ("zhaquirks.ikea.twobtnremote", "IkeaTradfriRemote2BtnZLL"),
+        ("zhaquirks.ikea.twobtnremote", "IkeaTradfriRemote2Btn"),
+    ),
+    ("IKEA of Sweden", "TRADFRI open/close remote"): (
+        ("zhaquirks.ikea.opencloseremote", "IkeaTradfriOpenCloseRemote"),
+    ),
+    ("IKEA of Sweden", "TRADFRI remote control"): (
+        ("zhaquirks.ikea.fivebtnremote", "IkeaTradfriRemote5"),
+        ("zhaquirks.ikea.fivebtnremote", "IkeaTradfriRemote4"),
+        ("zhaquirks.ikea.fivebtnremote", "IkeaTradfriRemote3"),
+        ("zhaquirks.ikea.fivebtnremote", "IkeaTradfriRemote2"),
+        ("zhaquirks.ikea.fivebtnremote", "IkeaTradfriRemote1"),
+    ),
+    ("IKEA of Sweden", "TRADFRI wireless dimmer"): (
+        ("zhaquirks.ikea.dimmer", "IkeaDimmer"),
+    ),
+    ("IKEA of Sweden", "TREDANSEN block-out cellul blind"): (
+        ("zhaquirks.ikea.blinds", "IkeaTradfriRollerBlinds"),
+    ),
+    ("Inovelli", "VZM31-SN"): (
+        ("zhaquirks.inovelli.VZM31SN", "InovelliVZM31SN"),
+        ("zhaquirks.inovelli.VZM31SN", "InovelliVZM31SNv9"),
+        ("zhaquirks.inovelli.VZM31SN", "InovelliVZM31SNv10"),
+        ("zhaquirks.inovelli.VZM31SN", "InovelliVZM31SNv11"),
+        ("zhaquirks.inovelli.VZM31SN", "InovelliVZM31SNv12"),
+    ),
+    ("Insta GmbH", "NEXENTRO Pushbutton Interface"): (
+        (
+            "zhaquirks.insta.nexentro_pushbutton_interface",
+            "InstaNexentroPushbuttonInterface",
+        ),
+    ),
+    ("Keen Home Inc", "SV01-410-MP-1.0"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("Keen Home Inc", "SV01-410-MP-1.1"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("Keen Home Inc", "SV01-410-MP-1.4"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("Keen Home Inc", "SV01-410-MP-1.5"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("Keen Home Inc", "SV01-412-MP-1.0"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("Keen Home Inc", "SV01-610-MP-1.0"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("Keen Home Inc", "SV01-612-MP-1.0"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("Keen Home Inc", "SV02-410-MP-1.3"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("Keen Home Inc", "SV02-610-MP-1.3"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("Keen Home Inc", "SV02-612-MP-1.3"): (
+        ("zhaquirks.keenhome.sv02612mp13", "KeenHomeSmartVent"),
+    ),
+    ("King Of Fans,  Inc.", None): (("zhaquirks.kof.kof_mr101z", "CeilingFan"),),
+    ("Konke", "3AFE130104020015"): (("zhaquirks.konke.magnet", "KonkeMagnet2"),),
+    ("Konke", "3AFE140103020000"): (("zhaquirks.konke.temp", "KonkeTempHumidity"),),
+    ("Konke", "3AFE14010402000D"): (
+        ("zhaquirks.konke.motion", "KonkeMotionB"),
+        ("zhaquirks.konke.motion", "KonkeMotion"),
+    ),
+    ("Konke", "3AFE140104020015"): (("zhaquirks.konke.magnet", "KonkeMagnet2"),),
+    ("Konke", "3AFE170100510001"): (("zhaquirks.konke.button", "KonkeButtonRemote2"),),
+    ("Konke", "3AFE220103020000"): (("zhaquirks.konke.temp", "KonkeTempHumidity"),),
+    ("Konke", "3AFE27010402000D"): (
+        ("zhaquirks.konke.motion", "KonkeMotionB"),
+        ("zhaquirks.konke.motion", "KonkeMotion"),
+    ),
+    ("Konke", "3AFE270104020015"): (("zhaquirks.konke.magnet", "KonkeMagnet"),),
+    ("Konke", "3AFE280100510001"): (("zhaquirks.konke.button", "KonkeButtonRemote1"),),
+    ("Konke", "3AFE28010402000D"): (
+        ("zhaquirks.konke.motion", "KonkeMotionB"),
+        ("zhaquirks.konke.motion", "KonkeMotion"),
+    ),
+    ("Konke", "3AFE280104020015"): (("zhaquirks.konke.magnet", "KonkeMagnet"),),
+    ("LDS", "ZBT-CCTSwitch-D0001"): (("zhaquirks.lds.cctswitch", "CCTSwitch"),),
+    ("LEDVANCE", "A19 RGBW"): (("zhaquirks.ledvance.a19rgbw", "LedvanceA19RGBW"),),
+    ("LEDVANCE", "FLEX RGBW"): (("zhaquirks.ledvance.flexrgbw", "FlexRGBW"),),
+    ("LK", "A001082"): (("zhaquirks.linkind.a001082", "LinkindA001082"),),
+    ("LUMI", "RS-THP-MP-1.0"): (
+        ("zhaquirks.keenhome.weather", "TemperatureHumidtyPressureSensor"),
+    ),
+    ("LUMI", "lumi.airmonitor.acn01"): (
+        ("zhaquirks.xiaomi.aqara.tvoc", "TVOCMonitor2"),
+        ("zhaquirks.xiaomi.aqara.tvoc", "TVOCMonitor"),
+    ),
+    ("LUMI", "lumi.airrtc.agl001"): (
+        ("zhaquirks.xiaomi.aqara.thermostat_agl001", "AGL001"),
+    ),
+    ("LUMI", "lumi.ctrl_ln1.aq1"): (("zhaquirks.xiaomi.aqara.ctrl_ln", "CtrlLn"),),
+    ("LUMI", "lumi.ctrl_ln2.aq1"): (("zhaquirks.xiaomi.aqara.ctrl_ln", "CtrlLn"),),
+    ("LUMI", "lumi.ctrl_neutral1"): (
+        ("zhaquirks.xiaomi.aqara.ctrl_neutral", "CtrlNeutral"),
+    ),
+    ("LUMI", "lumi.ctrl_neutral2"): (
+        ("zhaquirks.xiaomi.aqara.ctrl_neutral", "CtrlNeutral_2G"),
+    ),
+    ("LUMI", "lumi.curtain.acn002"): (
+        ("zhaquirks.xiaomi.aqara.roller_curtain_e1", "RollerE1AQ_3"),
+        ("zhaquirks.xiaomi.aqara.roller_curtain_e1", "RollerE1AQ_2"),
+        ("zhaquirks.xiaomi.aqara.roller_curtain_e1", "RollerE1AQ"),
+    ),
+    ("LUMI", "lumi.flood.acn001"): (
+        ("zhaquirks.xiaomi.aqara.water_acn001", "WaterE1"),
+    ),
+    ("LUMI", "lumi.light.aqcn02"): (
+        ("zhaquirks.xiaomi.aqara.light_aqcn2", "LightAqcn02"),
+    ),
+    ("LUMI", "lumi.magnet.acn001"): (
+        ("zhaquirks.xiaomi.aqara.magnet_acn001", "MagnetE1"),
+    ),
+    ("LUMI", "lumi.motion.ac02"): (
+        ("zhaquirks.xiaomi.aqara.motion_ac02", "LumiMotionAC02"),
+    ),
+    ("LUMI", "lumi.motion.agl02"): (
+        ("zhaquirks.xiaomi.aqara.motion_agl02", "MotionT1"),
+    ),
+    ("LUMI", "lumi.motion.agl04"): (
+        ("zhaquirks.xiaomi.aqara.motion_agl04", "LumiLumiMotionAgl04"),
+    ),
+    ("LUMI", "lumi.plug"): (
+        ("zhaquirks.xiaomi.aqara.plug", "Plug2"),
+        ("zhaquirks.xiaomi.aqara.plug", "Plug"),
+    ),
+    ("LUMI", "lumi.plug.maeu01"): (
+        ("zhaquirks.xiaomi.aqara.plug_eu", "PlugMAEU01Alt3"),
+        ("zhaquirks.xiaomi.aqara.plug_eu", "PlugMAEU01Alt2"),
+        ("zhaquirks.xiaomi.aqara.plug_eu", "PlugMAEU01Alt1"),
+        ("zhaquirks.xiaomi.aqara.plug_eu", "PlugMAEU01"),
+    ),
+    ("LUMI", "lumi.plug.maus01"): (("zhaquirks.xiaomi.aqara.plug_maus01", "Plug"),),
+    ("LUMI", "lumi.plug.mitw01"): (("zhaquirks.xiaomi.aqara.plug_maus01", "Plug"),),
+    ("LUMI", "lumi.plug.mmeu01"): (
+        ("zhaquirks.xiaomi.aqara.plug_eu", "PlugMMEU01Alt3"),
+        ("zhaquirks.xiaomi.aqara.plug_eu", "PlugMMEU01Alt2"),
+        ("zhaquirks.xiaomi.aqara.plug_eu", "PlugMMEU01Alt1"),
+        ("zhaquirks.xiaomi.aqara.plug_eu", "PlugMMEU01"),
+    ),
+    ("LUMI", "lumi.relay.c2acn01"): (
+        ("zhaquirks.xiaomi.aqara.relay_c2acn01", "Relay"),
+    ),
+    ("LUMI", "lumi.remote.acn003"): (
+        ("zhaquirks.xiaomi.aqara.remote_e1", "RemoteE1SingleRocker1"),
+    ),
+    ("LUMI", "lumi.remote.acn004"): (
+        ("zhaquirks.xiaomi.aqara.remote_e1", "RemoteE1DoubleRocker1"),
+    ),
+    ("LUMI", "lumi.remote.b186acn01"): (
+        ("zhaquirks.xiaomi.aqara.remote_b186acn01", "RemoteB186ACN01"),
+    ),
+    ("LUMI", "lumi.remote.b186acn02"): (
+        ("zhaquirks.xiaomi.aqara.remote_b186acn01", "RemoteB186ACN01"),
+    ),
+    ("LUMI", "lumi.remote.b18ac1"): (
+        ("zhaquirks.xiaomi.aqara.remote_h1", "RemoteH1SingleRocker"),
+    ),
+    ("LUMI", "lumi.remote.b1acn01"): (
+        ("zhaquirks.xiaomi.aqara.sensor_switch_aq3", "SwitchAQ3B"),
+    ),
+    ("LUMI", "lumi.remote.b286acn01"): (
+        ("zhaquirks.xiaomi.aqara.remote_b286acn01", "RemoteB286ACN01"),
+    ),
+    ("LUMI", "lumi.remote.b286acn02"): (
+        ("zhaquirks.xiaomi.aqara.remote_b286acn01", "RemoteB286ACN01"),
+    ),
+    ("LUMI", "lumi.remote.b286opcn01"): (
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB286OPCN01V4"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB286OPCN01V3"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB286OPCN01Alt"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB286OPCN01V2"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB286OPCN01"),
+    ),
+    ("LUMI", "lumi.remote.b28ac1"): (
+        ("zhaquirks.xiaomi.aqara.remote_h1", "RemoteH1DoubleRocker4"),
+        ("zhaquirks.xiaomi.aqara.remote_h1", "RemoteH1DoubleRocker3"),
+        ("zhaquirks.xiaomi.aqara.remote_h1", "RemoteH1DoubleRocker2"),
+        ("zhaquirks.xiaomi.aqara.remote_h1", "RemoteH1DoubleRocker1"),
+    ),
+    ("LUMI", "lumi.remote.b486opcn01"): (
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB486OPCN01V4"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB486OPCN01V3"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB486OPCN01V2"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB486OPCN01"),
+    ),
+    ("LUMI", "lumi.remote.b686opcn01"): (
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB686OPCN01V5"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB686OPCN01V4"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB686OPCN01V3"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB686OPCN01V2"),
+        ("zhaquirks.xiaomi.aqara.opple_remote", "RemoteB686OPCN01"),
+    ),
+    ("LUMI", "lumi.remote.cagl02"): (
+        ("zhaquirks.xiaomi.aqara.cube_aqgl01", "CubeCAGL02"),
+    ),
+    ("LUMI", "lumi.sen_ill.mgl01"): (
+        ("zhaquirks.xiaomi.aqara.illumination", "Illumination"),
+    ),
+    ("LUMI", "lumi.sens"): (("zhaquirks.xiaomi.mija.sensor_ht", "Weather"),),
+    ("LUMI", "lumi.sensor_86sw1"): (
+        ("zhaquirks.xiaomi.aqara.remote_b186acn01", "RemoteB186ACN01"),
+    ),
+    ("LUMI", "lumi.sensor_86sw2"): (
+        ("zhaquirks.xiaomi.aqara.remote_b286acn01", "RemoteB286ACN01"),
+    ),
+    ("LUMI", "lumi.sensor_cube"): (("zhaquirks.xiaomi.aqara.cube", "Cube"),),
+    ("LUMI", "lumi.sensor_cube.aqgl01"): (
+        ("zhaquirks.xiaomi.aqara.cube_aqgl01", "CubeAQGL01"),
+    ),
+    ("LUMI", "lumi.sensor_ht"): (("zhaquirks.xiaomi.mija.sensor_ht", "Weather"),),
+    ("LUMI", "lumi.sensor_ht.agl02"): (
+        ("zhaquirks.xiaomi.aqara.sensor_ht_agl02", "LumiSensorHtAgl02"),
+    ),
+    ("LUMI", "lumi.sensor_magnet"): (
+        ("zhaquirks.xiaomi.mija.sensor_magnet", "Magnet"),
+    ),
+    ("LUMI", "lumi.sensor_magnet.aq2"): (
+        ("zhaquirks.xiaomi.aqara.magnet_aq2", "MagnetAQ2"),
+    ),
+    ("LUMI", "lumi.sensor_motion"): (("zhaquirks.xiaomi.mija.motion", "Motion"),),
+    ("LUMI", "lumi.sensor_motion.aq2"): (
+        ("zhaquirks.xiaomi.aqara.motion_aq2b", "MotionAQ2"),
+        ("zhaquirks.xiaomi.aqara.motion_aq2", "MotionAQ2"),
+    ),
+    ("LUMI", "lumi.sensor_smoke"): (
+        ("zhaquirks.xiaomi.mija.smoke", "MijiaHoneywellSmokeDetectorSensor"),
+    ),
+    ("LUMI", "lumi.sensor_smoke.acn03"): (
+        ("zhaquirks.xiaomi.aqara.smoke", "LumiSensorSmokeAcn03"),
+    ),
+    ("LUMI", "lumi.sensor_swit"): (
+        ("zhaquirks.xiaomi.aqara.sensor_switch_aq3", "SwitchAQ3"),
+    ),
+    ("LUMI", "lumi.sensor_switch"): (
+        ("zhaquirks.xiaomi.mija.sensor_switch", "MijaButton"),
+    ),
+    ("LUMI", "lumi.sensor_switch.aq2"): (
+        ("zhaquirks.xiaomi.aqara.switch_aq2", "SwitchAQ2"),
+    ),
+    ("LUMI", "lumi.sensor_switch.aq3"): (
+        ("zhaquirks.xiaomi.aqara.sensor_switch_aq3", "SwitchAQ3"),
+    ),
+    ("LUMI", "lumi.sensor_wleak.aq1"): (
+        ("zhaquirks.xiaomi.aqara.wleak_aq1", "LeakAQ1"),
+    ),
+    ("LUMI", "lumi.switch.b1lacn02"): (
+        ("zhaquirks.xiaomi.aqara.ctrl_neutral", "CtrlNeutral"),
+    ),
+    ("LUMI", "lumi.switch.b2lacn02"): (
+        ("zhaquirks.xiaomi.aqara.ctrl_neutral", "CtrlNeutral_2G"),
+    ),
+    ("LUMI", "lumi.switch.l1aeu1"): (
+        ("zhaquirks.xiaomi.aqara.switch_h1", "AqaraH1SingleRockerSwitchNoNeutralAlt2"),
+        ("zhaquirks.xiaomi.aqara.switch_h1", "AqaraH1SingleRockerSwitchNoNeutralAlt1"),
+        ("zhaquirks.xiaomi.aqara.switch_h1", "AqaraH1SingleRockerSwitchNoNeutral"),
+    ),
+    ("LUMI", "lumi.switch.l2aeu1"): (
+        ("zhaquirks.xiaomi.aqara.switch_h1", "AqaraH1DoubleRockerSwitchNoNeutral"),
+    ),
+    ("LUMI", "lumi.switch.n1aeu1"): (
+        ("zhaquirks.xiaomi.aqara.switch_h1", "AqaraH1SingleRockerSwitchWithNeutral"),
+    ),
+    ("LUMI", "lumi.switch.n2aeu1"): (
+        ("zhaquirks.xiaomi.aqara.switch_h1", "AqaraH1DoubleRockerSwitchWithNeutral"),
+    ),
+    ("LUMI", "lumi.vibration.aq1"): (
+        ("zhaquirks.xiaomi.aqara.vibration_aq1", "VibrationAQ1"),
+    ),
+    ("LUMI", "lumi.weather"): (
+        ("zhaquirks.xiaomi.aqara.weather", "Weather2"),
+        ("zhaquirks.xiaomi.aqara.weather", "Weather"),
+    ),
+    ("LiXee", "ZLinky_TIC"): (
+        ("zhaquirks.lixee.zlinky", "ZLinkyTICFWV12"),
+        ("zhaquirks.lixee.zlinky", "ZLinkyTIC"),
+    ),
+    ("Lutron", "LZL4BWHL01 Remote"): (
+        ("zhaquirks.lutron.lzl4bwhl01remote", "LutronLZL4BWHL01Remote"),
+    ),
+    ("MLI", "ZBT-Remote-ALL-RGBW"): (("zhaquirks.mli.tint", "TintRemote"),),
+    ("MLI", "tint-ExtendedColor"): (
+        ("zhaquirks.mli.tintE14rgbcct", "TintRGBCCTLight"),
+    ),
+    ("NodOn", "SIN-4-2-20"): (("zhaquirks.nodon.switch", "NodOnSIN4220"),),
+    ("ORVIBO", "895a2d80097f4ae2b2d40500d5e03dcc"): (
+        ("zhaquirks.orvibo.motion", "SN10ZW"),
+    ),
+    ("OSRAM", "CLA60 TW OSRAM"): (("zhaquirks.osram.cla60tw", "CLA60TW"),),
+    ("OSRAM", "Gardenpole RGBW-Lightify"): (
+        ("zhaquirks.osram.gardenpolesrgbw", "GardenpoleRGBW"),
+    ),
+    ("OSRAM", "LIGHTIFY A19 RGBW"): (("zhaquirks.osram.a19rgbw", "LIGHTIFYA19RGBW"),),
+    ("OSRAM", "LIGHTIFY A19 Tunable White"): (
+        ("zhaquirks.osram.tunablewhite", "OsramTunableWhite"),
+    ),
+    ("OSRAM", "LIGHTIFY Dimming Switch"): (
+        ("zhaquirks.centralite.cl_3130", "CentraLite3130"),
+    ),
+    ("OSRAM", "LIGHTIFY FLEX OUTDOOR RGBW"): (
+        ("zhaquirks.osram.flexrgbw", "FlexRGBW"),
+    ),
+    ("OSRAM", "LIGHTIFY Flex RGBW"): (("zhaquirks.osram.flexrgbw", "FlexRGBW"),),
+    ("OSRAM", "LIGHTIFY RT Tunable White"): (
+        ("zhaquirks.osram.tunablewhite", "OsramTunableWhite"),
+    ),
+    ("OSRAM", "Lightify Switch Mini"): (
+        ("zhaquirks.osram.switchmini", "OsramSwitchMini"),
+    ),
+    ("OSRAM", "Plug 01"): (("zhaquirks.osram.osramplug", "OsramPlug"),),
+    ("OSRAM", "Smart+ AC05347"): (
+        ("zhaquirks.osram.smartplusac05347", "SmartplusAC05347"),
+    ),
+    ("OSRAM", "Switch 4x EU-LIGHTIFY"): (("zhaquirks.osram.lightifyx4", "LightifyX4"),),
+    ("OSRAM", "Switch 4x-LIGHTIFY"): (("zhaquirks.osram.lightifyx4", "LightifyX4"),),
+    ("OSRAM", "Switch-LIGHTIFY"): (("zhaquirks.osram.lightifyx4", "LightifySwitch"),),
+    ("PLAID SYSTEMS", "PS-SPRZMS-SLP3"): (("zhaquirks.plaid.soil", "SoilMoisture"),),
+    ("Paulmann LichtGmbH", "501.34"): (
+        ("zhaquirks.paulmann.fourbtnremote", "PaulmannRemote4Btn"),
+    ),
+    ("Philips", "RDM001"): (("zhaquirks.philips.rdm001", "PhilipsROM001"),),
+    ("Philips", "ROM001"): (("zhaquirks.philips.rom001", "PhilipsROM001"),),
+    ("Philips", "RWL020"): (
+        ("zhaquirks.philips.rwlfirstgen", "PhilipsRWLFirstGen2"),
+        ("zhaquirks.philips.rwlfirstgen", "PhilipsRWLFirstGen"),
+    ),
+    ("Philips", "RWL021"): (
+        ("zhaquirks.philips.rwlfirstgen", "PhilipsRWLFirstGen2"),
+        ("zhaquirks.philips.rwlfirstgen", "PhilipsRWLFirstGen"),
+    ),
+    ("Philips", "SML001"): (("zhaquirks.philips.motion", "PhilipsMotion"),),
+    ("Philips", "SML002"): (("zhaquirks.philips.motion", "PhilipsMotion"),),
+    ("Samjin", "button"): (
+        ("zhaquirks.samjin.button2", "SamjinButton"),
+        ("zhaquirks.samjin.button", "SamjinButton"),
+    ),
+    ("Samjin", "multi"): (
+        ("zhaquirks.samjin.multi2", "SmartthingsMultiPurposeSensor2019"),
+        ("zhaquirks.centralite.cl_3321S", "CentraLite3321S"),
+    ),
+    ("Sercomm Corp.", "SZ-WTD02N_SF"): (
+        ("zhaquirks.sercomm.flood_sensor", "SZWTD02N"),
+    ),
+    ("Sercomm Corp.", "XHS2-SE"): (("zhaquirks.sercomm.contact_sensor", "XHS2SE"),),
+    ("Siglis", "zigfred plus"): (("zhaquirks.siglis.zigfred", "ZigfredPlus"),),
+    ("Siglis", "zigfred uno"): (("zhaquirks.siglis.zigfred", "ZigfredUno"),),
+    ("Signify Netherlands B.V.", "RDM001"): (
+        ("zhaquirks.philips.rdm001", "PhilipsROM001"),
+    ),
+    ("Signify Netherlands B.V.", "ROM001"): (
+        ("zhaquirks.philips.rom001", "PhilipsROM001"),
+    ),
+    ("Signify Netherlands B.V.", "RWL020"): (
+        ("zhaquirks.philips.rwlfirstgen", "PhilipsRWLFirstGen2"),
+        ("zhaquirks.philips.rwlfirstgen", "PhilipsRWLFirstGen"),
+    ),
+    ("Signify Netherlands B.V.", "RWL021"): (
+        ("zhaquirks.philips.rwlfirstgen", "PhilipsRWLFirstGen2"),
+        ("zhaquirks.philips.rwlfirstgen", "PhilipsRWLFirstGen"),
+    ),
+    ("Signify Netherlands B.V.", "RWL022"): (
+        ("zhaquirks.philips.rwl022", "PhilipsRWL022"),
+    ),
+    ("Signify Netherlands B.V.", "SML003"): (
+        ("zhaquirks.philips.motion", "SignifyMotion"),
+    ),
+    ("Signify Netherlands B.V.", "SML004"): (
+        ("zhaquirks.philips.motion", "SignifyMotion"),
+    ),
+    ("Sinope Technologies", "DM2500ZB"): (
+        ("zhaquirks.sinope.light", "SinopeDM2500ZB"),
+    ),
+    ("Sinope Technologies", "DM2550ZB"): (
+        ("zhaquirks.sinope.light", "SinopeDM2550ZB"),
+    ),
+    ("Sinope Technologies", "MC3100ZB"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesMultiController"),
+    ),
+    ("Sinope Technologies", "OTH3600-GA-ZB"): (
+        ("zhaquirks.sinope.thermostat", "SinopeLineThermostats"),
+    ),
+    ("Sinope Technologies", "RM3250ZB"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesLoadController"),
+    ),
+    ("Sinope Technologies", "RM3500ZB"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesCalypso"),
+    ),
+    ("Sinope Technologies", "SP2600ZB"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesNewSwitch"),
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesSwitch"),
+    ),
+    ("Sinope Technologies", "SP2610ZB"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesNewSwitch"),
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesSwitch"),
+    ),
+    ("Sinope Technologies", "SW2500ZB"): (
+        ("zhaquirks.sinope.light", "SinopeTechnologieslight"),
+    ),
+    ("Sinope Technologies", "TH1123ZB"): (
+        ("zhaquirks.sinope.thermostat", "SinopeLineThermostats"),
+        ("zhaquirks.sinope.thermostat", "SinopeTechnologiesThermostat"),
+    ),
+    ("Sinope Technologies", "TH1123ZB-G2"): (
+        ("zhaquirks.sinope.thermostat", "SinopeG2Thermostats"),
+    ),
+    ("Sinope Technologies", "TH1124ZB"): (
+        ("zhaquirks.sinope.thermostat", "SinopeLineThermostats"),
+        ("zhaquirks.sinope.thermostat", "SinopeTechnologiesThermostat"),
+    ),
+    ("Sinope Technologies", "TH1124ZB-G2"): (
+        ("zhaquirks.sinope.thermostat", "SinopeG2Thermostats"),
+    ),
+    ("Sinope Technologies", "TH1300ZB"): (
+        ("zhaquirks.sinope.thermostat", "SinopeTH1300ZB"),
+    ),
+    ("Sinope Technologies", "TH1400ZB"): (
+        ("zhaquirks.sinope.thermostat", "SinopeTH1400ZB"),
+    ),
+    ("Sinope Technologies", "TH1500ZB"): (
+        ("zhaquirks.sinope.thermostat", "SinopeLineThermostats"),
+        ("zhaquirks.sinope.thermostat", "SinopeTechnologiesThermostat"),
+    ),
+    ("Sinope Technologies", "VA4200WZ"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesValve"),
+    ),
+    ("Sinope Technologies", "VA4200ZB"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesValve"),
+    ),
+    ("Sinope Technologies", "VA4201WZ"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesValve"),
+    ),
+    ("Sinope Technologies", "VA4201ZB"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesValve"),
+    ),
+    ("Sinope Technologies", "VA4220ZB"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesValve"),
+    ),
+    ("Sinope Technologies", "VA4221ZB"): (
+        ("zhaquirks.sinope.switch", "SinopeTechnologiesValve"),
+    ),
+    ("Sinope Technologies", "WL4200"): (
+        ("zhaquirks.sinope.sensor", "SinopeTechnologiesSensor2"),
+        ("zhaquirks.sinope.sensor", "SinopeTechnologiesSensor"),
+    ),
+    ("Sinope Technologies", "WL4200S"): (
+        ("zhaquirks.sinope.sensor", "SinopeTechnologiesSensor2"),
+        ("zhaquirks.sinope.sensor", "SinopeTechnologiesSensor"),
+    ),
+    ("SmartThings", "PGC313"): (
+        ("zhaquirks.smartthings.pgc313", "SmartthingsSmartSenseMultiSensor"),
+    ),
+    ("SmartThings", "PGC314"): (
+        ("zhaquirks.smartthings.pgc314", "SmartthingsSmartSenseMotionSensor"),
+    ),
+    ("SmartThings", "moisturev4"): (
+        ("zhaquirks.smartthings.moisturev4", "SmartThingsMoistureV4"),
+    ),
+    ("SmartThings", "motionv4"): (
+        ("zhaquirks.smartthings.motion", "SmartThingsMotion"),
+    ),
+    ("SmartThings", "motionv5"): (
+        ("zhaquirks.smartthings.motion", "SmartThingsMotion"),
+    ),
+    ("SmartThings", "multiv4"): (
+        ("zhaquirks.smartthings.multiv4", "SmartThingsMultiV4"),
+    ),
+    ("Smartwings", "WM25/L-Z"): (("zhaquirks.smartwings.wm25lz", "WM25LBlinds"),),
+    ("Sourcing & Creation", "EB-SB-1B"): (
+        (
+            "zhaquirks.sourcingandcreation.smart_button",
+            "SourcingAndCreationSmartButton",
+        ),
+    ),
+    ("TexasInstruments", "ti.router"): (
+        ("zhaquirks.texasinstruments.router", "TiRouter"),
+    ),
+    ("Third Reality, Inc", "3RSB22BZ"): (("zhaquirks.thirdreality.button", "Button"),),
+    ("Third Reality, Inc", "3RSS007Z"): (("zhaquirks.thirdreality.switch", "Switch"),),
+    ("Third Reality, Inc", "3RSS008Z"): (
+        ("zhaquirks.thirdreality.switch", "SwitchPlus"),
+        ("zhaquirks.thirdreality.switch", "Switch"),
+    ),
+    ("Universal Electronics Inc", "URC4460BC0-X-R"): (
+        ("zhaquirks.universalelectronics.contact_sensor", "ContactSensor"),
+    ),
+    ("Visonic", "MCT-340 E"): (("zhaquirks.visonic.mct340e", "MCT340E"),),
+    ("WAXMAN", "leakSMART Water Sensor V2"): (
+        ("zhaquirks.waxman.leaksmart", "WAXMANleakSMARTv2NOPOLL"),
+        ("zhaquirks.waxman.leaksmart", "WAXMANleakSMARTv2"),
+    ),
+    ("XIAOMI", "lumi.sen_ill.mgl01"): (
+        ("zhaquirks.xiaomi.aqara.illumination", "Illumination"),
+    ),
+    ("Xiaoyan", "TERNCY-PP01"): (("zhaquirks.terncy.pp01", "TerncyAwarenessSwitch"),),
+    ("Xiaoyan", "TERNCY-SD01"): (("zhaquirks.terncy.sd01", "TerncyKnobSmartDimmer"),),
+    ("Yale", "YRD210 PB DB"): (("zhaquirks.yale.realliving", "YRD210PBDB220TSLL"),),
+    ("Yale", "YRD220/240 TSDB"): (("zhaquirks.yale.realliving", "YRD220240TSDB"),),
+    ("Yale", "YRL220 TS LL"): (("zhaquirks.yale.realliving", "YRD210PBDB220TSLL"),),
+    ("Zen Within", "Zen-01"): (("zhaquirks.zen.thermostat", "ZenThermostat"),),
+    ("_TYST11_2atgpdho", "atgpdho"): (
+        ("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type2"),
+    ),
+    ("_TYST11_7hfcudw5", "hfcudw5"): (("zhaquirks.tuya.ts0601_motion", "TuyaMotion"),),
+    ("_TYST11_8daqwrsj", "daqwrsj"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type1"),
+    ),
+    ("_TYST11_9gvruqf5", "gvruqf5"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TYST11_c88teujp"),
+    ),
+    ("_TYST11_KGbxAXL2", "GbxAXL2"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TYST11_c88teujp"),
+    ),
+    ("_TYST11_azqp6ssj", "zqp6ssj"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TYST11_c88teujp"),
+    ),
+    ("_TYST11_c88teujp", "88teujp"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TYST11_c88teujp"),
+    ),
+    ("_TYST11_caj4jz0i", "aj4jz0i"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TYST11_c88teujp"),
+    ),
+    ("_TYST11_ckud7u2l", "kud7u2l"): (
+        ("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type2"),
+    ),
+    ("_TYST11_cwnjrr72", "wnjrr72"): (
+        ("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type2"),
+    ),
+    ("_TYST11_czk78ptr", "zk78ptr"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type1"),
+    ),
+    ("_TYST11_d0yu2xgi", "0yu2xgi"): (("zhaquirks.tuya.ts0601_siren", "TuyaSiren"),),
+    ("_TYST11_hhrtiq0x", "hrtiq0x"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type1"),
+    ),
+    ("_TYST11_i5j6ifxj", "5j6ifxj"): (("zhaquirks.tuya.ts0601_motion", "TuyaMotion"),),
+    ("_TYST11_jeaxp72v", "eaxp72v"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type1"),
+    ),
+    ("_TYST11_kfvq6avy", "fvq6avy"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type1"),
+    ),
+    ("_TYST11_owwdxjbx", "wwdxjbx"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type1"),
+    ),
+    ("_TYST11_ps5v5jor", "s5v5jor"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type1"),
+    ),
+    ("_TYST11_wmcdj3aq", "mcdj3aq"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaCloneCover0601"),
+    ),
+    ("_TYST11_yw7cahqs", "w7cahqs"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TYST11_c88teujp"),
+    ),
+    ("_TYST11_ywdxldoj", "wdxldoj"): (
+        ("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type2"),
+    ),
+    ("_TYST11_zivfvd7h", "ivfvd7h"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type1"),
+    ),
+    ("_TYST11_zuhszj9s", "uhszj9s"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TYST11_c88teujp"),
+    ),
+    ("_TYZB01_z2umiwvq", "SM0202"): (("zhaquirks.tuya.sm0202_motion", "SM0202Motion"),),
+    ("_TZ3000_3zofvcaa", "TS011F"): (("zhaquirks.tuya.ts011f_plug", "Plug_2AC_2USB"),),
+    ("_TZ3000_49qchf10", "TS0502A"): (("zhaquirks.lidl.cct", "CCTLight"),),
+    ("_TZ3000_4fjiwweb", "TS004F"): (
+        ("zhaquirks.tuya.ts004f", "TuyaSmartRemote004FROK"),
+    ),
+    ("_TZ3000_4whigl8i", "TS0501B"): (
+        ("zhaquirks.tuya.ts0501b", "DimmableLedController"),
+    ),
+    ("_TZ3000_7dcddnye", "TS0501A"): (("zhaquirks.lidl.TS0501A", "DimmableBulb"),),
+    ("_TZ3000_8uaoilu9", "TS0502A"): (("zhaquirks.lidl.cct", "CCTLight"),),
+    ("_TZ3000_9evm3otq", "TS0502A"): (("zhaquirks.lidl.cct", "CCTLight"),),
+    ("_TZ3000_abrsvsou", "TS004F"): (
+        ("zhaquirks.tuya.ts004f", "TuyaSmartRemote004FROK"),
+    ),
+    ("_TZ3000_csflgqj2", "TS004F"): (
+        ("zhaquirks.tuya.ts004f", "TuyaSmartRemote004FROK"),
+    ),
+    ("_TZ3000_czuyt8lz", "TS004F"): (
+        ("zhaquirks.tuya.ts004f", "TuyaSmartRemote004FDMS"),
+    ),
+    ("_TZ3000_dbou1ap4", "TS0505A"): (("zhaquirks.lidl.rgbcct", "RGBCCTLight"),),
+    ("_TZ3000_el5kt5im", "TS0502A"): (("zhaquirks.lidl.cct", "CCTLight"),),
+    ("_TZ3000_ixla93vd", "TS004F"): (
+        ("zhaquirks.tuya.ts004f", "TuyaSmartRemote004FROK"),
+    ),
+    ("_TZ3000_lfa05ajd", "TS0201"): (
+        ("zhaquirks.tuya.ts0201", "ZemismartTemperatureHumidtySensor"),
+    ),
+    ("_TZ3000_nbnmw9nc", "TS0501A"): (("zhaquirks.lidl.TS0501A", "DimmableBulb"),),
+    ("_TZ3000_nosnx7im", "TS0501A"): (("zhaquirks.lidl.TS0501A", "DimmableBulb"),),
+    ("_TZ3000_oborybow", "TS0502A"): (("zhaquirks.lidl.cct", "CCTLight"),),
+    ("_TZ3000_oh7jddmx", "TS0502A"): (("zhaquirks.lidl.cct", "CCTLight"),),
+    ("_TZ3000_qaaysllp", "TS0201"): (
+        ("zhaquirks.tuya.ts0201", "NeoTemperatureHumidtyIlluminanceSensor"),
+    ),
+    ("_TZ3000_qeuvnohg", "TS011F"): (
+        ("zhaquirks.tuya.ts011f_plug", "Plug_CB_Metering"),
+    ),
+    ("_TZ3000_qja6nq5z", "TS004F"): (
+        ("zhaquirks.tuya.ts004f", "TuyaSmartRemote004FROK"),
+    ),
+    ("_TZ3000_rylaozuc", "TS0502A"): (("zhaquirks.lidl.cct", "CCTLight"),),
+    ("_TZ3000_uim07oem", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSingleSwitchTO"),
+    ),
+    ("_TZ3000_uri7ongn", "TS004F"): (
+        ("zhaquirks.tuya.ts004f", "TuyaSmartRemote004FROK"),
+    ),
+    ("_TZ3000_xabckq1v", "TS004F"): (
+        ("zhaquirks.tuya.ts004f", "TuyaSmartRemote004FDMS"),
+    ),
+    ("_TZ3210_4zinq6io", "TS0501B"): (
+        ("zhaquirks.tuya.ts0501bs", "DimmableLedController"),
+    ),
+    ("_TZ3210_9q49basr", "TS0501B"): (
+        ("zhaquirks.tuya.ts0501bs", "DimmableLedController"),
+    ),
+    ("_TZ3210_e5t9bfdv", "TS0501B"): (
+        ("zhaquirks.tuya.ts0501bs", "DimmableLedController"),
+    ),
+    ("_TZ3210_i680rtja", "TS0501B"): (
+        ("zhaquirks.tuya.ts0501bs", "DimmableLedController"),
+    ),
+    ("_TZ3210_lzqq3u4r", "TS0501"): (
+        ("zhaquirks.tuya.ts0501_fan_switch", "TS0501FanSwitch"),
+    ),
+    ("_TZ3210_ngqk6jia", "TS110E"): (
+        ("zhaquirks.tuya.ts110e", "DimmerSwitchWithNeutral1Gang"),
+    ),
+    ("_TZE200_04yfvweb", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_0dvm9mva", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_0nauxa0p", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_1agwnems", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_1n2kyphz", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaQuadrupleSwitch_GP"),
+    ),
+    ("_TZE200_1ozguk6x", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaQuadrupleSwitchTO"),
+    ),
+    ("_TZE200_2atgpdho", "TS0601"): (("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1"),),
+    ("_TZE200_2cs6g9i7", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_2ekuz3dz", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_electric_heating", "MoesBHT"),
+    ),
+    ("_TZE200_2hf7x9n3", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaTripleSwitch_GP"),
+    ),
+    ("_TZE200_3i3exuay", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601_inv_position"),
+        ("zhaquirks.tuya.ts0601_cover", "TuyaZemismartSmartCover0601_2"),
+    ),
+    ("_TZE200_3p5ydos3", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmerGP"),
+    ),
+    ("_TZE200_3yp57tby", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_4eeyebrt", "TS0601"): (("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1"),),
+    ("_TZE200_5sbebbzs", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_68nvbio9", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_7bztmfm1", "TS0601"): (("zhaquirks.tuya.ts0601_co", "TuyaCOSensor"),),
+    ("_TZE200_7deq70b8", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaDoubleSwitch_GP"),
+    ),
+    ("_TZE200_7eue9vhc", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_7hfcudw5", "TS0601"): (("zhaquirks.tuya.ts0601_motion", "NeoMotion"),),
+    ("_TZE200_7tdtqgwv", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSingleSwitchTI"),
+    ),
+    ("_TZE200_7yoranx2", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_81isopgh", "TS0601"): (("zhaquirks.tuya.ts0601_valve", "TuyaValve"),),
+    ("_TZE200_8daqwrsj", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_8whxpsiw", "TS0601"): (("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1"),),
+    ("_TZE200_8ygsuhe1", "TS0601"): (
+        ("zhaquirks.tuya.air.ts0601_air_quality", "TuyaCO2Sensor"),
+    ),
+    ("_TZE200_9cxuhakf", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_9gvruqf5", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_9i9dt8is", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_9m4kmbfu", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_9mahtqtg", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSextupleSwitchTO_GP"),
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSextupleSwitchTO"),
+    ),
+    ("_TZE200_9sfg7gm0", "TS0601"): (("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1"),),
+    ("_TZE200_9yapgbuv", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaTempHumiditySensorVar03"),
+    ),
+    ("_TZE200_a0syesf5", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_a7sghmms", "TS0601"): (("zhaquirks.tuya.ts0601_valve", "GiexValve"),),
+    ("_TZE200_a8sdabtg", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaTempHumiditySensor_Square"),
+    ),
+    ("_TZE200_amp6tsvy", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSingleSwitchTO"),
+    ),
+    ("_TZE200_aoclfnxz", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_electric_heating", "MoesBHT"),
+    ),
+    ("_TZE200_aqnazj70", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaQuadrupleSwitchTO"),
+    ),
+    ("_TZE200_ar0slwnd", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_motion", "MmwRadarMotionGPP"),
+        ("zhaquirks.tuya.ts0601_motion", "MmwRadarMotion"),
+    ),
+    ("_TZE200_aycxwiau", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_smoke", "TuyaSmokeDetector0601"),
+    ),
+    ("_TZE200_azqp6ssj", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_b6wax7g0", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1new"),
+    ),
+    ("_TZE200_bjawzodf", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaTempHumiditySensor"),
+    ),
+    ("_TZE200_bkkmqmyo", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_din_power", "HikingPowerMeter"),
+    ),
+    ("_TZE200_bv1jcqqu", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_byzdayie", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_din_power", "TuyaPowerMeter"),
+    ),
+    ("_TZE200_c2fmom5z", "TS0601"): (
+        ("zhaquirks.tuya.air.ts0601_air_quality", "TuyaCO2SensorGPP"),
+    ),
+    ("_TZE200_c88teujp", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_cf1sl3tj", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_ckud7u2l", "TS0601"): (("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1"),),
+    ("_TZE200_cowvfni3", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaZemismartSmartCover0601_inv_controls"),
+    ),
+    ("_TZE200_cpmgn2cf", "TS0601"): (("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1"),),
+    ("_TZE200_cwnjrr72", "TS0601"): (("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1"),),
+    ("_TZE200_czk78ptr", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_d0yu2xgi", "TS0601"): (("zhaquirks.tuya.ts0601_siren", "TuyaSiren2"),),
+    ("_TZE200_dfxkcots", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_dq1mfjug", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_smoke", "TuyaSmokeDetector0601"),
+    ),
+    ("_TZE200_dwcarsat", "TS0601"): (
+        ("zhaquirks.tuya.air.ts0601_air_quality", "TuyaCO2SensorGPP"),
+        ("zhaquirks.tuya.air.ts0601_air_quality", "TuyaCO2Sensor"),
+    ),
+    ("_TZE200_e3oitdyu", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaDoubleSwitchDimmer"),
+    ),
+    ("_TZE200_e9ba97vf", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_ebwgzdqq", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_ergbiejo", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_ewxhg6o9", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_din_power", "TuyaPowerMeter"),
+    ),
+    ("_TZE200_exfrnlow", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_fjjbhx9d", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaDoubleSwitchDimmerGP"),
+    ),
+    ("_TZE200_fzo2pocs", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaZemismartSmartCover0601_3"),
+        ("zhaquirks.tuya.ts0601_cover", "TuyaZemismartSmartCover0601"),
+    ),
+    ("_TZE200_g1ib5ldv", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaDoubleSwitchTO"),
+    ),
+    ("_TZE200_gbagoilo", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSingleSwitch_GP"),
+    ),
+    ("_TZE200_ggev5fsl", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_gas", "TuyaGasDetector0601"),
+    ),
+    ("_TZE200_go3tvswy", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaTripleSwitch_GP"),
+    ),
+    ("_TZE200_gubdgai2", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_gwkapsoq", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaDoubleSwitchDimmerGP"),
+    ),
+    ("_TZE200_h4cgnbzg", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_hhrtiq0x", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_hkdl5fmv", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_rcbo", "TuyaCircuitBreaker"),
+    ),
+    ("_TZE200_hsgrhjpf", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_htnnfasr", "TS0601"): (("zhaquirks.tuya.ts0601_valve", "ParksidePSBZS"),),
+    ("_TZE200_hue3yfsn", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_husqqvux", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_iossyxra", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaZemismartSmartCover0601_3"),
+    ),
+    ("_TZE200_ip2akl4w", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmerGP"),
+    ),
+    ("_TZE200_jeaxp72v", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_k6jhsr0q", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaQuadrupleSwitchTO"),
+    ),
+    ("_TZE200_kds0pmmv", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_kfvq6avy", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_khx7nnka", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_illuminance", "TuyaIlluminance"),
+    ),
+    ("_TZE200_kly8gjlz", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_la2c2uo9", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_lllliz3p", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_lnbfnyxd", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_m9skfctm", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_smoke", "TuyaSmokeDetector0601"),
+    ),
+    ("_TZE200_mexisfik", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaQuadrupleSwitch_GP"),
+    ),
+    ("_TZE200_mrf6vtua", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_motion", "MmwRadarMotionGPP"),
+        ("zhaquirks.tuya.ts0601_motion", "MmwRadarMotion"),
+    ),
+    ("_TZE200_mudxchsu", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_myd45weu", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaSoilSensor"),
+    ),
+    ("_TZE200_nh9m9emk", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaDoubleSwitch_GP"),
+    ),
+    ("_TZE200_nhyj64w2", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_nklqjk62", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_garage", "TuyaGarageSwitchTO"),
+    ),
+    ("_TZE200_nogaemzt", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601_inv_position"),
+    ),
+    ("_TZE200_ntcy3xu1", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_smoke", "TuyaSmokeDetector0601"),
+    ),
+    ("_TZE200_nueqqe6k", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_ogkdpgy2", "TS0601"): (
+        ("zhaquirks.tuya.air.ts0601_air_quality", "TuyaNDIRCO2SensorGPP"),
+    ),
+    ("_TZE200_oisqyl4o", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSingleSwitchTO"),
+    ),
+    ("_TZE200_owwdxjbx", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_p0gzbqct", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_ppuj1vem", "TS0601"): (("zhaquirks.tuya.ts0601_motion", "NeoMotion"),),
+    ("_TZE200_ps5v5jor", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_pvvbommb", "TS0601"): (("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1"),),
+    ("_TZE200_pw7mji0l", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaZemismartSmartCover0601_3"),
+    ),
+    ("_TZE200_qoy0ekbd", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaTempHumiditySensor_Square"),
+    ),
+    ("_TZE200_qyflbnbj", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaTempHumiditySensorVar03"),
+    ),
+    ("_TZE200_rddyvrci", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601_alt_controls"),
+    ),
+    ("_TZE200_ryfmq5rl", "TS0601"): (
+        ("zhaquirks.tuya.air.ts0601_air_quality", "TuyaCO2SensorGPP"),
+    ),
+    ("_TZE200_sfiy5tfs", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_motion", "MmwRadarMotionGPP"),
+        ("zhaquirks.tuya.ts0601_motion", "MmwRadarMotion"),
+    ),
+    ("_TZE200_sh1btabb", "TS0601"): (("zhaquirks.tuya.ts0601_valve", "GiexValve"),),
+    ("_TZE200_sur6q7ko", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "ZonnsmartTV01_ZG"),
+    ),
+    ("_TZE200_swaamsoy", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_t1blo2bj", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_siren", "TuyaSirenGPP_NoSensors"),
+    ),
+    ("_TZE200_tviaymwx", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSingleSwitchTO"),
+    ),
+    ("_TZE200_tz32mtza", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaTripleSwitchTO"),
+    ),
+    ("_TZE200_u9bfwha0", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_electric_heating", "MoesBHT"),
+    ),
+    ("_TZE200_utkemkbs", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaTempHumiditySensorVar03"),
+    ),
+    ("_TZE200_vhy3iakz", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSingleSwitchTO"),
+    ),
+    ("_TZE200_vm1gyrso", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaTripleSwitchDimmerGP"),
+    ),
+    ("_TZE200_vucankjx", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmerGP"),
+    ),
+    ("_TZE200_vzekyi4c", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_smoke", "TuyaSmokeDetector0601"),
+    ),
+    ("_TZE200_w4cryh2i", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_wfxuhoea", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaSingleSwitchTO"),
+        ("zhaquirks.tuya.ts0601_garage", "TuyaGarageSwitchTO"),
+    ),
+    ("_TZE200_whpb9yts", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_dimmer", "TuyaSingleSwitchDimmer"),
+    ),
+    ("_TZE200_wmcdj3aq", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaZemismartSmartCover0601_2_inv_position"),
+    ),
+    ("_TZE200_wukb7rhc", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_motion", "MmwRadarMotion"),
+    ),
+    ("_TZE200_wunufsil", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_switch", "TuyaDoubleSwitchTO"),
+    ),
+    ("_TZE200_xaabybja", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601_inv_position"),
+    ),
+    ("_TZE200_xuzcvlku", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601_inv_position"),
+    ),
+    ("_TZE200_ye5jkfsb", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_electric_heating", "MoesBHT"),
+    ),
+    ("_TZE200_yenbr4om", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601_inv_position"),
+    ),
+    ("_TZE200_yi4jtqq1", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_illuminance", "TuyaIlluminance"),
+    ),
+    ("_TZE200_yjjdcqsq", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaTempHumiditySensorVar03"),
+    ),
+    ("_TZE200_yvx5lh6k", "TS0601"): (
+        ("zhaquirks.tuya.air.ts0601_air_quality", "TuyaCO2SensorGPP"),
+        ("zhaquirks.tuya.air.ts0601_air_quality", "TuyaCO2Sensor"),
+    ),
+    ("_TZE200_yw7cahqs", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_ywdxldoj", "TS0601"): (("zhaquirks.tuya.ts0601_trv", "MoesHY368_Type1"),),
+    ("_TZE200_zah67ekd", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601"),
+    ),
+    ("_TZE200_zivfvd7h", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv", "SiterwellGS361_Type2"),
+    ),
+    ("_TZE200_zl1kmjqx", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaTempHumiditySensor"),
+    ),
+    ("_TZE200_znbl8dj5", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_sensor", "TuyaTempHumiditySensor_Square"),
+    ),
+    ("_TZE200_znzs7yaw", "TS0601"): (("zhaquirks.tuya.ts0601_haozee", "HY08WE"),),
+    ("_TZE200_zpzndjez", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaZemismartSmartCover0601_3_inv_position"),
+        ("zhaquirks.tuya.ts0601_cover", "TuyaZemismartSmartCover0601_inv_position"),
+    ),
+    ("_TZE200_zr9c0day", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_ztc6ggyl", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_motion", "MmwRadarMotion"),
+    ),
+    ("_TZE200_zuhszj9s", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_trv_sas", "Thermostat_TZE200_c88teujp"),
+    ),
+    ("_TZE200_zuz7f94z", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_cover", "TuyaMoesCover0601_inv_position"),
+    ),
+    ("_TZE204_t1blo2bj", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_siren", "TuyaSirenGPP_NoSensors"),
+    ),
+    ("_TZE204_ztc6ggyl", "TS0601"): (
+        ("zhaquirks.tuya.ts0601_motion", "MmwRadarMotion"),
+    ),
+    ("aqara", "lumi.motion.ac01"): (
+        ("zhaquirks.xiaomi.aqara.motion_ac01", "AqaraLumiMotionAc01"),
+    ),
+    ("eWeLink", "WB01"): (("zhaquirks.sonoff.button", "SonoffButton"),),
+    ("frient A/S", "AQSZB-110"): (("zhaquirks.develco.air_quality", "AQSZB110"),),
+    ("frient A/S", "HESZB-120"): (
+        ("zhaquirks.develco.heat_alarm", "HESZB120F"),
+        ("zhaquirks.develco.heat_alarm", "HESZB120"),
+    ),
+    ("frient A/S", "MOSZB-140"): (
+        ("zhaquirks.develco.motion", "MOSZB140_Var02"),
+        ("zhaquirks.develco.motion", "MOSZB140"),
+    ),
+    ("frient A/S", "SMSZB-120"): (("zhaquirks.develco.smoke_alarm", "SMSZB120"),),
+    ("iMagic by GreatStar", "1116-S"): (("zhaquirks.imagic.im1116s", "iMagic1116"),),
+    ("iMagic by GreatStar", "1117-S"): (("zhaquirks.imagic.gs1117s", "Greatstar"),),
+    ("iluminize", "CCT Lighting"): (("zhaquirks.iluminize.cct", "CCTLight"),),
+    ("iluminize", "DIM Lighting"): (("zhaquirks.iluminize.dim", "DIMLight"),),
+    ("innr", "RS 228 T"): (("zhaquirks.innr.rs228t", "RS228T"),),
+    ("innr", "SP 120"): (("zhaquirks.innr.innr_sp120_plug", "SP120"),),
+    ("innr", "SP 234"): (("zhaquirks.innr.innr_sp234_plug", "SP234"),),
+    ("lk", "ZB-MotionSensor-D0003"): (("zhaquirks.linkind.motion", "LinkindD0003"),),
+    ("sengled", "E1E-G7F"): (("zhaquirks.sengled.e1e_g7f", "SengledE1EG7F"),),
+    ("中性", "700ae5aab3414ec09c1872efe7b8755a"): (
+        ("zhaquirks.zhongxing.motion", "SN10ZW"),
+    ),
+    ("欧瑞博", "abb71ca5fe1846f185cfbda554046cce"): (
+        ("zhaquirks.orvibo.dimmer", "T10D1ZW"),
+    ),
+    (None, "PST03A-v2.2.5"): (("zhaquirks.philio.pst03a", "Pst03a"),),
+    (None, "TERNCY-PP01"): (("zhaquirks.terncy.pp01", "TerncyAwarenessSwitch"),),
+    (None, "TERNCY-SD01"): (("zhaquirks.terncy.sd01", "TerncyKnobSmartDimmer"),),
+    (None, "TS0001"): (
+        ("zhaquirks.tuya.ts000x", "Switch_1G_Metering"),
+        ("zhaquirks.tuya.ts000x", "Switch_1G_GPP"),
+    ),
+    (None, "TS0002"): (
+        ("zhaquirks.tuya.ts000x", "Switch_2G_Var03"),
+        ("zhaquirks.tuya.ts000x", "Switch_2G_Metering"),
+        ("zhaquirks.tuya.ts000x", "Switch_2G_GPP"),
+    ),
+    (None, "TS0003"): (
+        ("zhaquirks.tuya.ts000x", "Switch_3G_Metering"),
+        ("zhaquirks.tuya.ts000x", "Switch_3G_GPP"),
+    ),
+    (None, "TS0004"): (
+        ("zhaquirks.tuya.ts000x", "Switch_4G_Metering"),
+        ("zhaquirks.tuya.ts000x", "Switch_4G_GPP"),
+    ),
+    (None, "TS0011"): (
+        ("zhaquirks.tuya.ts001x", "Tuya_Single_No_N"),
+        ("zhaquirks.tuya.ts001x", "TuyaSingleNoNeutralSwitch_2"),
+        ("zhaquirks.tuya.ts001x", "TuyaSingleNoNeutralSwitch"),
+    ),
+    (None, "TS0012"): (
+        ("zhaquirks.tuya.ts001x", "Tuya_Double_Var05"),
+        ("zhaquirks.tuya.ts001x", "Tuya_Double_No_N_Plus"),
+        ("zhaquirks.tuya.ts001x", "Tuya_Double_No_N"),
+        ("zhaquirks.tuya.ts001x", "TuyaDoubleNoNeutralSwitch_2"),
+        ("zhaquirks.tuya.ts001x", "TuyaDoubleNoNeutralSwitch"),
+    ),
+    (None, "TS0013"): (
+        ("zhaquirks.tuya.ts001x", "TuyaTripleGang_var05"),
+        ("zhaquirks.tuya.ts001x", "Tuya_Triple_No_N_Plus"),
+        ("zhaquirks.tuya.ts001x", "Tuya_Triple_No_N"),
+        ("zhaquirks.tuya.ts001x", "TuyaTripleNoNeutralSwitch_2"),
+        ("zhaquirks.tuya.ts001x", "TuyaTripleNoNeutralSwitch"),
+    ),
+    (None, "TS0041"): (
+        ("zhaquirks.tuya.ts0041", "TuyaSmartRemote0041TOPlusA"),
+        ("zhaquirks.tuya.ts0041", "TuyaSmartRemote0041TI"),
+        ("zhaquirks.tuya.ts0041", "TuyaSmartRemote0041TO"),
+    ),
+    (None, "TS0042"): (
+        ("zhaquirks.tuya.ts0042", "TuyaSmartRemote0042TOPlusA"),
+        ("zhaquirks.tuya.ts0042", "TuyaSmartRemote0042TO"),
+        ("zhaquirks.tuya.ts0042", "TuyaSmartRemote0042TI"),
+    ),
+    (None, "TS0043"): (
+        ("zhaquirks.tuya.ts0043", "TuyaSmartRemote0043TOPlusB"),
+        ("zhaquirks.tuya.ts0043", "TuyaSmartRemote0043TOPlusA"),
+        ("zhaquirks.tuya.ts0043", "TuyaSmartRemote0043TO"),
+        ("zhaquirks.tuya.ts0043", "TuyaSmartRemote0043TI"),
+    ),
+    (None, "TS0044"): (
+        ("zhaquirks.tuya.ts0044", "TuyaSmartRemote0044TOPlusB"),
+        ("zhaquirks.tuya.ts0044", "TuyaSmartRemote0044TOPlusA"),
+        ("zhaquirks.tuya.ts0044", "TuyaSmartRemote0044TO"),
+        ("zhaquirks.tuya.ts0044", "TuyaSmartRemote0044TI"),
+    ),
+    (None, "TS0046"): (("zhaquirks.tuya.ts0046", "TuyaSmartRemote0046"),),
+    (None, "TS004F"): (("zhaquirks.tuya.ts004f", "TuyaSmartRemote004F"),),
+    (None, "TS011F"): (
+        ("zhaquirks.tuya.ts011f_switch", "Tuya_1G_Switch"),
+        ("zhaquirks.tuya.ts011f_switch", "Tuya_2G_Switch"),
+        ("zhaquirks.lidl.ts011f_plug", "Lidl_Plug_3AC_4USB"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_2AC_var05"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_2AC_var03"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_v2"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_4AC_2USB_Metering"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_4AC_2USB_cfnprab5"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_TZ3210_1AC"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_TZ3210_2AC"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_4AC_2USB"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_3AC_4USB"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug_1AC"),
+        ("zhaquirks.tuya.ts011f_plug", "Plug"),
+    ),
+    (None, "TS0121"): (
+        ("zhaquirks.tuya.ts0121_plug", "TS0121_Var03"),
+        ("zhaquirks.tuya.ts0121_plug", "TS0121B"),
+        ("zhaquirks.tuya.ts0121_plug", "Plug"),
+    ),
+    (None, "TS0210"): (
+        ("zhaquirks.tuya.ts0210", "TuyaVibration_TO"),
+        ("zhaquirks.tuya.ts0210", "TuyaVibration"),
+    ),
+    (None, "TS0211"): (("zhaquirks.tuya.ts0211", "TuyaDoorbell0211"),),
+    (None, "TS130F"): (
+        ("zhaquirks.tuya.ts130f", "TuyaTS130ESTC"),
+        ("zhaquirks.tuya.ts130f", "TuyaTS130Double_GP"),
+        ("zhaquirks.tuya.ts130f", "TuyaTS130GP"),
+        ("zhaquirks.tuya.ts130f", "TuyaTS130FTO"),
+        ("zhaquirks.tuya.ts130f", "TuyaTS130FTI2"),
+        ("zhaquirks.tuya.ts130f", "TuyaTS130FTOGP"),
+        ("zhaquirks.tuya.ts130f", "TuyaZemismartTS130F"),
+        ("zhaquirks.tuya.ts130f", "TuyaTS130FTI"),
+    ),
+    (None, "aqara.feeder.acn001"): (
+        ("zhaquirks.xiaomi.aqara.feeder_acn001", "AqaraFeederAcn001"),
+    ),
+    (None, None): (
+        ("zhaquirks.xiaomi.aqara.opple_switch", "XiaomiOpple2ButtonSwitchFace2"),
+        ("zhaquirks.xiaomi.aqara.opple_switch", "XiaomiOpple2ButtonSwitchFace1"),
+        ("zhaquirks.xbee.xbee_io", "XBeeSensor"),
+        ("zhaquirks.xbee.xbee3_io", "XBee3Sensor"),
+        ("zhaquirks.tuya.ts0201", "MoesTemperatureHumidtySensorWithScreen"),
+        ("zhaquirks.smartthings.tag_v4", "SmartThingsTagV4"),
+        ("zhaquirks.smartthings.multi", "SmartthingsMultiPurposeSensor"),
+        ("zhaquirks.netvox.z308e3ed", "Z308E3ED"),
+        ("zhaquirks.gledopto.soposhgu10", "SoposhGU10"),
+    ),
+}
@@ -0,0 +1,412 @@
+"""Record incoming frames of a zigpy network and replay them against quirks."""
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import importlib
+import json
+import logging
+import math
+import struct
+import time
+from typing import Any, BinaryIO, Callable, Iterator
+
+import zigpy.device
+import zigpy.quirks
+from zigpy.quirks import CustomDevice
+import zigpy.types as t
+from zigpy.zcl import foundation
+
+from zhaquirks.const import (
+    DEVICE_TYPE,
+    ENDPOINTS,
+    INPUT_CLUSTERS,
+    OUTPUT_CLUSTERS,
+    PROFILE_ID,
+)
+from zhaquirks.tuya import TuyaSetTimeMixin, TuyaTimeSync
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"ZQRR\x01"
+
+RECORD_DEVICE = 1
+RECORD_FRAME = 2
+
+# kind, device index, length of the JSON device description
+_DEVICE = struct.Struct("<BHI")
+# kind, ms since the start, device index, profile, cluster, src ep, dst ep, length
+_FRAME = struct.Struct("<BIHHHBBH")
+
+TIMERS = "timers"
+DEFAULT_TAIL_S = 600
+
+
+@dataclasses.dataclass(frozen=True)
+class RecordedFrame:
+    """A frame received from a device."""
+
+    offset: float
+    device: int
+    profile: int
+    cluster: int
+    src_ep: int
+    dst_ep: int
+    data: bytes
+
+
+def quirk_path(cls: type) -> str:
+    """Return the `module:qualname` path a quirk class is recorded and reported by."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def device_description(device: zigpy.device.Device) -> dict[str, Any]:
+    """Describe a device so it can be rebuilt, with its quirk, on replay.
+
+    The endpoints of a quirked device are those of its signature, as the
+    device has them before the quirk replaces them.
+    """
+    quirk = None
+    if isinstance(device, CustomDevice):
+        quirk = quirk_path(type(device))
+        endpoints = {
+            ep_id: (
+                ep.get(PROFILE_ID),
+                ep.get(DEVICE_TYPE),
+                ep.get(INPUT_CLUSTERS, []),
+                ep.get(OUTPUT_CLUSTERS, []),
+            )
+            for ep_id, ep in type(device).signature[ENDPOINTS].items()
+        }
+    else:
+        endpoints = {
+            ep_id: (
+                endpoint.profile_id,
+                endpoint.device_type,
+                endpoint.in_clusters,
+                endpoint.out_clusters,
+            )
+            for ep_id, endpoint in device.endpoints.items()
+            if ep_id != 0
+        }
+
+    return {
+        "ieee": str(device.ieee),
+        "nwk": int(device.nwk),
+        "manufacturer": device.manufacturer,
+        "model": device.model,
+        "quirk": quirk,
+        "endpoints": {
+            str(ep_id): {
+                "profile_id": profile_id,
+                "device_type": None if device_type is None else int(device_type),
+                "in_clusters": sorted(in_clusters),
+                "out_clusters": sorted(out_clusters),
+            }
+            for ep_id, (
+                profile_id,
+                device_type,
+                in_clusters,
+                out_clusters,
+            ) in endpoints.items()
+        },
+    }
+
+
+class FrameRecorder:
+    """Write the frames received by a zigpy application to a file.
+
+    Add it as a listener of the application, ``app.add_listener(recorder)``,
+    to be called for every frame. Each device is described once, when its
+    first frame is recorded; frames then take 14 bytes besides their data.
+    """
+
+    def __init__(
+        self, stream: BinaryIO, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._stream = stream
+        self._clock = clock
+        self._start: float | None = None
+        self._devices: dict[t.EUI64, int] = {}
+        self.frames = 0
+        stream.write(MAGIC)
+
+    @classmethod
+    def open(cls, path: str, **kwargs) -> FrameRecorder:
+        """Record to a new file at path."""
+        return cls(open(path, "wb"), **kwargs)
+
+    def close(self) -> None:
+        """Close the file."""
+        self._stream.close()
+
+    def handle_message(
+        self,
+        sender: zigpy.device.Device,
+        profile: int,
+        cluster: int,
+        src_ep: int,
+        dst_ep: int,
+        message: bytes,
+    ) -> None:
+        """Record a frame received from sender."""
+        now = self._clock()
+        if self._start is None:
+            self._start = now
+
+        index = self._devices.get(sender.ieee)
+        if index is None:
+            index = self._devices[sender.ieee] = len(self._devices)
+            description = json.dumps(device_description(sender)).encode()
+            self._stream.write(
+                _DEVICE.pack(RECORD_DEVICE, index, len(description)) + description
+            )
+
+        self._stream.write(
+            _FRAME.pack(
+                RECORD_FRAME,
+                round((now - self._start) * 1000),
+                index,
+                profile,
+                cluster,
+                src_ep,
+                dst_ep,
+                len(message),
+            )
+            + message
+        )
+        self.frames += 1
+
+
+def read_recording(
+    stream: BinaryIO,
+) -> Iterator[tuple[int, dict[str, Any]] | RecordedFrame]:
+    """Yield the device descriptions, as (index, description), and frames of a recording."""
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a frame recording")
+
+    while kind := stream.read(1):
+        if kind[0] == RECORD_DEVICE:
+            _, index, length = _DEVICE.unpack(kind + stream.read(_DEVICE.size - 1))
+            yield index, json.loads(stream.read(length))
+        elif kind[0] == RECORD_FRAME:
+            (
+                _,
+                offset_ms,
+                index,
+                profile,
+                cluster,
+                src_ep,
+                dst_ep,
+                length,
+            ) = _FRAME.unpack(kind + stream.read(_FRAME.size - 1))
+            yield RecordedFrame(
+                offset_ms / 1000,
+                index,
+                profile,
+                cluster,
+                src_ep,
+                dst_ep,
+                stream.read(length),
+            )
+        else:
+            raise ValueError(f"Unknown record type {kind[0]}")
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock only moves when advanced.
+
+    Timers scheduled by quirks, such as motion resets, multi-press windows or
+    Tuya time syncs, run in order of their deadline as the clock is advanced,
+    without waiting for them.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._now = 0.0
+
+    def time(self) -> float:
+        """Return the virtual time."""
+        return self._now
+
+    async def settle(self) -> None:
+        """Run the callbacks ready at the current time, and those they schedule."""
+        await asyncio.sleep(0)
+        while self._ready:
+            await asyncio.sleep(0)
+
+    def next_deadline(self) -> float | None:
+        """Return the earliest deadline of the pending timers."""
+        return min(
+            (handle.when() for handle in self._scheduled if not handle.cancelled()),
+            default=None,
+        )
+
+    async def advance(self, when: float) -> None:
+        """Move the clock to `when`, running the timers due on the way."""
+        while True:
+            await self.settle()
+            deadline = self.next_deadline()
+            if deadline is None or deadline > when:
+                break
+            self._now = max(self._now, deadline)
+        self._now = max(self._now, when)
+        await self.settle()
+
+
+class ReplayApplication:
+    """Application of replayed devices, accepting requests without sending them.
+
+    Benchmarks use it too, so only the device side of a frame is measured.
+    """
+
+    _dblistener = None
+
+    def __init__(self) -> None:
+        self._req_listeners = collections.defaultdict(list)
+        self._tsn = 0
+
+    def get_sequence(self) -> int:
+        """Return the next transaction sequence number."""
+        self._tsn = (self._tsn + 1) % 256
+        return self._tsn
+
+    async def request(self, *args, **kwargs):
+        """Accept a request, such as a default response."""
+        return foundation.Status.SUCCESS, None
+
+
+class _EventCounter:
+    """Listener counting the events emitted by clusters by name."""
+
+    def __init__(self, events: collections.Counter) -> None:
+        self._events = events
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def count(*args, **kwargs) -> None:
+            self._events[name] += 1
+
+        return count
+
+
+@dataclasses.dataclass
+class QuirkStats:
+    """CPU time spent on the frames of the devices of a quirk, and their events."""
+
+    devices: int = 0
+    frames: int = 0
+    cpu_s: float = 0.0
+    events: collections.Counter = dataclasses.field(default_factory=collections.Counter)
+
+
+def build_device(application: Any, description: dict[str, Any]) -> zigpy.device.Device:
+    """Rebuild a recorded device, with the quirk it had or the one matching now."""
+    ieee = t.EUI64.convert(description["ieee"])
+    nwk = t.NWK(description["nwk"])
+
+    device = zigpy.device.Device(application, ieee, nwk)
+    device.manufacturer = description["manufacturer"]
+    device.model = description["model"]
+    for ep_id, ep in description["endpoints"].items():
+        endpoint = device.add_endpoint(int(ep_id))
+        endpoint.profile_id = ep["profile_id"]
+        endpoint.device_type = ep["device_type"]
+        for cluster_id in ep["in_clusters"]:
+            endpoint.add_input_cluster(cluster_id)
+        for cluster_id in ep["out_clusters"]:
+            endpoint.add_output_cluster(cluster_id)
+
+    if description["quirk"] is not None:
+        module, _, qualname = description["quirk"].partition(":")
+        try:
+            quirk = importlib.import_module(module)
+            for name in qualname.split("."):
+                quirk = getattr(quirk, name)
+        except (ImportError, AttributeError):
+            _LOGGER.warning(
+                "Recorded quirk %s of %s not found", description["quirk"], ieee
+            )
+        else:
+            return quirk(application, ieee, nwk, device)
+
+    return zigpy.quirks.get_device(device)
+
+
+async def _replay(
+    stream: BinaryIO, stats: dict[str, QuirkStats], tail_s: float
+) -> None:
+    loop = asyncio.get_running_loop()
+    application = ReplayApplication()
+    devices: dict[int, tuple[zigpy.device.Device, QuirkStats]] = {}
+    timers = stats[TIMERS] = QuirkStats()
+
+    for record in read_recording(stream):
+        if not isinstance(record, RecordedFrame):
+            index, description = record
+            device = build_device(application, description)
+            quirk = quirk_path(type(device))
+            quirk_stats = stats.setdefault(quirk, QuirkStats())
+            quirk_stats.devices += 1
+            counter = _EventCounter(quirk_stats.events)
+            for ep_id, endpoint in device.endpoints.items():
+                if ep_id == 0:
+                    continue
+                for cluster in (
+                    *endpoint.in_clusters.values(),
+                    *endpoint.out_clusters.values(),
+                ):
+                    cluster.add_listener(counter)
+            devices[index] = device, quirk_stats
+            continue
+
+        if record.offset > loop.time():
+            start = time.process_time()
+            await loop.advance(record.offset)
+            timers.cpu_s += time.process_time() - start
+
+        device, quirk_stats = devices[record.device]
+        start = time.process_time()
+        device.handle_message(
+            record.profile, record.cluster, record.src_ep, record.dst_ep, record.data
+        )
+        quirk_stats.cpu_s += time.process_time() - start
+        quirk_stats.frames += 1
+
+    # let the timers armed by the last frames run out
+    start = time.process_time()
+    await loop.advance(loop.time() + tail_s)
+    timers.cpu_s += time.process_time() - start
+
+
+def replay(path: str, tail_s: float = DEFAULT_TAIL_S) -> dict[str, QuirkStats]:
+    """Replay a recording through the quirks of its devices, as fast as possible.
+
+    Frames are handled at the time they were recorded on a virtual clock, so
+    timers, and clocks read with `zhaquirks.loop_time`, behave as they did
+    live. Timers keep running for `tail_s` seconds after the last frame. Tuya
+    devices asking for the time are sent the wall clock at the start of the
+    replay, advanced with the replayed time. Returns the stats per quirk, by
+    `quirk_path`; timer callbacks and the tasks started by quirks are
+    accounted to `TIMERS`.
+    """
+    stats: dict[str, QuirkStats] = {}
+    loop = VirtualClockEventLoop()
+    time_sync = TuyaSetTimeMixin.time_sync
+    TuyaSetTimeMixin.time_sync = TuyaTimeSync(loop.time)
+    TuyaSetTimeMixin.time_sync.refresh_s = math.inf
+    try:
+        with open(path, "rb") as stream:
+            loop.run_until_complete(_replay(stream, stats, tail_s))
+    finally:
+        TuyaSetTimeMixin.time_sync = time_sync
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.wait(tasks))
+        loop.close()
+    return stats
@@ -0,0 +1,186 @@
+"""Hashed lookup of quirks by normalized device signature."""
+from __future__ import annotations
+
+import functools
+import logging
+from typing import Any, FrozenSet, Optional, Tuple
+
+import zigpy.device
+import zigpy.quirks
+from zigpy.quirks.registry import DeviceRegistry
+
+from zhaquirks.const import (
+    DEVICE_TYPE,
+    ENDPOINTS,
+    INPUT_CLUSTERS,
+    MANUFACTURER,
+    MODEL,
+    OUTPUT_CLUSTERS,
+    PROFILE_ID,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+EndpointKey = Tuple[int, FrozenSet[int], FrozenSet[int]]
+SignatureKey = FrozenSet[EndpointKey]
+
+
+def signature_key(signature: dict[str, Any]) -> SignatureKey | None:
+    """Normalize the exactly matched part of a quirk signature.
+
+    Endpoint ids and cluster lists must match a device exactly, so they are
+    folded into a hashable key. Profile and device type may be omitted from a
+    signature to match anything and are left to `SignatureIndex` to compare.
+    """
+    endpoints = signature.get(ENDPOINTS)
+    if endpoints is None:
+        return None
+
+    return frozenset(
+        (
+            ep_id,
+            frozenset(ep.get(INPUT_CLUSTERS, [])),
+            frozenset(ep.get(OUTPUT_CLUSTERS, [])),
+        )
+        for ep_id, ep in endpoints.items()
+    )
+
+
+def device_key(device: zigpy.device.Device) -> SignatureKey:
+    """Normalize a device the same way as `signature_key` does a signature."""
+    return frozenset(
+        (ep_id, frozenset(ep.in_clusters), frozenset(ep.out_clusters))
+        for ep_id, ep in device.endpoints.items()
+        if ep_id != 0
+    )
+
+
+class SignatureIndex:
+    """Find the quirk for a device with a dict lookup per registry bucket.
+
+    Mirrors `DeviceRegistry.get_device`: the same candidates are considered
+    in the same order, but only those whose endpoints and clusters already
+    match the device are compared field by field. Buckets are compiled on
+    first use and dropped whenever a quirk is added to or removed from the
+    registry, see `install`, or the index is invalidated.
+    """
+
+    def __init__(self, registry: DeviceRegistry | None = None) -> None:
+        if registry is None:
+            registry = zigpy.quirks._DEVICE_REGISTRY  # pylint: disable=W0212
+
+        self._registry = registry
+        self._generation = 0
+        self._buckets: dict[
+            tuple[Optional[str], Optional[str]],
+            tuple[int, dict[SignatureKey, list[type]]],
+        ] = {}
+
+    @staticmethod
+    def is_installed(registry: DeviceRegistry) -> bool:
+        """Return whether an index already matches the devices of the registry."""
+        return isinstance(
+            getattr(registry.get_device, "__self__", None), SignatureIndex
+        )
+
+    def install(self) -> None:
+        """Match the devices of the registry through the index.
+
+        `get_device`, `add_to_registry` and `remove` are replaced on the
+        registry instance, the latter two invalidating the index. Quirk lists
+        of the registry changed in place need `invalidate` to be called.
+        """
+        registry = self._registry
+        add_to_registry = registry.add_to_registry
+        remove = registry.remove
+
+        @functools.wraps(add_to_registry)
+        def add_and_invalidate(custom_device: type) -> None:
+            add_to_registry(custom_device)
+            self.invalidate()
+
+        @functools.wraps(remove)
+        def remove_and_invalidate(custom_device: type) -> None:
+            remove(custom_device)
+            self.invalidate()
+
+        registry.add_to_registry = add_and_invalidate
+        registry.remove = remove_and_invalidate
+        registry.get_device = self.get_device
+
+    def invalidate(self) -> None:
+        """Recompile the buckets on their next use."""
+        self._generation += 1
+
+    def _bucket(
+        self, manufacturer: str | None, model: str | None
+    ) -> dict[SignatureKey, list[type]]:
+        # looked up first, a lazily loaded registry imports the quirks here
+        quirks = self._registry.registry[manufacturer][model]
+        cached = self._buckets.get((manufacturer, model))
+        if cached is not None and cached[0] == self._generation:
+            return cached[1]
+
+        bucket: dict[SignatureKey, list[type]] = {}
+        for quirk in quirks:
+            key = signature_key(quirk.signature)
+            if key is not None:
+                bucket.setdefault(key, []).append(quirk)
+
+        self._buckets[(manufacturer, model)] = (self._generation, bucket)
+        return bucket
+
+    def build(self) -> None:
+        """Compile every bucket currently in the registry."""
+        for manufacturer, models in list(self._registry.registry.items()):
+            for model in list(models):
+                self._bucket(manufacturer, model)
+
+    @staticmethod
+    def _matches(device: zigpy.device.Device, signature: dict[str, Any]) -> bool:
+        if device.model != signature.get(MODEL, device.model):
+            return False
+        if device.manufacturer != signature.get(MANUFACTURER, device.manufacturer):
+            return False
+
+        for ep_id, ep in signature[ENDPOINTS].items():
+            endpoint = device.endpoints[ep_id]
+            if endpoint.profile_id != ep.get(PROFILE_ID, endpoint.profile_id):
+                return False
+            if endpoint.device_type != ep.get(DEVICE_TYPE, endpoint.device_type):
+                return False
+
+        return True
+
+    def get_quirk(self, device: zigpy.device.Device) -> type | None:
+        """Return the quirk class zigpy would pick for the device, if any."""
+        key = device_key(device)
+
+        for manufacturer, model in (
+            (device.manufacturer, device.model),
+            (device.manufacturer, None),
+            (None, device.model),
+            (None, None),
+        ):
+            for quirk in self._bucket(manufacturer, model).get(key, ()):
+                if self._matches(device, quirk.signature):
+                    return quirk
+
+        return None
+
+    def get_device(self, device: zigpy.device.Device) -> zigpy.device.Device:
+        """Drop-in replacement for `DeviceRegistry.get_device`."""
+        if isinstance(device, zigpy.quirks.CustomDevice):
+            return device
+
+        quirk = self.get_quirk(device)
+        if quirk is None:
+            return device
+
+        _LOGGER.debug("Found custom device replacement for %s: %s", device.ieee, quirk)
+        return quirk(
+            device._application,  # pylint: disable=W0212
+            device.ieee,
+            device.nwk,
+            device,
+        )
@@ -0,0 +1,133 @@
+"""Shared deadline buckets for the many long, frequently re-armed timers."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import math
+from typing import Callable, Hashable
+import weakref
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RESOLUTION = 1.0
+
+_WHEELS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, TimerWheel
+] = weakref.WeakKeyDictionary()
+
+
+class TimerWheel:
+    """Run callbacks after a delay, grouping deadlines into buckets.
+
+    Each key has at most one pending callback. Deadlines are rounded up to
+    `resolution` seconds, so a callback runs up to `resolution` seconds late
+    but never early. Scheduling a key again moves it to another bucket instead
+    of cancelling an event loop timer, and the wheel keeps a single timer
+    armed for its earliest bucket.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop | None = None,
+        resolution: float = DEFAULT_RESOLUTION,
+    ) -> None:
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._resolution = resolution
+        self._entries: dict[Hashable, int] = {}
+        self._buckets: dict[int, dict[Hashable, Callable[[], None]]] = {}
+        self._ticks: list[int] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_tick: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def schedule(
+        self, key: Hashable, delay: float, callback: Callable[[], None]
+    ) -> None:
+        """Run `callback` after `delay` seconds, replacing any pending one for key."""
+        now = self._loop.time()
+        if delay > 0:
+            tick = math.ceil((now + delay) / self._resolution)
+        else:
+            tick = math.floor(now / self._resolution)
+
+        old_tick = self._entries.get(key)
+        if old_tick == tick:
+            self._buckets[tick][key] = callback
+            return
+        if old_tick is not None:
+            self._remove(key, old_tick)
+
+        self._entries[key] = tick
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = {}
+            heapq.heappush(self._ticks, tick)
+        bucket[key] = callback
+
+        if self._handle_tick is None or tick < self._handle_tick:
+            self._arm(tick)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel the pending callback for key, returning whether there was one."""
+        tick = self._entries.get(key)
+        if tick is None:
+            return False
+
+        self._remove(key, tick)
+        return True
+
+    def _remove(self, key: Hashable, tick: int) -> None:
+        del self._entries[key]
+        bucket = self._buckets[tick]
+        del bucket[key]
+        if not bucket:
+            # the stale tick stays in the heap and is skipped when reached
+            del self._buckets[tick]
+
+    def _arm(self, tick: int) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_tick = tick
+        self._handle = self._loop.call_at(tick * self._resolution, self._run)
+
+    def _run(self) -> None:
+        limit = max(self._handle_tick, math.floor(self._loop.time() / self._resolution))
+        self._handle = None
+        self._handle_tick = None
+
+        due = []
+        while self._ticks and self._ticks[0] <= limit:
+            bucket = self._buckets.pop(heapq.heappop(self._ticks), None)
+            if bucket is None:
+                continue
+            for key, callback in bucket.items():
+                del self._entries[key]
+                due.append(callback)
+
+        while self._ticks and self._ticks[0] not in self._buckets:
+            heapq.heappop(self._ticks)
+        if self._ticks:
+            self._arm(self._ticks[0])
+
+        for callback in due:
+            try:
+                callback()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running timer callback %r", callback)
+
+
+def get_timer_wheel(loop: asyncio.AbstractEventLoop | None = None) -> TimerWheel:
+    """Return the timer wheel shared by everything running on the event loop."""
+    if loop is None:
+        loop = asyncio.get_running_loop()
+
+    wheel = _WHEELS.get(loop)
+    if wheel is None:
+        wheel = _WHEELS[loop] = TimerWheel(loop)
+    return wheel
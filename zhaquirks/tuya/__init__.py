@@ -1,10 +1,12 @@
 """Tuya devices."""
+import asyncio
 import dataclasses
 import datetime
 import enum
 import logging
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from zigpy.exceptions import ZigbeeException
 from zigpy.quirks import CustomCluster, CustomDevice
 import zigpy.types as t
 from zigpy.zcl import foundation
@@ -14,7 +16,14 @@ from zigpy.zcl.clusters.homeautomation import ElectricalMeasurement
 from zigpy.zcl.clusters.hvac import Thermostat, UserInterface
 from zigpy.zcl.clusters.smartenergy import Metering
 
-from zhaquirks import Bus, EventableCluster, LocalDataCluster
+from zhaquirks import (
+    Bus,
+    CoalescingMixin,
+    EventableCluster,
+    LocalDataCluster,
+    ReportFilterMixin,
+    loop_time,
+)
 from zhaquirks.const import (
     DOUBLE_PRESS,
     LEFT,
@@ -131,6 +140,131 @@ class TuyaTimePayload(t.LVList, item_type=t.uint8_t, length_type=t.uint16_t_be):
     """Tuya set time payload definition."""
 
 
+class TuyaTimeSync:
+    """Build set_time payloads for every Tuya device from one cached clock.
+
+    Wall clock time is read once per `refresh_s` seconds and advanced with
+    `clock`, the time of the running event loop by default, in between.
+    Epoch offsets are computed once per (set_time_offset,
+    set_time_local_offset) pair.
+    """
+
+    refresh_s: float = 60.0
+
+    def __init__(self, clock: Callable[[], float] = loop_time) -> None:
+        """Init."""
+        self.clock = clock
+        self._clock: Optional[Tuple[float, float, float]] = None
+        self._offsets: Dict[Tuple[int, Optional[int]], Tuple[float, float]] = {}
+        self._payloads: Dict[Tuple[int, Optional[int]], Tuple[int, bytes]] = {}
+
+    def clear(self) -> None:
+        """Forget the wall clock reading."""
+        self._clock = None
+        self._payloads.clear()
+
+    def _utc_seconds(self, monotonic: float) -> Tuple[float, float]:
+        """Return (seconds since 1970 in UTC, local time offset in seconds)."""
+        # read again when the clock went back, as it does between event loops
+        if self._clock is None or not 0 <= monotonic - self._clock[0] < self.refresh_s:
+            utc_now = datetime.datetime.utcnow()
+            now = datetime.datetime.now()
+            self._clock = (
+                monotonic,
+                (utc_now - datetime.datetime(1970, 1, 1)).total_seconds(),
+                (now - utc_now).total_seconds(),
+            )
+
+        clock_monotonic, utc_seconds, local_offset = self._clock
+        return utc_seconds + (monotonic - clock_monotonic), local_offset
+
+    def _epoch_offsets(
+        self, set_time_offset: int, set_time_local_offset: Optional[int]
+    ) -> Tuple[float, float]:
+        key = (set_time_offset, set_time_local_offset)
+        offsets = self._offsets.get(key)
+        if offsets is None:
+            unix_epoch = datetime.datetime(1970, 1, 1)
+            offsets = self._offsets[key] = (
+                (datetime.datetime(set_time_offset, 1, 1) - unix_epoch).total_seconds(),
+                (
+                    datetime.datetime(set_time_local_offset or set_time_offset, 1, 1)
+                    - unix_epoch
+                ).total_seconds(),
+            )
+        return offsets
+
+    def payload(
+        self, set_time_offset: int, set_time_local_offset: Optional[int] = None
+    ) -> TuyaTimePayload:
+        """UTC and local timestamps since the offset years, big endian."""
+        utc_seconds, local_offset = self._utc_seconds(self.clock())
+        key = (set_time_offset, set_time_local_offset)
+
+        cached = self._payloads.get(key)
+        if cached is None or cached[0] != int(utc_seconds):
+            utc_epoch, local_epoch = self._epoch_offsets(*key)
+            utc_timestamp = int(utc_seconds - utc_epoch)
+            local_timestamp = int(utc_seconds + local_offset - local_epoch)
+            cached = self._payloads[key] = (
+                int(utc_seconds),
+                utc_timestamp.to_bytes(4, "big", signed=False)
+                + local_timestamp.to_bytes(4, "big", signed=False),
+            )
+
+        return TuyaTimePayload(cached[1])
+
+
+TUYA_TIME_SYNC = TuyaTimeSync()
+
+
+class TuyaSetTimeMixin:
+    """Answer the set_time requests of a device, not too often.
+
+    A request within `set_time_window_s` seconds of the last answer sent, or
+    while one is being sent, is not answered again. An answer which could not
+    be sent does not count, so the device retrying gets one.
+    """
+
+    set_time_offset = 0
+    set_time_local_offset = None
+    set_time_window_s: float = 5.0
+    time_sync: TuyaTimeSync = TUYA_TIME_SYNC
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._set_time_sent: Optional[float] = None
+        self._set_time_sending = False
+
+    def send_set_time(self, command: Callable[..., Any]) -> bool:
+        """Send set_time with command, returning False if it was sent very recently."""
+        now = self.time_sync.clock()
+        if self._set_time_sending or (
+            self._set_time_sent is not None
+            and 0 <= now - self._set_time_sent < self.set_time_window_s
+        ):
+            return False
+
+        payload = self.time_sync.payload(
+            self.set_time_offset, self.set_time_local_offset
+        )
+        self._set_time_sending = True
+        self.create_catching_task(
+            self._set_time_sent_at(
+                command(TUYA_SET_TIME, payload, expect_reply=False), now
+            )
+        )
+        return True
+
+    async def _set_time_sent_at(self, request: Any, now: float) -> None:
+        try:
+            await request
+            self._set_time_sent = now
+        finally:
+            self._set_time_sending = False
+
+
 class TuyaDPType(t.enum8):
     """DataPoint Type."""
 
@@ -142,6 +276,71 @@ class TuyaDPType(t.enum8):
     BITMAP = 0x05
 
 
+def _decode_value(raw: bytes) -> t.int32s_be:
+    if len(raw) < 4:
+        raise ValueError(f"Data is too short to contain 4 bytes: {raw!r}")
+    return t.int32s_be(int.from_bytes(raw[:4], "big", signed=True))
+
+
+def _decode_uint8(type_: type) -> Callable[[bytes], Any]:
+    def decode(raw: bytes):
+        if not raw:
+            raise ValueError(f"Data is too short to contain 1 bytes: {raw!r}")
+        return type_(raw[0])
+
+    return decode
+
+
+def _decode_bitmap(raw: bytes) -> Union[t.bitmap8, t.bitmap16, t.bitmap32]:
+    try:
+        bitmap = _TUYA_BITMAPS[len(raw)]
+    except KeyError as exc:
+        raise ValueError(f"Wrong bitmap length: {len(raw)}") from exc
+    return bitmap(int.from_bytes(raw, "little"))
+
+
+def _encode_value(value) -> bytes:
+    try:
+        return int(value).to_bytes(4, "big", signed=True)
+    except OverflowError:
+        # let zigpy raise the usual out of range error
+        return t.int32s_be(value).serialize()
+
+
+def _encode_uint8(type_: type) -> Callable[[Any], bytes]:
+    def encode(value) -> bytes:
+        return bytes((type_(value),))
+
+    return encode
+
+
+def _encode_bitmap(value) -> bytes:
+    if not isinstance(value, (t.bitmap8, t.bitmap16, t.bitmap32)):
+        value = t.bitmap8(value)
+    return value.serialize()[::-1]
+
+
+_TUYA_BITMAPS = {1: t.bitmap8, 2: t.bitmap16, 4: t.bitmap32}
+
+TUYA_DP_DECODERS: Dict[TuyaDPType, Callable[[bytes], Any]] = {
+    TuyaDPType.RAW: lambda raw: raw,
+    TuyaDPType.BOOL: _decode_uint8(t.Bool),
+    TuyaDPType.VALUE: _decode_value,
+    TuyaDPType.STRING: lambda raw: t.CharacterString(raw.decode("utf8")),
+    TuyaDPType.ENUM: _decode_uint8(t.enum8),
+    TuyaDPType.BITMAP: _decode_bitmap,
+}
+
+TUYA_DP_ENCODERS: Dict[TuyaDPType, Callable[[Any], bytes]] = {
+    TuyaDPType.RAW: lambda value: value.serialize(),
+    TuyaDPType.BOOL: _encode_uint8(t.Bool),
+    TuyaDPType.VALUE: _encode_value,
+    TuyaDPType.STRING: lambda value: value.encode("utf8"),
+    TuyaDPType.ENUM: _encode_uint8(t.enum8),
+    TuyaDPType.BITMAP: _encode_bitmap,
+}
+
+
 class TuyaData(t.Struct):
     """Tuya Data type."""
 
@@ -162,45 +361,33 @@ class TuyaData(t.Struct):
         t.bitmap32,
         t.LVBytes,
     ]:
-        """Payload accordingly to data point type."""
-        if self.dp_type == TuyaDPType.VALUE:
-            return t.int32s_be.deserialize(self.raw)[0]
-        elif self.dp_type == TuyaDPType.BOOL:
-            return t.Bool.deserialize(self.raw)[0]
-        elif self.dp_type == TuyaDPType.STRING:
-            return t.CharacterString(self.raw.decode("utf8"))
-        elif self.dp_type == TuyaDPType.ENUM:
-            return t.enum8.deserialize(self.raw)[0]
-        elif self.dp_type == TuyaDPType.BITMAP:
-            bitmaps = {1: t.bitmap8, 2: t.bitmap16, 4: t.bitmap32}
-            try:
-                return bitmaps[len(self.raw)].deserialize(self.raw)[0]
-            except KeyError as exc:
-                raise ValueError(f"Wrong bitmap length: {len(self.raw)}") from exc
-        elif self.dp_type == TuyaDPType.RAW:
-            return self.raw
-        else:
-            raise ValueError(f"Unknown {self.dp_type} datapoint type")
+        """Payload accordingly to data point type.
+
+        The decoded value is cached until `dp_type` or `raw` is reassigned.
+        """
+        dp_type, raw = self.dp_type, self.raw
+        cached = self.__dict__.get("_payload_cache")
+        if cached is not None and cached[1] is raw and cached[0] == dp_type:
+            return cached[2]
+
+        try:
+            decoder = TUYA_DP_DECODERS[dp_type]
+        except KeyError as exc:
+            raise ValueError(f"Unknown {dp_type} datapoint type") from exc
+
+        value = decoder(raw)
+        self._payload_cache = (dp_type, raw, value)
+        return value
 
     @payload.setter
     def payload(self, value):
         """Set payload accordingly to data point type."""
-        if self.dp_type == TuyaDPType.VALUE:
-            self.raw = t.int32s_be(value).serialize()
-        elif self.dp_type == TuyaDPType.BOOL:
-            self.raw = t.Bool(value).serialize()
-        elif self.dp_type == TuyaDPType.STRING:
-            self.raw = value.encode("utf8")
-        elif self.dp_type == TuyaDPType.ENUM:
-            self.raw = t.enum8(value).serialize()
-        elif self.dp_type == TuyaDPType.BITMAP:
-            if not isinstance(value, (t.bitmap8, t.bitmap16, t.bitmap32)):
-                value = t.bitmap8(value)
-            self.raw = value.serialize()[::-1]
-        elif self.dp_type == TuyaDPType.RAW:
-            self.raw = value.serialize()
-        else:
-            raise ValueError(f"Unknown {self.dp_type} datapoint type")
+        try:
+            encoder = TUYA_DP_ENCODERS[self.dp_type]
+        except KeyError as exc:
+            raise ValueError(f"Unknown {self.dp_type} datapoint type") from exc
+
+        self.raw = encoder(value)
 
     def __new__(cls, *args, **kwargs):
         """Disable copy constrctor."""
@@ -228,47 +415,94 @@ class TuyaData(t.Struct):
         self.payload = value
 
 
-class Data(t.List, item_type=t.uint8_t):
-    """list of uint8_t."""
+# zigpy type -> (size, signed) of little-endian int types, (0, False) otherwise
+_DATA_INT_TYPES: Dict[type, Tuple[int, bool]] = {}
+
+
+def _data_int_type(value_type: type) -> Tuple[int, bool]:
+    """Return how `Data` encodes values of a zigpy type."""
+    encoding = (0, False)
+    if issubclass(value_type, t.FixedIntType) and value_type._byteorder == "little":
+        size = value_type._bits // 8
+        if size * 8 == value_type._bits:
+            encoding = (size, value_type._signed)
+    _DATA_INT_TYPES[value_type] = encoding
+    return encoding
+
+
+class Data(bytearray):
+    """list of uint8_t, backed by a bytearray.
+
+    Compares equal to the list of its bytes. Iterating yields the payload
+    after the length byte in reverse, i.e. little-endian, for zigpy types.
+    """
 
     def __init__(self, value=None):
         """Convert from a zigpy typed value to a tuya data payload."""
         if value is None:
             super().__init__()
             return
-        if type(value) is list or type(value) is bytes:
+        value_type = type(value)
+        if value_type in _DATA_RAW_TYPES:
             super().__init__(value)
             return
-        # serialized in little-endian by zigpy
-        super().__init__(value.serialize())
         # we want big-endian, with length prepended
-        self.append(len(self))
-        self.reverse()
+        try:
+            size, signed = _DATA_INT_TYPES[value_type]
+        except KeyError:
+            size, signed = _data_int_type(value_type)
+        if size:
+            super().__init__(
+                bytes((size,)) + int.to_bytes(value, size, "big", signed=signed)
+            )
+            return
+        # serialized in little-endian by zigpy
+        raw = value.serialize()
+        super().__init__(bytes((len(raw),)) + raw[::-1])
 
     def __int__(self):
         """Convert from a tuya data payload to an int typed value."""
         # first uint8_t is the length of the remaining data
-        # tuya data is in big endian whereas ztypes use little endian
-        ints = {
-            1: t.int8s,
-            2: t.int16s,
-            3: t.int24s,
-            4: t.int32s,
-            5: t.int40s,
-            6: t.int48s,
-            7: t.int56s,
-            8: t.int64s,
-        }
-        return ints[self[0]].deserialize(bytes(reversed(self[1:])))[0]
+        size = self[0]
+        if not 0 < size <= 8:
+            raise KeyError(size)
+        if len(self) <= size:
+            raise ValueError(f"Data is too short to contain {size} bytes: {self!r}")
+        return int.from_bytes(self[-size:], "big", signed=True)
 
     def __iter__(self):
         """Convert from a tuya data payload to a list typed value."""
-        return iter(reversed(self[1:]))
+        return iter(self[:0:-1])
+
+    def __eq__(self, other):
+        """Compare with a list of ints or bytes like objects."""
+        if isinstance(other, list):
+            return list(bytearray.__iter__(self)) == other
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        """Compare with a list of ints or bytes like objects."""
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Represent as a list."""
+        return repr(list(bytearray.__iter__(self)))
+
+    __str__ = __repr__
 
     def serialize(self) -> bytes:
-        """Overload serialize to avoid prior implicit conversion to list."""
-        assert self._item_type is not None
-        return b"".join([self._item_type(i).serialize() for i in self[:]])
+        """Serialize the payload bytes."""
+        return bytes(self)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> Tuple["Data", bytes]:
+        """Deserialize the remaining data."""
+        return cls(bytes(data)), b""
+
+
+_DATA_RAW_TYPES = frozenset((list, bytes, bytearray, Data))
 
 
 class TuyaDatapointData(t.Struct):
@@ -310,14 +544,27 @@ class NoManufacturerCluster(CustomCluster):
         )
 
 
-class TuyaManufCluster(CustomCluster):
+@dataclasses.dataclass(frozen=True)
+class TuyaDPEvent:
+    """Bus event sent for a data point of the legacy Tuya command format.
+
+    The event gets `attribute` and the part of the command data selected by
+    `data_index`, or the whole data if it is None. Without an attribute the
+    data point id relative to `TUYA_CMD_BASE` is sent instead, e.g. a channel.
+    """
+
+    bus: str
+    event: str
+    attribute: Optional[int] = None
+    data_index: Union[int, slice, None] = None
+
+
+class TuyaManufCluster(TuyaSetTimeMixin, CustomCluster):
     """Tuya manufacturer specific cluster."""
 
     name = "Tuya Manufacturer Specicific"
     cluster_id = TUYA_CLUSTER_ID
     ep_attribute = "tuya_manufacturer"
-    set_time_offset = 0
-    set_time_local_offset = None
 
     class Command(t.Struct):
         """Tuya manufacturer cluster command."""
@@ -388,12 +635,46 @@ class TuyaManufCluster(CustomCluster):
         ),
     }
 
+    # legacy command_id (data point type and id) -> bus event
+    dp_events: Dict[int, TuyaDPEvent] = {}
+    # bus event for command ids not in dp_events
+    dp_event_default: Optional[TuyaDPEvent] = None
+
+    _dp_event_table: Dict[int, Tuple[str, str, Optional[int], Any]] = {}
+    _dp_event_fallback: Optional[Tuple[str, str, Optional[int], Any]] = None
+
+    def __init_subclass__(cls) -> None:
+        """Compile the data point events of the class."""
+        super().__init_subclass__()
+        cls._dp_event_table = {
+            command_id: dataclasses.astuple(dp_event)
+            for command_id, dp_event in cls.dp_events.items()
+        }
+        cls._dp_event_fallback = (
+            dataclasses.astuple(cls.dp_event_default)
+            if cls.dp_event_default is not None
+            else None
+        )
+
     def __init__(self, *args, **kwargs):
         """Init."""
         super().__init__(*args, **kwargs)
         self.endpoint.device.command_bus = Bus()
         self.endpoint.device.command_bus.add_listener(self)  # listen MCU commands
 
+    def _send_dp_event(self, command: Command) -> bool:
+        """Send the bus event of a data point, returning whether it has one."""
+        dp_event = self._dp_event_table.get(command.command_id, self._dp_event_fallback)
+        if dp_event is None:
+            return False
+
+        bus, event, attribute, data_index = dp_event
+        if attribute is None:
+            attribute = command.command_id - TUYA_CMD_BASE
+        value = command.data if data_index is None else command.data[data_index]
+        getattr(self.endpoint.device, bus).listener_event(event, attribute, value)
+        return True
+
     def tuya_mcu_command(self, command: Command):
         """Tuya MCU command listener. Only endpoint:1 must listen to MCU commands."""
 
@@ -428,32 +709,23 @@ class TuyaManufCluster(CustomCluster):
             self.cluster_id,
             hdr.command_id,
         )
-        payload = TuyaTimePayload()
-        utc_timestamp = int(
-            (
-                datetime.datetime.utcnow()
-                - datetime.datetime(self.set_time_offset, 1, 1)
-            ).total_seconds()
-        )
-        local_timestamp = int(
-            (
-                datetime.datetime.now()
-                - datetime.datetime(
-                    self.set_time_local_offset or self.set_time_offset, 1, 1
-                )
-            ).total_seconds()
-        )
-        payload.extend(utc_timestamp.to_bytes(4, "big", signed=False))
-        payload.extend(local_timestamp.to_bytes(4, "big", signed=False))
-
-        self.create_catching_task(
-            super().command(TUYA_SET_TIME, payload, expect_reply=False)
-        )
+        if not self.send_set_time(super().command):
+            _LOGGER.debug(
+                "Time was sent to %s very recently", self.endpoint.device.ieee
+            )
 
 
 class TuyaManufClusterAttributes(TuyaManufCluster):
     """Manufacturer specific cluster for Tuya converting attributes <-> commands."""
 
+    # set_data commands sent concurrently by a single write_attributes call
+    set_data_in_flight: int = 1
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._set_data_slots: Optional[asyncio.Semaphore] = None
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -482,7 +754,7 @@ class TuyaManufClusterAttributes(TuyaManufCluster):
             self.endpoint.device.nwk,
             self.endpoint.endpoint_id,
             self.cluster_id,
-            repr(tuya_data[1:]),
+            list(tuya_data[1:]),
             tuya_cmd,
             hdr.command_id,
         )
@@ -504,27 +776,62 @@ class TuyaManufClusterAttributes(TuyaManufCluster):
         )
 
     async def write_attributes(self, attributes, manufacturer=None):
-        """Defer attributes writing to the set_data tuya command."""
+        """Defer attributes writing to the set_data tuya command.
+
+        Up to `set_data_in_flight` commands are sent at once, in order. Records
+        whose command could not be sent are reported with a FAILURE status.
+        """
 
         records = self._write_attr_records(attributes)
 
-        for record in records:
-            cmd_payload = TuyaManufCluster.Command()
-            cmd_payload.status = 0
-            cmd_payload.tsn = self.endpoint.device.application.get_sequence()
-            cmd_payload.command_id = record.attrid
-            cmd_payload.function = 0
-            cmd_payload.data = record.value.value
+        if self._set_data_slots is None:
+            self._set_data_slots = asyncio.Semaphore(self.set_data_in_flight)
 
-            await super().command(
-                TUYA_SET_DATA,
-                cmd_payload,
-                manufacturer=manufacturer,
-                expect_reply=False,
-                tsn=cmd_payload.tsn,
-            )
+        results = await asyncio.gather(
+            *(self._set_data(record, manufacturer) for record in records)
+        )
 
-        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+        failed = [
+            foundation.WriteAttributesStatusRecord(status, record.attrid)
+            for record, status in zip(records, results)
+            if status != foundation.Status.SUCCESS
+        ]
+        return [
+            failed
+            or [foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]
+        ]
+
+    async def _set_data(self, record, manufacturer=None) -> foundation.Status:
+        """Send one attribute record as a set_data command."""
+
+        cmd_payload = TuyaManufCluster.Command()
+        cmd_payload.status = 0
+        cmd_payload.tsn = self.endpoint.device.application.get_sequence()
+        cmd_payload.command_id = record.attrid
+        cmd_payload.function = 0
+        cmd_payload.data = record.value.value
+
+        async with self._set_data_slots:
+            try:
+                await super().command(
+                    TUYA_SET_DATA,
+                    cmd_payload,
+                    manufacturer=manufacturer,
+                    expect_reply=False,
+                    tsn=cmd_payload.tsn,
+                )
+            except (ZigbeeException, asyncio.TimeoutError) as exc:
+                _LOGGER.debug(
+                    "[0x%04x:%s:0x%04x] Failed to set attribute 0x%04x: %r",
+                    self.endpoint.device.nwk,
+                    self.endpoint.endpoint_id,
+                    self.cluster_id,
+                    record.attrid,
+                    exc,
+                )
+                return foundation.Status.FAILURE
+
+        return foundation.Status.SUCCESS
 
 
 class TuyaEnchantableCluster(CustomCluster):
@@ -622,6 +929,8 @@ class TuyaOnOff(TuyaEnchantableCluster, OnOff):
 class TuyaManufacturerClusterOnOff(TuyaManufCluster):
     """Manufacturer Specific Cluster of On/Off device."""
 
+    dp_event_default = TuyaDPEvent("switch_bus", SWITCH_EVENT, data_index=1)
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -638,12 +947,7 @@ class TuyaManufacturerClusterOnOff(TuyaManufCluster):
             if not hdr.frame_control.disable_default_response:
                 self.send_default_rsp(hdr, status=foundation.Status.SUCCESS)
 
-            tuya_payload = args[0]
-            self.endpoint.device.switch_bus.listener_event(
-                SWITCH_EVENT,
-                tuya_payload.command_id - TUYA_CMD_BASE,
-                tuya_payload.data[1],
-            )
+            self._send_dp_event(args[0])
         elif hdr.command_id == TUYA_SET_TIME:
             """Time event call super"""
             _LOGGER.debug("TUYA_SET_TIME --> hdr: %s, args: %s", hdr, args)
@@ -670,6 +974,43 @@ class TuyaDimmerSwitch(TuyaSwitch):
         super().__init__(*args, **kwargs)
 
 
+async def _write_manufacturer_attributes(
+    manufacturer_cluster: CustomCluster,
+    manufacturer_attrs: Dict[Union[int, str], Any],
+    origins: Dict[Union[int, str], List[int]],
+    manufacturer: Optional[int] = None,
+) -> List[List[foundation.WriteAttributesStatusRecord]]:
+    """Write mapped attributes to the manufacturer cluster.
+
+    Failures are reported against the attributes in `origins` that were
+    mapped to the failed manufacturer attribute.
+    """
+
+    (result,) = await manufacturer_cluster.write_attributes(
+        manufacturer_attrs, manufacturer=manufacturer
+    )
+
+    failed = {}
+    for attr, attrids in origins.items():
+        try:
+            attr_id = manufacturer_cluster.find_attribute(attr).id
+        except KeyError:
+            continue
+        for record in result:
+            if record.status != foundation.Status.SUCCESS and record.attrid == attr_id:
+                for attrid in attrids:
+                    failed.setdefault(attrid, record.status)
+
+    if not failed:
+        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
+    return [
+        [
+            foundation.WriteAttributesStatusRecord(status, attrid)
+            for attrid, status in failed.items()
+        ]
+    ]
+
+
 class TuyaThermostatCluster(LocalDataCluster, Thermostat):
     """Thermostat cluster for Tuya thermostats."""
 
@@ -709,6 +1050,7 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
             return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
 
         manufacturer_attrs = {}
+        origins = {}
         for record in records:
             attr_name = self.attributes[record.attrid].name
             new_attrs = self.map_attribute(attr_name, record.value.value)
@@ -726,6 +1068,8 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
             )
 
             manufacturer_attrs.update(new_attrs)
+            for attr in new_attrs:
+                origins.setdefault(attr, []).append(record.attrid)
 
         if not manufacturer_attrs:
             return [
@@ -737,12 +1081,10 @@ class TuyaThermostatCluster(LocalDataCluster, Thermostat):
                 ]
             ]
 
-        await self.endpoint.tuya_manufacturer.write_attributes(
-            manufacturer_attrs, manufacturer=manufacturer
+        return await _write_manufacturer_attributes(
+            self.endpoint.tuya_manufacturer, manufacturer_attrs, origins, manufacturer
         )
 
-        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
-
     # pylint: disable=W0236
     async def command(
         self,
@@ -814,6 +1156,7 @@ class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
         records = self._write_attr_records(attributes)
 
         manufacturer_attrs = {}
+        origins = {}
         for record in records:
             if record.attrid == self.attributes_by_name["keypad_lockout"].id:
                 lock = 0 if record.value.value == self.KeypadLockout.No_lockout else 1
@@ -835,6 +1178,8 @@ class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
                 )
 
             manufacturer_attrs.update(new_attrs)
+            for attr in new_attrs:
+                origins.setdefault(attr, []).append(record.attrid)
 
         if not manufacturer_attrs:
             return [
@@ -846,12 +1191,10 @@ class TuyaUserInterfaceCluster(LocalDataCluster, UserInterface):
                 ]
             ]
 
-        await self.endpoint.tuya_manufacturer.write_attributes(
-            manufacturer_attrs, manufacturer=manufacturer
+        return await _write_manufacturer_attributes(
+            self.endpoint.tuya_manufacturer, manufacturer_attrs, origins, manufacturer
         )
 
-        return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
-
 
 class TuyaLocalCluster(LocalDataCluster):
     """Tuya virtual clusters.
@@ -1079,26 +1422,38 @@ DIVISOR = 0x0302
 
 
 # Tuya Zigbee Metering Cluster Correction Implementation
-class TuyaZBMeteringCluster(CustomCluster, Metering):
+class TuyaZBMeteringCluster(ReportFilterMixin, CustomCluster, Metering):
     """Divides the kWh for tuya."""
 
     _CONSTANT_ATTRIBUTES = {MULTIPLIER: 1, DIVISOR: 100}
+    report_deadbands = {
+        Metering.attributes_by_name["current_summ_delivered"].id: 0,
+        Metering.attributes_by_name["instantaneous_demand"].id: 0,
+    }
 
 
 # Tuya Zigbee Metering Cluster Correction Implementation
-class TuyaZBMeteringClusterWithUnit(CustomCluster, Metering):
+class TuyaZBMeteringClusterWithUnit(ReportFilterMixin, CustomCluster, Metering):
     """Divides the kWh for tuya."""
 
     UNIT_OF_MEASURE = 0x0300
     _CONSTANT_ATTRIBUTES = {UNIT_OF_MEASURE: 0, MULTIPLIER: 1, DIVISOR: 100}
+    report_deadbands = TuyaZBMeteringCluster.report_deadbands
 
 
-class TuyaZBElectricalMeasurement(CustomCluster, ElectricalMeasurement):
+class TuyaZBElectricalMeasurement(
+    ReportFilterMixin, CustomCluster, ElectricalMeasurement
+):
     """Divides the Current for tuya."""
 
     AC_CURRENT_MULTIPLIER = 0x0602
     AC_CURRENT_DIVISOR = 0x0603
     _CONSTANT_ATTRIBUTES = {AC_CURRENT_MULTIPLIER: 1, AC_CURRENT_DIVISOR: 1000}
+    report_deadbands = {
+        ElectricalMeasurement.attributes_by_name["rms_voltage"].id: 0,
+        ElectricalMeasurement.attributes_by_name["rms_current"].id: 0,
+        ElectricalMeasurement.attributes_by_name["active_power"].id: 0,
+    }
 
 
 # Tuya Zigbee Cluster 0xE000 Implementation
@@ -1132,6 +1487,25 @@ class TuyaZBExternalSwitchTypeCluster(CustomCluster):
 class TuyaManufacturerWindowCover(TuyaManufCluster):
     """Manufacturer Specific Cluster for cover device."""
 
+    dp_events = {
+        TUYA_DP_TYPE_VALUE
+        + TUYA_DP_ID_PERCENT_STATE: TuyaDPEvent(
+            "cover_bus", COVER_EVENT, ATTR_COVER_POSITION, 4
+        ),
+        TUYA_DP_TYPE_VALUE
+        + TUYA_DP_ID_PERCENT_CONTROL: TuyaDPEvent(
+            "cover_bus", COVER_EVENT, ATTR_COVER_POSITION, 4
+        ),
+        TUYA_DP_TYPE_ENUM
+        + TUYA_DP_ID_DIRECTION_CHANGE: TuyaDPEvent(
+            "cover_bus", COVER_EVENT, ATTR_COVER_DIRECTION, 1
+        ),
+        TUYA_DP_TYPE_ENUM
+        + TUYA_DP_ID_COVER_INVERTED: TuyaDPEvent(
+            "cover_bus", COVER_EVENT, ATTR_COVER_INVERTED, 1  # Check this
+        ),
+    }
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -1157,38 +1531,7 @@ class TuyaManufacturerWindowCover(TuyaManufCluster):
                 tuya_payload.data,
             )
 
-            if tuya_payload.command_id == TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_STATE:
-                self.endpoint.device.cover_bus.listener_event(
-                    COVER_EVENT,
-                    ATTR_COVER_POSITION,
-                    tuya_payload.data[4],
-                )
-            elif (
-                tuya_payload.command_id
-                == TUYA_DP_TYPE_VALUE + TUYA_DP_ID_PERCENT_CONTROL
-            ):
-                self.endpoint.device.cover_bus.listener_event(
-                    COVER_EVENT,
-                    ATTR_COVER_POSITION,
-                    tuya_payload.data[4],
-                )
-            elif (
-                tuya_payload.command_id
-                == TUYA_DP_TYPE_ENUM + TUYA_DP_ID_DIRECTION_CHANGE
-            ):
-                self.endpoint.device.cover_bus.listener_event(
-                    COVER_EVENT,
-                    ATTR_COVER_DIRECTION,
-                    tuya_payload.data[1],
-                )
-            elif (
-                tuya_payload.command_id == TUYA_DP_TYPE_ENUM + TUYA_DP_ID_COVER_INVERTED
-            ):
-                self.endpoint.device.cover_bus.listener_event(
-                    COVER_EVENT,
-                    ATTR_COVER_INVERTED,
-                    tuya_payload.data[1],  # Check this
-                )
+            self._send_dp_event(tuya_payload)
         elif hdr.command_id == TUYA_SET_TIME:
             """Time event call super"""
             super().handle_cluster_request(hdr, args, dst_addressing=dst_addressing)
@@ -1210,6 +1553,10 @@ class TuyaWindowCoverControl(LocalDataCluster, WindowCovering):
     attributes.update({ATTR_COVER_DIRECTION: ("motor_direction", t.Bool)})
     attributes.update({ATTR_COVER_INVERTED: ("cover_inverted", t.Bool)})
 
+    # position reports stream in while the cover moves, a quirk can coalesce
+    # them by setting `coalesce_ms`
+    coalesce_attributes = frozenset({ATTR_COVER_POSITION})
+
     def __init__(self, *args, **kwargs):
         """Initialize instance."""
         super().__init__(*args, **kwargs)
@@ -1338,6 +1685,11 @@ class TuyaWindowCover(CustomDevice):
 class TuyaManufacturerLevelControl(TuyaManufCluster):
     """Manufacturer Specific Cluster for cover device."""
 
+    dp_events = {
+        TUYA_LEVEL_COMMAND: TuyaDPEvent("dimmer_bus", LEVEL_EVENT, TUYA_LEVEL_COMMAND)
+    }
+    dp_event_default = TuyaDPEvent("switch_bus", SWITCH_EVENT, data_index=1)
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -1363,21 +1715,10 @@ class TuyaManufacturerLevelControl(TuyaManufCluster):
         )
 
         if hdr.command_id in (0x0002, 0x0001):
-            if tuya_payload.command_id == TUYA_LEVEL_COMMAND:
-                self.endpoint.device.dimmer_bus.listener_event(
-                    LEVEL_EVENT,
-                    tuya_payload.command_id,
-                    tuya_payload.data,
-                )
-            else:
-                self.endpoint.device.switch_bus.listener_event(
-                    SWITCH_EVENT,
-                    tuya_payload.command_id - TUYA_CMD_BASE,
-                    tuya_payload.data[1],
-                )
+            self._send_dp_event(tuya_payload)
 
 
-class TuyaLevelControl(CustomCluster, LevelControl):
+class TuyaLevelControl(CoalescingMixin, CustomCluster, LevelControl):
     """Tuya Level cluster for dimmable device."""
 
     def __init__(self, *args, **kwargs):
@@ -1514,6 +1855,30 @@ class TuyaNewManufCluster(CustomCluster):
 
     data_point_handlers: Dict[int, str] = {}
 
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._command_handler_names: Optional[Dict[foundation.Direction, Dict]] = None
+        self._dp_handlers: Optional[Dict[int, Callable]] = None
+        self._dp_targets: Dict[int, Tuple[DPToAttributeMapping, CustomCluster]] = {}
+
+    @property
+    def command_handler_names(self) -> Dict[foundation.Direction, Dict[int, str]]:
+        """Names of the command handlers, formatted on first use."""
+        if self._command_handler_names is None:
+            self._command_handler_names = {
+                # server_cluster -> client_cluster cluster specific command
+                foundation.Direction.Client_to_Server: {
+                    command_id: f"handle_{command.name}"
+                    for command_id, command in self.client_commands.items()
+                },
+                foundation.Direction.Server_to_Client: {
+                    command_id: f"handle_{command.name}"
+                    for command_id, command in self.server_commands.items()
+                },
+            }
+        return self._command_handler_names
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -1526,11 +1891,7 @@ class TuyaNewManufCluster(CustomCluster):
         """Handle cluster specific request."""
 
         try:
-            if hdr.direction == foundation.Direction.Client_to_Server:
-                # server_cluster -> client_cluster cluster specific command
-                handler_name = f"handle_{self.client_commands[hdr.command_id].name}"
-            else:
-                handler_name = f"handle_{self.server_commands[hdr.command_id].name}"
+            handler_name = self.command_handler_names[hdr.direction][hdr.command_id]
         except KeyError:
             self.debug(
                 "Received unknown manufacturer command %s: %s", hdr.command_id, args
@@ -1539,7 +1900,7 @@ class TuyaNewManufCluster(CustomCluster):
                 self.send_default_rsp(
                     hdr, status=foundation.Status.UNSUP_CLUSTER_COMMAND
                 )
-                return
+            return
 
         try:
             status = getattr(self, handler_name)(*args)
@@ -1554,13 +1915,25 @@ class TuyaNewManufCluster(CustomCluster):
         if not hdr.frame_control.disable_default_response:
             self.send_default_rsp(hdr, status=status)
 
+    @property
+    def dp_handlers(self) -> Dict[int, Callable[[TuyaDatapointData], Any]]:
+        """Datapoint handlers of `data_point_handlers`, bound on first use."""
+        if self._dp_handlers is None:
+            self._dp_handlers = {}
+            for dp, handler_name in self.data_point_handlers.items():
+                try:
+                    self._dp_handlers[dp] = getattr(self, handler_name)
+                except AttributeError:
+                    self.debug("No '%s' datapoint handler for %s", handler_name, dp)
+        return self._dp_handlers
+
     def handle_get_data(self, command: TuyaCommand) -> foundation.Status:
         """Handle get_data response (report)."""
+        dp_handlers = self.dp_handlers
         dp_error = False
         for record in command.datapoints:
             try:
-                dp_handler = self.data_point_handlers[record.dp]
-                getattr(self, dp_handler)(record)
+                dp_handlers[record.dp](record)
             except (AttributeError, KeyError):
                 self.debug("No datapoint handler for %s", record)
                 dp_error = True
@@ -1582,15 +1955,20 @@ class TuyaNewManufCluster(CustomCluster):
     def _dp_2_attr_update(self, datapoint: TuyaDatapointData) -> None:
         """Handle data point to attribute report conversion."""
         try:
-            dp_map = self.dp_to_attribute[datapoint.dp]
+            dp_map, cluster = self._dp_targets[datapoint.dp]
         except KeyError:
-            self.debug("No attribute mapping for %s data point", datapoint.dp)
-            return
+            try:
+                dp_map = self.dp_to_attribute[datapoint.dp]
+            except KeyError:
+                self.debug("No attribute mapping for %s data point", datapoint.dp)
+                return
+
+            endpoint = self.endpoint
+            if dp_map.endpoint_id:
+                endpoint = self.endpoint.device.endpoints[dp_map.endpoint_id]
+            cluster = getattr(endpoint, dp_map.ep_attribute)
+            self._dp_targets[datapoint.dp] = dp_map, cluster
 
-        endpoint = self.endpoint
-        if dp_map.endpoint_id:
-            endpoint = self.endpoint.device.endpoints[dp_map.endpoint_id]
-        cluster = getattr(endpoint, dp_map.ep_attribute)
         value = datapoint.data.payload
         if dp_map.converter:
             value = dp_map.converter(value)
@@ -1,7 +1,7 @@
 """Tuya MCU comunications."""
+import asyncio
 import dataclasses
-import datetime
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from zigpy.quirks import CustomDevice
 import zigpy.types as t
@@ -13,7 +13,6 @@ from zhaquirks.tuya import (
     TUYA_MCU_COMMAND,
     TUYA_MCU_VERSION_RSP,
     TUYA_SET_DATA,
-    TUYA_SET_TIME,
     NoManufacturerCluster,
     PowerOnState,
     TuyaCommand,
@@ -21,7 +20,7 @@ from zhaquirks.tuya import (
     TuyaEnchantableCluster,
     TuyaLocalCluster,
     TuyaNewManufCluster,
-    TuyaTimePayload,
+    TuyaSetTimeMixin,
 )
 
 # New manufacturer attributes
@@ -121,12 +120,22 @@ class TuyaAttributesCluster(TuyaLocalCluster):
         return [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]]
 
 
-class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
+class TuyaMCUCluster(TuyaSetTimeMixin, TuyaAttributesCluster, TuyaNewManufCluster):
     """Manufacturer specific cluster for sending Tuya MCU commands."""
 
     set_time_offset = 1970  # MCU timestamp from 1/1/1970
     set_time_local_offset = None
 
+    # Set when the MCU accepts several datapoints in a single set_data command.
+    # Datapoints written within `mcu_write_batch_window` seconds are then sent
+    # together, in frames of at most `mcu_write_max_payload` bytes.
+    mcu_multi_dp_set = False
+    mcu_write_batch_window = 0.0
+    mcu_write_max_payload = 64
+
+    dp_to_attribute: Dict[int, DPToAttributeMapping] = {}
+    _dp_index = (dp_to_attribute, {}, {})
+
     class MCUVersion(t.Struct):
         """Tuya MCU version response Zcl payload."""
 
@@ -205,6 +214,10 @@ class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
         # Cluster for endpoint: 1 (listen MCU commands)
         self.endpoint.device.command_bus = Bus()
         self.endpoint.device.command_bus.add_listener(self)
+        self._pending_datapoints: Dict[
+            Tuple[bool, Optional[int]], Dict[int, TuyaDatapointData]
+        ] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
 
     def from_cluster_data(self, data: TuyaClusterData) -> Optional[TuyaCommand]:
         """Convert from cluster data to a tuya data payload."""
@@ -266,43 +279,148 @@ class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
             )
             return
 
-        for tuya_command in tuya_commands:
-            self.create_catching_task(
-                self.command(
-                    TUYA_SET_DATA,
-                    tuya_command,
-                    expect_reply=cluster_data.expect_reply,
-                    manufacturer=cluster_data.manufacturer,
+        if self.mcu_multi_dp_set:
+            self._queue_datapoints(tuya_commands, cluster_data)
+        else:
+            for tuya_command in tuya_commands:
+                self.create_catching_task(
+                    self.command(
+                        TUYA_SET_DATA,
+                        tuya_command,
+                        expect_reply=cluster_data.expect_reply,
+                        manufacturer=cluster_data.manufacturer,
+                    )
                 )
-            )
 
         endpoint = self.endpoint.device.endpoints[cluster_data.endpoint_id]
         cluster = getattr(endpoint, cluster_data.cluster_name)
         cluster.update_attribute(cluster_data.cluster_attr, cluster_data.attr_value)
 
+    def _queue_datapoints(
+        self, tuya_commands: List[TuyaCommand], cluster_data: TuyaClusterData
+    ) -> None:
+        """Queue datapoints until the batch window closes."""
+
+        pending = self._pending_datapoints.setdefault(
+            (cluster_data.expect_reply, cluster_data.manufacturer), {}
+        )
+        for tuya_command in tuya_commands:
+            for datapoint in tuya_command.datapoints:
+                # only the last value written to a datapoint is sent
+                pending.pop(datapoint.dp, None)
+                pending[datapoint.dp] = datapoint
+
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.mcu_write_batch_window, self.flush_datapoints
+            )
+
+    def flush_datapoints(self) -> None:
+        """Send the queued datapoints, as few set_data commands as possible."""
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending_datapoints = self._pending_datapoints, {}
+        for (expect_reply, manufacturer), datapoints in pending.items():
+            for tuya_command in self._batch_datapoints(datapoints.values()):
+                self.debug("batched tuya_command: %s", tuya_command)
+                self.create_catching_task(
+                    self.command(
+                        TUYA_SET_DATA,
+                        tuya_command,
+                        expect_reply=expect_reply,
+                        manufacturer=manufacturer,
+                    )
+                )
+
+    def _batch_datapoints(
+        self, datapoints: Iterable[TuyaDatapointData]
+    ) -> List[TuyaCommand]:
+        """Pack datapoints into commands of at most `mcu_write_max_payload` bytes.
+
+        A datapoint too large to share a command is sent on its own.
+        """
+
+        header_size = 2  # status, tsn
+        batches: List[List[TuyaDatapointData]] = []
+        size = 0
+        for datapoint in datapoints:
+            datapoint_size = len(datapoint.serialize())
+            if not batches or size + datapoint_size > self.mcu_write_max_payload:
+                batches.append([])
+                size = header_size
+            batches[-1].append(datapoint)
+            size += datapoint_size
+
+        return [
+            TuyaCommand(
+                status=0,
+                tsn=self.endpoint.device.application.get_sequence(),
+                datapoints=batch,
+            )
+            for batch in batches
+        ]
+
+    @staticmethod
+    def _build_dp_index(
+        dp_to_attribute: Dict[int, DPToAttributeMapping]
+    ) -> Tuple[
+        Dict[int, DPToAttributeMapping],
+        Dict[Tuple[Optional[int], str], Tuple[int, ...]],
+        Dict[int, int],
+    ]:
+        """Index the data points of dp_to_attribute by endpoint and attribute.
+
+        Mappings without an endpoint_id are indexed under None, which stands
+        for the endpoint of the cluster itself. Returns dp_to_attribute, the
+        index and the position of each data point in dp_to_attribute.
+        """
+        index: Dict[Tuple[Optional[int], str], Tuple[int, ...]] = {}
+        for dp, dp_mapping in dp_to_attribute.items():
+            attribute_names = dp_mapping.attribute_name
+            if not isinstance(attribute_names, tuple):
+                attribute_names = (attribute_names,)
+            for attribute_name in attribute_names:
+                key = (dp_mapping.endpoint_id, attribute_name)
+                index[key] = index.get(key, ()) + (dp,)
+        positions = {dp: position for position, dp in enumerate(dp_to_attribute)}
+        return dp_to_attribute, index, positions
+
+    def __init_subclass__(cls) -> None:
+        """Build the reverse data point index when a quirk cluster is defined.
+
+        The index is rebuilt when dp_to_attribute is replaced, on the class or
+        an instance, but not when it is changed in place once defined.
+        """
+        super().__init_subclass__()
+        dp_to_attribute = cls.__dict__.get("dp_to_attribute")
+        if dp_to_attribute is not None:
+            cls._dp_index = cls._build_dp_index(dp_to_attribute)
+
     def get_dp_mapping(
         self, endpoint_id: int, attribute_name: str
-    ) -> Optional[Tuple[int, DPToAttributeMapping]]:
+    ) -> Dict[int, DPToAttributeMapping]:
         """Search for the DP in dp_to_attribute."""
 
-        result = {}
-        for dp, dp_mapping in self.dp_to_attribute.items():
-            if (
-                attribute_name == dp_mapping.attribute_name
-                or (
-                    isinstance(dp_mapping.attribute_name, tuple)
-                    and attribute_name in dp_mapping.attribute_name
-                )
-            ) and (
-                (
-                    dp_mapping.endpoint_id is None
-                    and endpoint_id == self.endpoint.endpoint_id
+        dp_to_attribute = self.dp_to_attribute
+        source, index, positions = self._dp_index
+        if source is not dp_to_attribute:
+            # dp_to_attribute was replaced after the class was defined
+            self._dp_index = self._build_dp_index(dp_to_attribute)
+            _, index, positions = self._dp_index
+
+        dps = index.get((endpoint_id, attribute_name), ())
+        if endpoint_id == self.endpoint.endpoint_id:
+            own_dps = index.get((None, attribute_name), ())
+            if own_dps:
+                dps = (
+                    sorted(dps + own_dps, key=positions.__getitem__) if dps else own_dps
                 )
-                or (endpoint_id == dp_mapping.endpoint_id)
-            ):
-                self.debug("get_dp_mapping --> found DP: %s", dp)
-                result[dp] = dp_mapping
-        return result
+
+        self.debug("get_dp_mapping --> found DPs: %s", dps)
+        return {dp: dp_to_attribute[dp] for dp in dps}
 
     def handle_mcu_version_response(self, payload: MCUVersion) -> foundation.Status:
         """Handle MCU version response."""
@@ -315,26 +433,8 @@ class TuyaMCUCluster(TuyaAttributesCluster, TuyaNewManufCluster):
         """Handle set_time requests (0x24)."""
 
         self.debug("handle_set_time_request payload: %s", payload)
-        payload_rsp = TuyaTimePayload()
-
-        utc_now = datetime.datetime.utcnow()
-        now = datetime.datetime.now()
-
-        offset_time = datetime.datetime(self.set_time_offset, 1, 1)
-        offset_time_local = datetime.datetime(
-            self.set_time_local_offset or self.set_time_offset, 1, 1
-        )
-
-        utc_timestamp = int((utc_now - offset_time).total_seconds())
-        local_timestamp = int((now - offset_time_local).total_seconds())
-
-        payload_rsp.extend(utc_timestamp.to_bytes(4, "big", signed=False))
-        payload_rsp.extend(local_timestamp.to_bytes(4, "big", signed=False))
-
-        self.debug("handle_set_time_request response: %s", payload_rsp)
-        self.create_catching_task(
-            super().command(TUYA_SET_TIME, payload_rsp, expect_reply=False)
-        )
+        if not self.send_set_time(super().command):
+            self.debug("handle_set_time_request: time was sent very recently")
 
         return foundation.Status.SUCCESS
 
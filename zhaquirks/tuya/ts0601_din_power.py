@@ -5,7 +5,7 @@ from zigpy.zcl.clusters.general import Basic, Groups, Ota, Scenes, Time
 from zigpy.zcl.clusters.homeautomation import ElectricalMeasurement
 from zigpy.zcl.clusters.smartenergy import Metering
 
-from zhaquirks import Bus, LocalDataCluster
+from zhaquirks import Bus, LocalDataCluster, ReportFilterMixin
 from zhaquirks.const import (
     DEVICE_TYPE,
     ENDPOINTS,
@@ -63,7 +63,7 @@ class TuyaManufClusterDinPower(TuyaManufClusterAttributes):
             )
 
 
-class TuyaPowerMeasurement(LocalDataCluster, ElectricalMeasurement):
+class TuyaPowerMeasurement(ReportFilterMixin, LocalDataCluster, ElectricalMeasurement):
     """Custom class for power, voltage and current measurement."""
 
     cluster_id = ElectricalMeasurement.cluster_id
@@ -76,6 +76,16 @@ class TuyaPowerMeasurement(LocalDataCluster, ElectricalMeasurement):
     TOTAL_REACTIVE_POWER_ID = 0x0305
     POWER_FACTOR_ID = 0x0510
 
+    report_deadbands = {
+        POWER_ID: 0,
+        VOLTAGE_ID: 0,
+        CURRENT_ID: 0,
+        REACTIVE_POWER_ID: 0,
+        AC_FREQUENCY_ID: 0,
+        TOTAL_REACTIVE_POWER_ID: 0,
+        POWER_FACTOR_ID: 0,
+    }
+
     AC_CURRENT_MULTIPLIER = 0x0602
     AC_CURRENT_DIVISOR = 0x0603
     AC_FREQUENCY_MULTIPLIER = 0x0400
@@ -117,7 +127,7 @@ class TuyaPowerMeasurement(LocalDataCluster, ElectricalMeasurement):
         self._update_attribute(self.TOTAL_REACTIVE_POWER_ID, value)
 
 
-class TuyaElectricalMeasurement(LocalDataCluster, Metering):
+class TuyaElectricalMeasurement(ReportFilterMixin, LocalDataCluster, Metering):
     """Custom class for total energy measurement."""
 
     cluster_id = Metering.cluster_id
@@ -125,6 +135,8 @@ class TuyaElectricalMeasurement(LocalDataCluster, Metering):
     CURRENT_RECEIVED_ID = 0x0001
     POWER_WATT = 0x0000
 
+    report_deadbands = {CURRENT_DELIVERED_ID: 0, CURRENT_RECEIVED_ID: 0}
+
     """Setting unit of measurement."""
     _CONSTANT_ATTRIBUTES = {0x0300: POWER_WATT}
 
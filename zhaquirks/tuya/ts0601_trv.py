@@ -187,6 +187,28 @@ class data144(t.FixedList, item_type=t.uint8_t, length=18):
     """General data, Discrete, 144 bit."""
 
 
+def _moes_schedule_table(first_attr_id):
+    """(offset, mask, scale, attr_id) of the six slots of a schedule buffer.
+
+    Slots are stored last to first as temperature, minute, hour; the top bits
+    of the hour are flags.
+    """
+    table = []
+    for slot in range(6):
+        attr_id = first_attr_id + 0x10 * slot
+        offset = 17 - 3 * slot
+        table.append((offset, 0x3F, 1, attr_id))  # hour
+        table.append((offset - 1, 0xFF, 1, attr_id + 1))  # minute
+        table.append((offset - 2, 0xFF, 100, attr_id + 2))  # temperature
+    return tuple(table)
+
+
+MOES_SCHEDULE_CODEC = {
+    MOES_SCHEDULE_WORKDAY_ATTR: _moes_schedule_table(0x4110),
+    MOES_SCHEDULE_WEEKEND_ATTR: _moes_schedule_table(0x4210),
+}
+
+
 class MoesManufCluster(TuyaManufClusterAttributes):
     """Manufacturer Specific Cluster of some thermostatic valves."""
 
@@ -513,51 +535,39 @@ class MoesThermostat(TuyaThermostatCluster):
                 )
             }
         if attribute in self.WORKDAY_SCHEDULE_ATTRS:
-            data = data144()
-            for num, (attr, default) in enumerate(self.WORKDAY_SCHEDULE_ATTRS.items()):
-                if num % 3 == 0:
-                    if attr == attribute:
-                        val = round(value / 100)
-                    else:
-                        val = round(
-                            self._attr_cache.get(
-                                self.attributes_by_name[attr].id, default
-                            )
-                            / 100
-                        )
-                else:
-                    if attr == attribute:
-                        val = value
-                    else:
-                        val = self._attr_cache.get(
-                            self.attributes_by_name[attr].id, default
-                        )
-
-                data.append(val)
-            return {MOES_SCHEDULE_WORKDAY_ATTR: data}
+            return {
+                MOES_SCHEDULE_WORKDAY_ATTR: self._encode_schedule(
+                    MOES_SCHEDULE_WORKDAY_ATTR,
+                    self.WORKDAY_SCHEDULE_ATTRS,
+                    attribute,
+                    value,
+                )
+            }
         if attribute in self.WEEKEND_SCHEDULE_ATTRS:
-            data = data144()
-            for num, (attr, default) in enumerate(self.WEEKEND_SCHEDULE_ATTRS.items()):
-                if num % 3 == 0:
-                    if attr == attribute:
-                        val = round(value / 100)
-                    else:
-                        val = round(
-                            self._attr_cache.get(
-                                self.attributes_by_name[attr].id, default
-                            )
-                            / 100
-                        )
-                else:
-                    if attr == attribute:
-                        val = value
-                    else:
-                        val = self._attr_cache.get(
-                            self.attributes_by_name[attr].id, default
-                        )
-
-                data.append(val)
-            return {MOES_SCHEDULE_WEEKEND_ATTR: data}
+            return {
+                MOES_SCHEDULE_WEEKEND_ATTR: self._encode_schedule(
+                    MOES_SCHEDULE_WEEKEND_ATTR,
+                    self.WEEKEND_SCHEDULE_ATTRS,
+                    attribute,
+                    value,
+                )
+            }
+
+    def _encode_schedule(self, schedule_attr, defaults, attribute, value):
+        """Pack the schedule slots, with one of them changed, into a buffer."""
+
+        table = MOES_SCHEDULE_CODEC[schedule_attr]
+        data = [0] * len(table)
+        for offset, mask, scale, attr_id in table:
+            name = self.attributes[attr_id].name
+            if name == attribute:
+                val = value
+            else:
+                val = self._attr_cache.get(attr_id, defaults[name])
+            if scale != 1:
+                val = round(val / scale)
+            data[offset] = val & mask
+        return data144(data)
 
     def mode_change(self, value):
         """System Mode change."""
@@ -591,128 +601,14 @@ class MoesThermostat(TuyaThermostatCluster):
     def schedule_change(self, attr, value):
         """Scheduler attribute change."""
 
-        if attr == MOES_SCHEDULE_WORKDAY_ATTR:
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_hour"].id, value[17] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_minute"].id, value[16]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_1_temperature"].id,
-                value[15] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_hour"].id, value[14] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_minute"].id, value[13]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_2_temperature"].id,
-                value[12] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_hour"].id, value[11] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_minute"].id, value[10]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_3_temperature"].id,
-                value[9] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_hour"].id, value[8] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_minute"].id, value[7]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_4_temperature"].id,
-                value[6] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_hour"].id, value[5] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_minute"].id, value[4]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_5_temperature"].id,
-                value[3] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_hour"].id, value[2] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_minute"].id, value[1]
-            )
-            self._update_attribute(
-                self.attributes_by_name["workday_schedule_6_temperature"].id,
-                value[0] * 100,
-            )
-        elif attr == MOES_SCHEDULE_WEEKEND_ATTR:
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_hour"].id, value[17] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_minute"].id, value[16]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_1_temperature"].id,
-                value[15] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_hour"].id, value[14] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_minute"].id, value[13]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_2_temperature"].id,
-                value[12] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_hour"].id, value[11] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_minute"].id, value[10]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_3_temperature"].id,
-                value[9] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_hour"].id, value[8] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_minute"].id, value[7]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_4_temperature"].id,
-                value[6] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_hour"].id, value[5] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_minute"].id, value[4]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_5_temperature"].id,
-                value[3] * 100,
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_hour"].id, value[2] & 0x3F
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_minute"].id, value[1]
-            )
-            self._update_attribute(
-                self.attributes_by_name["weekend_schedule_6_temperature"].id,
-                value[0] * 100,
-            )
+        table = MOES_SCHEDULE_CODEC.get(attr)
+        if table is None:
+            return
+
+        for offset, mask, scale, attr_id in table:
+            slot_value = (value[offset] & mask) * scale
+            if self._attr_cache.get(attr_id) != slot_value:
+                self._update_attribute(attr_id, slot_value)
 
 
 class MoesThermostatNew(MoesThermostat):
@@ -23,6 +23,7 @@ from zigpy.zcl.clusters.general import (
 from zhaquirks import EventableCluster, LocalDataCluster
 from zhaquirks.const import ENDPOINTS, INPUT_CLUSTERS, OUTPUT_CLUSTERS
 
+from .stream import XBeeSerialStream
 from .types import ATCommand, BinaryString, Bytes, IOSample
 
 _LOGGER = logging.getLogger(__name__)
@@ -289,28 +290,63 @@ class XBeeRemoteATRequest(LocalDataCluster):
     }
 
     _seq: int = 1
+    # remote AT commands sent to the device without waiting for a response
+    at_command_window: int = 4
+
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._at_slots: Optional[asyncio.Semaphore] = None
 
     def _save_at_request(self, frame_id, future):
         self._endpoint.in_clusters[XBEE_AT_RESPONSE_CLUSTER].save_at_request(
             frame_id, future
         )
 
-    def remote_at_command(self, cmd_name, *args, apply_changes=True, **kwargs):
+    def _next_frame_id(self):
+        """Return the next frame id not used by a pending request."""
+        awaiting = self._endpoint.in_clusters[XBEE_AT_RESPONSE_CLUSTER].awaiting
+        for _ in range(255):
+            frame_id = self._seq
+            self._seq = (self._seq % 255) + 1
+            if frame_id not in awaiting:
+                return frame_id
+        raise RuntimeError("No free frame id for remote AT command")
+
+    async def remote_at_command(self, cmd_name, *args, apply_changes=True, **kwargs):
         """Execute a Remote AT Command and Return Response."""
-        if hasattr(self._endpoint.device.application, "remote_at_command"):
-            return self._endpoint.device.application.remote_at_command(
-                self._endpoint.device.nwk,
-                cmd_name,
-                *args,
-                apply_changes=apply_changes,
-                encryption=False,
-                **kwargs,
-            )
-        _LOGGER.debug("Remote AT%s command: %s", cmd_name, args)
-        options = t.uint8_t(0)
-        if apply_changes:
-            options |= 0x02
-        return self._remote_at_command(options, cmd_name, *args)
+        if self._at_slots is None:
+            self._at_slots = asyncio.Semaphore(self.at_command_window)
+
+        async with self._at_slots:
+            if hasattr(self._endpoint.device.application, "remote_at_command"):
+                return await self._endpoint.device.application.remote_at_command(
+                    self._endpoint.device.nwk,
+                    cmd_name,
+                    *args,
+                    apply_changes=apply_changes,
+                    encryption=False,
+                    **kwargs,
+                )
+            _LOGGER.debug("Remote AT%s command: %s", cmd_name, args)
+            options = t.uint8_t(0)
+            if apply_changes:
+                options |= 0x02
+            return await self._remote_at_command(options, cmd_name, *args)
+
+    async def remote_at_commands(self, commands, apply_changes=True):
+        """Execute Remote AT Commands concurrently and return their responses.
+
+        Each command is a tuple of the command name and its arguments. The
+        exception is returned in place of the response of a failed command.
+        """
+        return await asyncio.gather(
+            *(
+                self.remote_at_command(name, *args, apply_changes=apply_changes)
+                for name, *args in commands
+            ),
+            return_exceptions=True,
+        )
 
     async def _remote_at_command(self, options, name, *args):
         _LOGGER.debug("Remote AT command: %s %s", name, args)
@@ -326,8 +362,7 @@ class XBeeRemoteATRequest(LocalDataCluster):
 
     async def _command(self, options, command, data, *args):
         _LOGGER.debug("Command %s %s", command, data)
-        frame_id = self._seq
-        self._seq = (self._seq % 255) + 1
+        frame_id = self._next_frame_id()
         schema = (
             t.uint8_t,
             t.uint8_t,
@@ -421,12 +456,26 @@ class XBeeRemoteATResponse(LocalDataCluster):
 
     cluster_id = XBEE_AT_RESPONSE_CLUSTER
 
-    _awaiting = {}
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._awaiting = {}
+
+    @property
+    def awaiting(self):
+        """Frame ids of the requests waiting for a response."""
+        return self._awaiting.keys()
 
     def save_at_request(self, frame_id, future):
-        """Save pending request."""
+        """Save pending request, until it is answered or its future cancelled."""
         self._awaiting[frame_id] = (future,)
 
+        def forget(_):
+            if self._awaiting.get(frame_id) == (future,):
+                del self._awaiting[frame_id]
+
+        future.add_done_callback(forget)
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -440,7 +489,11 @@ class XBeeRemoteATResponse(LocalDataCluster):
                 "Remote AT command response: %s",
                 (args.frame_id, args.cmd, args.status, args.value),
             )
-            (fut,) = self._awaiting.pop(args.frame_id)
+            try:
+                (fut,) = self._awaiting.pop(args.frame_id)
+            except KeyError:
+                _LOGGER.debug("No request waiting for frame id %s", args.frame_id)
+                return
             try:
                 status = ATCommandResult(args.status)
             except ValueError:
@@ -481,6 +534,11 @@ class XBeeDigitalIOCluster(LocalDataCluster, BinaryInput):
 
     cluster_id = XBEE_IO_CLUSTER
 
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._pins = None
+
     def handle_cluster_request(
         self,
         hdr: foundation.ZCLHeader,
@@ -494,31 +552,47 @@ class XBeeDigitalIOCluster(LocalDataCluster, BinaryInput):
         """
         if hdr.command_id == SAMPLE_DATA_CMD:
             values = args.io_sample
-            if "digital_samples" in values:
-                # Update digital inputs
-                active_pins = [
-                    i for i, x in enumerate(values["digital_samples"]) if x is not None
-                ]
-                for pin in active_pins:
-                    # pylint: disable=W0212
-                    self._endpoint.device[0xD0 + pin].on_off._update_attribute(
-                        ATTR_ON_OFF, values["digital_samples"][pin]
-                    )
-            if "analog_samples" in values:
-                # Update analog inputs
-                active_pins = [
-                    i for i, x in enumerate(values["analog_samples"]) if x is not None
-                ]
-                for pin in active_pins:
-                    # pylint: disable=W0212
-                    self._endpoint.device[0xD0 + pin].analog_input._update_attribute(
-                        ATTR_PRESENT_VALUE,
-                        values["analog_samples"][pin]
-                        / (10.23 if pin != 7 else 1000),  # supply voltage is in mV
-                    )
+            digital_mask, digital_bits, analog_mask = values.masks()
+            if self._pins is None:
+                self._pins = self._bind_pins()
+            digital_pins, analog_pins = self._pins
+
+            # pylint: disable=W0212
+            for pin_mask, on_off in digital_pins:
+                if digital_mask & pin_mask:
+                    state = 1 if digital_bits & pin_mask else 0
+                    if on_off._attr_cache.get(ATTR_ON_OFF) != state:
+                        on_off._update_attribute(ATTR_ON_OFF, state)
+            if analog_mask:
+                analog_samples = values["analog_samples"]
+                for pin, analog_input, divisor in analog_pins:
+                    if analog_mask & (1 << pin):
+                        value = analog_samples[pin] / divisor
+                        if analog_input._attr_cache.get(ATTR_PRESENT_VALUE) != value:
+                            analog_input._update_attribute(ATTR_PRESENT_VALUE, value)
         else:
             super().handle_cluster_request(hdr, args)
 
+    def _bind_pins(self):
+        """Find the on/off and analog input clusters of the IO pins."""
+        endpoints = self._endpoint.device.endpoints
+        digital_pins = []
+        for pin in range(IOSample.DIGITAL_PINS):
+            endpoint = endpoints.get(0xD0 + pin)
+            if endpoint is not None and OnOff.cluster_id in endpoint.in_clusters:
+                digital_pins.append((1 << pin, endpoint.in_clusters[OnOff.cluster_id]))
+
+        analog_pins = []
+        for pin in range(IOSample.ANALOG_PINS):
+            endpoint = endpoints.get(0xD0 + pin)
+            if endpoint is not None and AnalogInput.cluster_id in endpoint.in_clusters:
+                # supply voltage is in mV
+                divisor = 10.23 if pin != 7 else 1000
+                analog_pins.append(
+                    (pin, endpoint.in_clusters[AnalogInput.cluster_id], divisor)
+                )
+        return tuple(digital_pins), tuple(analog_pins)
+
     client_commands = {}
     server_commands = {
         SAMPLE_DATA_CMD: foundation.ZCLCommandDef(
@@ -555,6 +629,42 @@ class XBeeSerialDataCluster(LocalDataCluster):
     cluster_id = XBEE_DATA_CLUSTER
     ep_attribute = "xbee_serial_data"
 
+    def __init__(self, *args, **kwargs):
+        """Init."""
+        super().__init__(*args, **kwargs)
+        self._stream: Optional[XBeeSerialStream] = None
+
+    async def _request(self, data):
+        """Send serial data, returning the status."""
+        return (
+            await self._endpoint.device.application.request(
+                self._endpoint.device,
+                XBEE_PROFILE_ID,
+                XBEE_DATA_CLUSTER,
+                XBEE_DATA_ENDPOINT,
+                XBEE_DATA_ENDPOINT,
+                self._endpoint.device.application.get_sequence(),
+                data,
+                expect_reply=False,
+            )
+        )[0]
+
+    async def _send_frame(self, data):
+        status = await self._request(data)
+        if status != foundation.Status.SUCCESS:
+            raise RuntimeError(f"Serial data not sent: {status}")
+
+    def open_stream(self, **kwargs):
+        """Open a stream over the serial data, see `XBeeSerialStream`.
+
+        While the stream is open, received data goes to the stream instead of
+        being sent as `receive_data` events.
+        """
+        if self._stream is not None:
+            self._stream.close()
+        self._stream = XBeeSerialStream(self._send_frame, **kwargs)
+        return self._stream
+
     async def command(
         self,
         command_id,
@@ -568,21 +678,7 @@ class XBeeSerialDataCluster(LocalDataCluster):
         data = BinaryString(data).serialize()
         return foundation.GENERAL_COMMANDS[
             foundation.GeneralCommand.Default_Response
-        ].schema(
-            command_id=0x00,
-            status=(
-                await self._endpoint.device.application.request(
-                    self._endpoint.device,
-                    XBEE_PROFILE_ID,
-                    XBEE_DATA_CLUSTER,
-                    XBEE_DATA_ENDPOINT,
-                    XBEE_DATA_ENDPOINT,
-                    self._endpoint.device.application.get_sequence(),
-                    data,
-                    expect_reply=False,
-                )
-            )[0],
-        )
+        ].schema(command_id=0x00, status=await self._request(data))
 
     def handle_cluster_request(
         self,
@@ -593,6 +689,9 @@ class XBeeSerialDataCluster(LocalDataCluster):
     ):
         """Handle incoming data."""
         if hdr.command_id == DATA_IN_CMD:
+            if self._stream is not None and not self._stream.is_closing():
+                self._stream.feed_data(args.data.serialize())
+                return
             self._endpoint.out_clusters[LevelControl.cluster_id].handle_cluster_request(
                 hdr, {"data": args.data}
             )
@@ -627,6 +726,22 @@ class XBeeCommon(CustomDevice):
             .remote_at_command(command, *args, apply_changes=True, **kwargs)
         )
 
+    def remote_at_commands(self, commands):
+        """Remote at commands, sent concurrently."""
+        return (
+            self.endpoints[XBEE_AT_ENDPOINT]
+            .out_clusters[XBEE_AT_REQUEST_CLUSTER]
+            .remote_at_commands(commands, apply_changes=True)
+        )
+
+    def open_serial_stream(self, **kwargs):
+        """Open a stream over the serial data."""
+        return (
+            self.endpoints[XBEE_DATA_ENDPOINT]
+            .in_clusters[XBEE_DATA_CLUSTER]
+            .open_stream(**kwargs)
+        )
+
     def deserialize(self, endpoint_id, cluster_id, data):
         """Deserialize."""
         tsn = self._application.get_sequence()
@@ -0,0 +1,136 @@
+"""Byte stream over the serial data of an XBee."""
+from __future__ import annotations
+
+import asyncio
+import collections
+from typing import Awaitable, Callable
+
+# largest unencrypted serial data payload of a Zigbee XBee without fragmentation
+MAX_PAYLOAD = 84
+SEND_QUEUE_SIZE = 16
+READ_LIMIT = 2**16
+
+
+class XBeeSerialStream:
+    """Read and write the serial data of an XBee like an asyncio stream.
+
+    Writes are split in frames of at most `max_payload` bytes, sent in order
+    by a single task. `drain` waits while more than `queue_size` frames are
+    queued and raises the error of a frame that could not be sent, after
+    which the stream is closed. Received frames are reassembled in a
+    `asyncio.StreamReader`, so they can be read regardless of frame
+    boundaries.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[bytes], Awaitable[None]],
+        max_payload: int = MAX_PAYLOAD,
+        queue_size: int = SEND_QUEUE_SIZE,
+        limit: int = READ_LIMIT,
+    ) -> None:
+        self._send = send
+        self._max_payload = max_payload
+        self._queue_size = queue_size
+        self._reader = asyncio.StreamReader(limit=limit)
+        self._frames: collections.deque[bytes] = collections.deque()
+        self._queued = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._error: Exception | None = None
+        self._closing = False
+
+        self.bytes_sent = 0
+        self.frames_sent = 0
+        self.bytes_received = 0
+        self.frames_received = 0
+
+        self._task = asyncio.get_running_loop().create_task(self._send_frames())
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Bytes and frames sent and received."""
+        return {
+            "bytes_sent": self.bytes_sent,
+            "frames_sent": self.frames_sent,
+            "bytes_received": self.bytes_received,
+            "frames_received": self.frames_received,
+        }
+
+    def is_closing(self) -> bool:
+        """Return whether the stream is closed or being closed."""
+        return self._closing
+
+    def feed_data(self, data: bytes) -> None:
+        """Add a received frame to the stream."""
+        self.bytes_received += len(data)
+        self.frames_received += 1
+        self._reader.feed_data(data)
+
+    async def read(self, n: int = -1) -> bytes:
+        """Read up to n bytes, or until EOF if n is negative."""
+        return await self._reader.read(n)
+
+    async def readexactly(self, n: int) -> bytes:
+        """Read exactly n bytes."""
+        return await self._reader.readexactly(n)
+
+    async def readuntil(self, separator: bytes = b"\n") -> bytes:
+        """Read data up to and including separator."""
+        return await self._reader.readuntil(separator)
+
+    def write(self, data: bytes) -> None:
+        """Queue data to be sent, see `drain`."""
+        if self._error is not None:
+            raise self._error
+        if self._closing:
+            raise RuntimeError("Serial stream is closed")
+
+        for pos in range(0, len(data), self._max_payload):
+            self._frames.append(bytes(data[pos : pos + self._max_payload]))
+        if len(self._frames) > self._queue_size:
+            self._drained.clear()
+        self._queued.set()
+
+    async def drain(self) -> None:
+        """Wait until the send queue is below its size."""
+        await self._drained.wait()
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        """Close the stream once the queued data is sent."""
+        self._closing = True
+        self._queued.set()
+        self._reader.feed_eof()
+
+    async def wait_closed(self) -> None:
+        """Wait until the stream is closed."""
+        await self._task
+        if self._error is not None:
+            raise self._error
+
+    async def _send_frames(self) -> None:
+        while True:
+            if not self._frames:
+                if self._closing:
+                    return
+                self._queued.clear()
+                await self._queued.wait()
+                continue
+
+            frame = self._frames[0]
+            try:
+                await self._send(frame)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._error = exc
+                self._frames.clear()
+                self._drained.set()
+                self.close()
+                return
+
+            self._frames.popleft()
+            self.bytes_sent += len(frame)
+            self.frames_sent += 1
+            if len(self._frames) <= self._queue_size:
+                self._drained.set()
@@ -42,6 +42,25 @@ class IOSample(dict):
     """Parse an XBee IO sample report."""
 
     serialize = None
+    _masks: tuple[int, int, int] | None = None
+
+    DIGITAL_PINS = 15
+    ANALOG_PINS = 8
+
+    def masks(self) -> tuple[int, int, int]:
+        """Return the digital mask, digital states and analog mask as bitmasks."""
+        if self._masks is None:
+            digital_mask = digital_bits = analog_mask = 0
+            for pin, value in enumerate(self.get("digital_samples") or ()):
+                if value is not None:
+                    digital_mask |= 1 << pin
+                    if value:
+                        digital_bits |= 1 << pin
+            for pin, value in enumerate(self.get("analog_samples") or ()):
+                if value is not None:
+                    analog_mask |= 1 << pin
+            self._masks = (digital_mask, digital_bits, analog_mask)
+        return self._masks
 
     @classmethod
     def deserialize(cls, data):
@@ -57,34 +76,23 @@ class IOSample(dict):
         sample_sets = int.from_bytes(data[0:1], byteorder="big")
         if sample_sets != 1:
             raise ValueError("Number of sets is not 1")
-        digital_mask = data[1:3]
-        analog_mask = data[3:4]
-        digital_sample = data[4:6]
-        num_bits = 15
-        digital_pins = [
-            (int.from_bytes(digital_mask, byteorder="big") >> bit) & 1
-            for bit in range(num_bits - 1, -1, -1)
-        ]
-        digital_pins = list(reversed(digital_pins))
-        analog_pins = [
-            (int.from_bytes(analog_mask, byteorder="big") >> bit) & 1
-            for bit in range(8 - 1, -1, -1)
-        ]
-        analog_pins = list(reversed(analog_pins))
-        if 1 in digital_pins:
-            digital_samples: list[int | None] = [
-                (int.from_bytes(digital_sample, byteorder="big") >> bit) & 1
-                for bit in range(num_bits - 1, -1, -1)
-            ]
-            digital_samples = list(reversed(digital_samples))
+        digital_mask = int.from_bytes(data[1:3], byteorder="big") & 0x7FFF
+        analog_mask = int.from_bytes(data[3:4], byteorder="big")
+        if digital_mask:
+            digital_bits = int.from_bytes(data[4:6], byteorder="big") & digital_mask
             sample_index = 6
         else:
             # skip digital samples block
-            digital_samples = digital_pins
+            digital_bits = 0
             sample_index = 4
-        analog_samples = []
-        for apin in analog_pins:
-            if apin == 1:
+
+        digital_samples: list[int | None] = [
+            (digital_bits >> pin) & 1 if (digital_mask >> pin) & 1 else None
+            for pin in range(cls.DIGITAL_PINS)
+        ]
+        analog_samples: list[int | None] = []
+        for pin in range(cls.ANALOG_PINS):
+            if (analog_mask >> pin) & 1:
                 analog_samples.append(
                     int.from_bytes(
                         data[sample_index : sample_index + 2], byteorder="big"
@@ -93,14 +101,10 @@ class IOSample(dict):
                 sample_index += 2
             else:
                 analog_samples.append(None)
-        for dpin in range(len(digital_pins)):
-            if digital_pins[dpin] == 0:
-                digital_samples[dpin] = None
-
-        return (
-            {
-                "digital_samples": digital_samples,
-                "analog_samples": analog_samples,
-            },
-            data[sample_index:],
+
+        sample = cls(
+            digital_samples=digital_samples,
+            analog_samples=analog_samples,
         )
+        sample._masks = (digital_mask, digital_bits, analog_mask)
+        return sample, data[sample_index:]
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import math
+from types import MappingProxyType
 from typing import Any, Iterable, Iterator
 
 from zigpy import types as t
@@ -36,6 +37,7 @@ from zhaquirks import (
     MotionOnEvent,
     OccupancyWithReset,
     QuickInitDevice,
+    ReportFilterMixin,
 )
 from zhaquirks.const import (
     ATTRIBUTE_ID,
@@ -116,6 +118,114 @@ ZONE_TYPE = 0x0001
 _LOGGER = logging.getLogger(__name__)
 
 
+def _aqara_attribute_names(
+    models: Iterable[str], names: dict[int, str]
+) -> dict[str, MappingProxyType[int, str]]:
+    """Build the frozen 0xFF01 attribute name table for a group of models."""
+    table = MappingProxyType({**AQARA_ATTRIBUTE_NAMES_DEFAULT, **names})
+    return {model: table for model in models}
+
+
+# Keys of the TLV encoded 0xFF01 attribute reported by all models
+AQARA_ATTRIBUTE_NAMES_DEFAULT = MappingProxyType(
+    {
+        1: BATTERY_VOLTAGE_MV,
+        3: TEMPERATURE,
+        4: XIAOMI_ATTR_4,
+        5: XIAOMI_ATTR_5,
+        6: XIAOMI_ATTR_6,
+        10: PATH,
+    }
+)
+
+# Model specific keys of the 0xFF01 attribute
+AQARA_ATTRIBUTE_NAMES = {
+    # Temperature sensors send temperature/humidity/pressure updates through this
+    # cluster instead of the respective clusters
+    **_aqara_attribute_names(
+        (
+            "lumi.sensor_ht",
+            "lumi.sens",
+            "lumi.weather",
+            "lumi.sensor_ht.agl02",
+        ),
+        {
+            100: TEMPERATURE_MEASUREMENT,
+            101: HUMIDITY_MEASUREMENT,
+            102: PRESSURE_MEASUREMENT,
+        },
+    ),
+    **_aqara_attribute_names(
+        ("lumi.airmonitor.acn01",),
+        {
+            100: TEMPERATURE_MEASUREMENT,
+            101: HUMIDITY_MEASUREMENT,
+            102: TVOC_MEASUREMENT,
+        },
+    ),
+    **_aqara_attribute_names(
+        (
+            "lumi.plug",
+            "lumi.plug.maus01",
+            "lumi.plug.maeu01",
+            "lumi.plug.mmeu01",
+            "lumi.relay.c2acn01",
+        ),
+        {149: CONSUMPTION, 150: VOLTAGE, 152: POWER},
+    ),
+    **_aqara_attribute_names(
+        ("lumi.sensor_motion.aq2",), {11: ILLUMINANCE_MEASUREMENT}
+    ),
+    **_aqara_attribute_names(
+        ("lumi.curtain.acn002",), {101: BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE}
+    ),
+    **_aqara_attribute_names(("lumi.motion.agl02",), {101: ILLUMINANCE_MEASUREMENT}),
+    **_aqara_attribute_names(
+        ("lumi.motion.ac02",),
+        {
+            101: ILLUMINANCE_MEASUREMENT,
+            105: DETECTION_INTERVAL,
+            106: MOTION_SENSITIVITY,
+        },
+    ),
+    **_aqara_attribute_names(
+        ("lumi.motion.agl04",),
+        {
+            102: DETECTION_INTERVAL,
+            105: MOTION_SENSITIVITY,
+            258: DETECTION_INTERVAL,
+            268: MOTION_SENSITIVITY,
+        },
+    ),
+    **_aqara_attribute_names(
+        ("lumi.motion.ac01",),
+        {
+            5: POWER_OUTAGE_COUNT,
+            101: PRESENCE_DETECTED,
+            102: PRESENCE_EVENT,
+            103: MONITORING_MODE,
+            105: APPROACH_DISTANCE,
+            268: MOTION_SENSITIVITY,
+            322: PRESENCE_DETECTED,
+            323: PRESENCE_EVENT,
+            324: MONITORING_MODE,
+            326: APPROACH_DISTANCE,
+        },
+    ),
+    **_aqara_attribute_names(
+        ("lumi.sensor_smoke.acn03",),
+        {
+            160: SMOKE,
+            161: SMOKE_DENSITY,
+            162: SELF_TEST,
+            163: BUZZER_MANUAL_MUTE,
+            164: HEARTBEAT_INDICATOR,
+            165: LINKAGE_ALARM,
+        },
+    ),
+}
+
+
 class XiaomiCustomDevice(CustomDevice):
     """Custom device representing xiaomi devices."""
 
@@ -135,13 +245,16 @@ class XiaomiCluster(CustomCluster):
     """Xiaomi cluster implementation."""
 
     def _iter_parse_attr_report(
-        self, data: bytes
-    ) -> Iterator[tuple[foundation.Attribute, bytes]]:
-        """Yield all interpretations of the first attribute in an Xiaomi report."""
+        self, data: bytes, pos: int = 0
+    ) -> Iterator[tuple[foundation.Attribute, int]]:
+        """Yield all interpretations of the attribute in a Xiaomi report at `pos`.
+
+        Each interpretation comes with the position of the next attribute.
+        """
 
         # Peek at the attribute report
-        attr_id, data = t.uint16_t.deserialize(data)
-        attr_type, data = t.uint8_t.deserialize(data)
+        attr_id, rest = t.uint16_t.deserialize(data[pos:])
+        attr_type, rest = t.uint8_t.deserialize(rest)
 
         if (
             attr_id
@@ -153,74 +266,153 @@ class XiaomiCluster(CustomCluster):
             or attr_type != 0x42  # "Character String"
         ):
             # Assume other attributes are reported correctly
-            data = attr_id.serialize() + attr_type.serialize() + data
-            attribute, data = foundation.Attribute.deserialize(data)
+            attribute, rest = foundation.Attribute.deserialize(data[pos:])
 
-            yield attribute, data
+            yield attribute, len(data) - len(rest)
             return
 
         # Length of the "string" can be wrong
-        val_len, data = t.uint8_t.deserialize(data)
+        val_len, rest = t.uint8_t.deserialize(rest)
+        val_pos = len(data) - len(rest)
 
         # Try every offset. Start with 0 to pass unbroken reports through.
         for offset in (0, -1, 1):
             fixed_len = val_len + offset
 
-            if len(data) < fixed_len:
+            if fixed_len < 0 or len(rest) < fixed_len:
                 continue
 
-            val, final_data = data[:fixed_len], data[fixed_len:]
-            attr_val = t.LVBytes(val)
+            attr_val = t.LVBytes(data[val_pos : val_pos + fixed_len])
             attr_type = 0x41  # The data type should be "Octet String"
 
             yield foundation.Attribute(
                 attrid=attr_id,
                 value=foundation.TypeValue(type=attr_type, value=attr_val),
-            ), final_data
-
-    def _interpret_attr_reports(
-        self, data: bytes
-    ) -> Iterable[tuple[foundation.Attribute]]:
-        """Yield all valid interprations of a Xiaomi attribute report."""
+            ), val_pos + fixed_len
 
-        if not data:
-            yield ()
-            return
+    def _attr_report_candidates(
+        self,
+        data: bytes,
+        pos: int,
+        memo: dict[int, list[tuple[foundation.Attribute, int]]],
+    ) -> list[tuple[foundation.Attribute, int]]:
+        """Return the interpretations of the attribute at `pos`, parsed once."""
+        try:
+            return memo[pos]
+        except KeyError:
+            pass
 
         try:
-            parsed = list(self._iter_parse_attr_report(data))
+            candidates = list(self._iter_parse_attr_report(data, pos))
         except (KeyError, ValueError):
-            return
+            candidates = []
+
+        memo[pos] = candidates
+        return candidates
+
+    def _interpret_attr_reports(
+        self,
+        data: bytes,
+        memo: dict[int, list[tuple[foundation.Attribute, int]]] | None = None,
+    ) -> list[foundation.Attribute] | None:
+        """Return the first valid interpretation of a Xiaomi attribute report.
+
+        Interpretations are explored depth first in offset order, remembering
+        the positions from which the report cannot be parsed to its end.
+        """
+        if memo is None:
+            memo = {}
+
+        end = len(data)
+        dead = set()
+        attrs = []
+        stack = [(0, iter(self._attr_report_candidates(data, 0, memo)))]
+
+        while stack:
+            pos, candidates = stack[-1]
+
+            if pos == end:
+                return attrs
+
+            for attr, next_pos in candidates:
+                if next_pos not in dead:
+                    attrs.append(attr)
+                    stack.append(
+                        (
+                            next_pos,
+                            iter(self._attr_report_candidates(data, next_pos, memo)),
+                        )
+                    )
+                    break
+            else:
+                dead.add(pos)
+                stack.pop()
+                if attrs:
+                    attrs.pop()
+
+        return None
+
+    def _count_attr_report_interpretations(
+        self,
+        data: bytes,
+        memo: dict[int, list[tuple[foundation.Attribute, int]]],
+    ) -> int:
+        """Count the valid interpretations of a Xiaomi attribute report."""
+        end = len(data)
+        reachable = {0}
+        todo = [0]
+
+        while todo:
+            pos = todo.pop()
+            if pos == end:
+                continue
+            for _attr, next_pos in self._attr_report_candidates(data, pos, memo):
+                if next_pos not in reachable:
+                    reachable.add(next_pos)
+                    todo.append(next_pos)
+
+        # Every attribute consumes data, so positions resolve back to front
+        counts = {end: 1}
+        for pos in sorted(reachable - {end}, reverse=True):
+            counts[pos] = sum(
+                counts.get(next_pos, 0)
+                for _attr, next_pos in self._attr_report_candidates(data, pos, memo)
+            )
 
-        for attr, remaining_data in parsed:
-            for remaining_attrs in self._interpret_attr_reports(remaining_data):
-                yield (attr,) + remaining_attrs
+        return counts[0]
 
     def deserialize(self, data):
         """Deserialize cluster data."""
-        hdr, data = foundation.ZCLHeader.deserialize(data)
+        hdr, payload = foundation.ZCLHeader.deserialize(data)
 
         # Only handle attribute reports differently
         if (
             hdr.frame_control.frame_type != foundation.FrameType.GLOBAL_COMMAND
             or hdr.command_id != foundation.GeneralCommand.Report_Attributes
         ):
-            return super().deserialize(hdr.serialize() + data)
-
-        reports = list(self._interpret_attr_reports(data))
-
-        if not reports:
-            _LOGGER.warning("Failed to parse Xiaomi attribute report: %r", data)
-            return super().deserialize(hdr.serialize() + data)
-        elif len(reports) > 1:
-            _LOGGER.warning(
-                "Xiaomi attribute report has multiple valid interpretations: %r",
-                reports,
-            )
-
-        fixed_data = b"".join(attr.serialize() for attr in reports[0])
+            return super().deserialize(data)
+
+        memo = {}
+        attrs = self._interpret_attr_reports(payload, memo)
+
+        if attrs is None:
+            _LOGGER.warning("Failed to parse Xiaomi attribute report: %r", payload)
+            return super().deserialize(data)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            count = self._count_attr_report_interpretations(payload, memo)
+            if count > 1:
+                _LOGGER.debug(
+                    "Xiaomi attribute report has %d valid interpretations,"
+                    " using the first: %r",
+                    count,
+                    attrs,
+                )
 
-        return super().deserialize(hdr.serialize() + fixed_data)
+        hdr_data = data[: len(data) - len(payload)]
+        return super().deserialize(
+            hdr_data + b"".join(attr.serialize() for attr in attrs)
+        )
 
     def _update_attribute(self, attrid, value):
         if attrid in (XIAOMI_AQARA_ATTRIBUTE, XIAOMI_AQARA_ATTRIBUTE_E1):
@@ -312,88 +504,20 @@ class XiaomiCluster(CustomCluster):
 
     def _parse_aqara_attributes(self, value):
         """Parse non standard attributes."""
+        attribute_names = AQARA_ATTRIBUTE_NAMES.get(
+            self.endpoint.device.model, AQARA_ATTRIBUTE_NAMES_DEFAULT
+        )
         attributes = {}
-        attribute_names = {
-            1: BATTERY_VOLTAGE_MV,
-            3: TEMPERATURE,
-            4: XIAOMI_ATTR_4,
-            5: XIAOMI_ATTR_5,
-            6: XIAOMI_ATTR_6,
-            10: PATH,
-        }
-
-        if self.endpoint.device.model in [
-            "lumi.sensor_ht",
-            "lumi.sens",
-            "lumi.weather",
-            "lumi.airmonitor.acn01",
-            "lumi.sensor_ht.agl02",
-        ]:
-            # Temperature sensors send temperature/humidity/pressure updates through this
-            # cluster instead of the respective clusters
-            attribute_names.update(
-                {
-                    100: TEMPERATURE_MEASUREMENT,
-                    101: HUMIDITY_MEASUREMENT,
-                    102: TVOC_MEASUREMENT
-                    if self.endpoint.device.model == "lumi.airmonitor.acn01"
-                    else PRESSURE_MEASUREMENT,
-                }
-            )
-        elif self.endpoint.device.model in [
-            "lumi.plug",
-            "lumi.plug.maus01",
-            "lumi.plug.maeu01",
-            "lumi.plug.mmeu01",
-            "lumi.relay.c2acn01",
-        ]:
-            attribute_names.update({149: CONSUMPTION, 150: VOLTAGE, 152: POWER})
-        elif self.endpoint.device.model == "lumi.sensor_motion.aq2":
-            attribute_names.update({11: ILLUMINANCE_MEASUREMENT})
-        elif self.endpoint.device.model == "lumi.curtain.acn002":
-            attribute_names.update({101: BATTERY_PERCENTAGE_REMAINING_ATTRIBUTE})
-        elif self.endpoint.device.model in ["lumi.motion.agl02", "lumi.motion.ac02"]:
-            attribute_names.update({101: ILLUMINANCE_MEASUREMENT})
-            if self.endpoint.device.model == "lumi.motion.ac02":
-                attribute_names.update({105: DETECTION_INTERVAL})
-                attribute_names.update({106: MOTION_SENSITIVITY})
-        elif self.endpoint.device.model == "lumi.motion.agl04":
-            attribute_names.update({102: DETECTION_INTERVAL})
-            attribute_names.update({105: MOTION_SENSITIVITY})
-            attribute_names.update({258: DETECTION_INTERVAL})
-            attribute_names.update({268: MOTION_SENSITIVITY})
-        elif self.endpoint.device.model == "lumi.motion.ac01":
-            attribute_names.update({5: POWER_OUTAGE_COUNT})
-            attribute_names.update({101: PRESENCE_DETECTED})
-            attribute_names.update({102: PRESENCE_EVENT})
-            attribute_names.update({103: MONITORING_MODE})
-            attribute_names.update({105: APPROACH_DISTANCE})
-            attribute_names.update({268: MOTION_SENSITIVITY})
-            attribute_names.update({322: PRESENCE_DETECTED})
-            attribute_names.update({323: PRESENCE_EVENT})
-            attribute_names.update({324: MONITORING_MODE})
-            attribute_names.update({326: APPROACH_DISTANCE})
-        elif self.endpoint.device.model == "lumi.sensor_smoke.acn03":
-            attribute_names.update({160: SMOKE})
-            attribute_names.update({161: SMOKE_DENSITY})
-            attribute_names.update({162: SELF_TEST})
-            attribute_names.update({163: BUZZER_MANUAL_MUTE})
-            attribute_names.update({164: HEARTBEAT_INDICATOR})
-            attribute_names.update({165: LINKAGE_ALARM})
-        result = {}
 
         # Some attribute reports end with a stray null byte
         while value not in (b"", b"\x00"):
-            skey = int(value[0])
+            skey = value[0]
             svalue, value = foundation.TypeValue.deserialize(value[1:])
-            result[skey] = svalue.value
-        for item, val in result.items():
-            key = (
-                attribute_names[item]
-                if item in attribute_names
-                else "0xff01-" + str(item)
-            )
-            attributes[key] = val
+            try:
+                key = attribute_names[skey]
+            except KeyError:
+                key = f"0xff01-{skey}"
+            attributes[key] = svalue.value
 
         return attributes
 
@@ -577,13 +701,16 @@ class AnalogInputCluster(CustomCluster, AnalogInput):
             self.endpoint.device.power_bus.listener_event(POWER_REPORTED, value)
 
 
-class ElectricalMeasurementCluster(LocalDataCluster, ElectricalMeasurement):
+class ElectricalMeasurementCluster(
+    ReportFilterMixin, LocalDataCluster, ElectricalMeasurement
+):
     """Electrical measurement cluster to receive reports that are sent to the basic cluster."""
 
     cluster_id = ElectricalMeasurement.cluster_id
     POWER_ID = 0x050B
     VOLTAGE_ID = 0x0505
     CONSUMPTION_ID = 0x0304
+    report_deadbands = {POWER_ID: 0, VOLTAGE_ID: 0, CONSUMPTION_ID: 0}
     _CONSTANT_ATTRIBUTES = {
         0x0402: 1,  # power_multiplier
         0x0403: 1,  # power_divisor